@@ -0,0 +1,77 @@
+"""
+Kodlama ön ayarlarının (default, fast, balanced, small) süresini ve çıktı boyutunu 1-40 arası versiyonlar için ölçer.
+Her versiyon bir kez oluşturulur, ardından her format ve ön ayar için yalnızca kodlama süresi ölçülür.
+
+Kullanım:
+    python3 benchmarks/bench_encoding.py [-mv 1] [-xv 40] [-f png webp jpg] [-p fast small] [-i logo.png] [-v]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.asset_helper import load_shared_assets  # noqa: E402
+from helpers.filesystem_helper import ENCODE_PRESETS, encode_qr_image  # noqa: E402
+from helpers.qr_helper import create_render_options, render_whatsapp_qr  # noqa: E402
+
+DATA = "https://chat.whatsapp.com/KJ3xYqfT8pL2mN9vR4sW1z"
+TITLE = "YTÜ Bilgisayar Mühendisliği Duyuru Grubu"
+
+def measure(image, output_format: str, preset: str, repeat: int) -> tuple:
+    """
+    Bir görüntünün verilen format ve ön ayarla kodlanma süresini ve boyutunu ölçer.
+
+    Args:
+        image: Kodlanacak görüntü.
+        output_format (str): Çıktı formatı.
+        preset (str): Kodlama ön ayarı.
+        repeat (int): Tekrar sayısı (en hızlısı raporlanır).
+
+    Returns:
+        tuple: En kısa süre (ms) ve kodlanmış boyut (bayt).
+    """
+    best = float("inf")
+    size = 0
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        size = len(encode_qr_image(image, output_format, preset))
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, size
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Kodlama ön ayarları kıyaslaması")
+    parser.add_argument("-mv", "--min_version", type=int, default=1)
+    parser.add_argument("-xv", "--max_version", type=int, default=40)
+    parser.add_argument("-r", "--resolution", type=int, default=1080)
+    parser.add_argument("-f", "--formats", nargs="+", default=["png", "webp", "jpg"])
+    parser.add_argument("-p", "--presets", nargs="+", default=list(ENCODE_PRESETS), choices=list(ENCODE_PRESETS))
+    parser.add_argument("-i", "--images", nargs="+", default=None, help="Başlığın üstüne eklenecek logolar")
+    parser.add_argument("-n", "--repeat", type=int, default=1)
+    parser.add_argument("-v", "--verbose", action="store_true", help="Her versiyonun sonucunu ayrı yazdır")
+    args = parser.parse_args()
+
+    assets = load_shared_assets(args.images)
+    render_options = create_render_options(resolution=args.resolution)
+    images = {version: render_whatsapp_qr(DATA, version, TITLE, assets, **render_options)
+              for version in range(args.min_version, args.max_version + 1)}
+
+    print(f"{'format':<8}{'ön ayar':<10}{'süre (ms)':>12}{'boyut (KB)':>14}{'oran':>8}")
+    for output_format in args.formats:
+        baseline = None
+        for preset in args.presets:
+            total_time, total_size = 0.0, 0
+            for version, image in images.items():
+                elapsed, size = measure(image, output_format, preset, args.repeat)
+                total_time += elapsed
+                total_size += size
+                if args.verbose:
+                    print(f"{'':<8}{'':<10}v{version:<3}{elapsed:>8.1f}{size / 1024:>14.1f}")
+            baseline = baseline or total_size
+            print(f"{output_format:<8}{preset:<10}{total_time:>12.1f}{total_size / 1024:>14.1f}"
+                  f"{total_size / baseline:>8.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""
+create_whatsapp_qr akışının aşamalarını (load_logos, wrap_text, generate_qr_image, resize_compact_image,
+add_logo_to_qr, draw_title, render_whatsapp_qr, save_qr_image ve uçtan uca create_whatsapp_qr) versiyon,
+çözünürlük, logo türü (yok, PNG, SVG), merkez logo ve başlık uzunluğu matrisi üzerinde ölçer.
+
+Her durum ayrı bir yorumlayıcıda çalıştırılır; böylece en yüksek bellek kullanımı (peak RSS) yalnızca o duruma
+aittir ve önbellekler durumlar arasında taşınmaz. Her aşama için ilk çağrının süresi (soğuk) ve sonraki
+tekrarların en kısası (sıcak) JSON olarak yazılır. -cmp ile önceki bir sonuç dosyası verilirse aşama süreleri
+kıyaslanır ve eşiği aşan bir gerileme varsa çıkış kodu 1 olur. -o verilmezse sonuçlar git tarafından yok
+sayılan benchmarks/results/bench_pipeline.json dosyasına yazılır.
+
+Kullanım:
+    python3 benchmarks/bench_pipeline.py [-v 1 10 25 40] [-r 540 1080 4000] [-l none png svg] [-c off on]
+                                         [-t kısa uzun] [-n 3] [-o sonuc.json] [-cmp önceki.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_OUTPUT = os.path.join(ROOT, "benchmarks", "results", "bench_pipeline.json")
+
+DATA = "https://chat.whatsapp.com/KJ3xYqfT8pL2mN9vR4sW1z"
+TITLES = {
+    "kısa": "WhatsApp QR Kodu",
+    "uzun": "YTÜ Bilgisayar Mühendisliği Ders Notları, Sınav Arşivi ve Proje Örnekleri İçin Topluluk Grubu "
+            "- katılmak için karekodu okutun ve kurallarımızı okumayı unutmayın",
+}
+
+SVG_LOGO = """<svg xmlns="http://www.w3.org/2000/svg" width="256" height="256" viewBox="0 0 256 256">
+<rect x="16" y="16" width="224" height="224" rx="48" fill="#25d366"/>
+<circle cx="128" cy="128" r="72" fill="#ffffff"/><circle cx="128" cy="128" r="44" fill="#128c7e"/>
+</svg>
+"""
+
+def get_peak_rss_mb() -> Optional[float]:
+    """
+    Sürecin şimdiye kadarki en yüksek bellek kullanımını döndürür.
+
+    Returns:
+        Optional[float]: En yüksek RSS (MB); platform desteklemiyorsa None.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt cinsindendir
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def create_logo_files(directory: str) -> Dict[str, str]:
+    """
+    Kıyaslamada kullanılacak PNG ve SVG logoları oluşturur.
+
+    Args:
+        directory (str): Logoların yazılacağı dizin.
+
+    Returns:
+        Dict[str, str]: Logo türü ("png", "svg") ve dosya yolu.
+    """
+    from PIL import Image, ImageDraw
+
+    png_file = os.path.join(directory, "logo.png")
+    logo = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(logo)
+    draw.rounded_rectangle((16, 16, 240, 240), 48, fill=(37, 211, 102, 255))
+    draw.ellipse((56, 56, 200, 200), fill=(255, 255, 255, 255))
+    draw.ellipse((84, 84, 172, 172), fill=(18, 140, 126, 255))
+    logo.save(png_file)
+
+    svg_file = os.path.join(directory, "logo.svg")
+    with open(svg_file, "w", encoding="utf-8") as f:
+        f.write(SVG_LOGO)
+    return {"png": png_file, "svg": svg_file}
+
+def measure_stage(timings: dict, name: str, function: Callable, repeat: int, setup: Callable = None):
+    """
+    Bir aşamayı repeat kez çalıştırır; ilk çağrının süresini soğuk, sonrakilerin en kısasını sıcak süre olarak kaydeder.
+
+    Args:
+        timings (dict): Sürelerin yazılacağı sözlük.
+        name (str): Aşamanın adı.
+        function (Callable): Ölçülecek fonksiyon; setup verilirse onun sonucunu argüman olarak alır.
+        repeat (int): Tekrar sayısı.
+        setup (Callable, optional): Her çağrıdan önce süreye katılmadan çalıştırılan hazırlık fonksiyonu.
+
+    Returns:
+        Son çağrının sonucu.
+    """
+    durations = []
+    result = None
+    for _ in range(max(1, repeat)):
+        arguments = (setup(),) if setup else ()
+        start = time.perf_counter()
+        result = function(*arguments)
+        durations.append((time.perf_counter() - start) * 1000)
+    timings[name] = {"cold_ms": round(durations[0], 3),
+                     "warm_ms": round(min(durations[1:]), 3) if len(durations) > 1 else None}
+    return result
+
+def run_case(case: dict, repeat: int) -> dict:
+    """
+    Tek bir durumun tüm aşamalarını pipeline'daki sırayla ölçer. Her aşama bir önceki aşamanın çıktısını kullanır.
+
+    Args:
+        case (dict): version, resolution, logos, center_logo, title ve logo_files anahtarlarını içeren durum.
+        repeat (int): Her aşamanın tekrar sayısı.
+
+    Returns:
+        dict: Durum, aşama süreleri ve bellek kullanımı.
+    """
+    import_start = time.perf_counter()
+    from helpers.asset_helper import load_shared_assets
+    from helpers.canvas_helper import resize_compact_image
+    from helpers.filesystem_helper import save_qr_image
+    from helpers.image_helper import load_logos, add_logo_to_qr, create_empty_background, draw_title, trim_logo, process_logo
+    from helpers.math_helper import calculate_dimensions
+    from helpers.qr_helper import create_whatsapp_qr, generate_qr_image, prepare_title_text, render_whatsapp_qr
+    from helpers.text_helper import load_font, wrap_text
+    import_ms = (time.perf_counter() - import_start) * 1000
+    import_rss_mb = get_peak_rss_mb()
+
+    version, resolution, title = case["version"], case["resolution"], TITLES[case["title"]]
+    logo_file = case["logo_files"].get(case["logos"])
+    image_files = [logo_file] if logo_file else []
+    center_logo = (logo_file or case["logo_files"]["png"]) if case["center_logo"] else None
+    timings = {}
+
+    measure_stage(timings, "load_logos", lambda: load_logos(image_files, 50), repeat)
+
+    font = load_font(36, 1.0)
+    margin, max_title_height, spacing, logo_max_size = calculate_dimensions(1.0, resolution)
+    measure_stage(timings, "wrap_text",
+                  lambda: wrap_text(title, font, resolution - 2 * margin, max_title_height, 1.0), repeat)
+
+    qr_image = measure_stage(timings, "generate_qr_image",
+                             lambda: generate_qr_image(DATA, version, compact=True), repeat)
+    qr_image = measure_stage(timings, "resize_compact_image",
+                             lambda: resize_compact_image(qr_image, resolution), repeat)
+
+    if center_logo:
+        logo = trim_logo(process_logo(center_logo))
+        measure_stage(timings, "add_logo_to_qr", lambda image: add_logo_to_qr(image, logo, 0.2), repeat,
+                      setup=lambda: qr_image.convert("RGB"))
+
+    layout = prepare_title_text(title, qr_image.width - 2 * margin, max_title_height, 1.0, font)
+    measure_stage(timings, "draw_title", lambda band: draw_title(band, layout, logo_max_size, spacing), repeat,
+                  setup=lambda: create_empty_background("white", qr_image.width, 0, layout.height, spacing,
+                                                        logo_max_size))
+
+    assets = measure_stage(timings, "load_shared_assets",
+                           lambda: load_shared_assets(image_files, center_logo=center_logo), repeat)
+    image = measure_stage(timings, "render_whatsapp_qr",
+                          lambda: render_whatsapp_qr(DATA, version, title, assets, resolution=resolution), repeat)
+
+    with tempfile.TemporaryDirectory() as output_dir, contextlib.redirect_stdout(io.StringIO()):
+        output_file = os.path.join(output_dir, "karekod.png")
+        measure_stage(timings, "save_qr_image",
+                      lambda: save_qr_image(image, output_file, version, "png", output_dir), repeat)
+        measure_stage(timings, "create_whatsapp_qr",
+                      lambda: create_whatsapp_qr(DATA, output_file, title, resolution=resolution,
+                                                 image_files=image_files, min_version=version, max_version=version,
+                                                 center_logo=center_logo), repeat)
+
+    result = {key: value for key, value in case.items() if key != "logo_files"}
+    result.update(import_ms=round(import_ms, 3), import_rss_mb=import_rss_mb, peak_rss_mb=get_peak_rss_mb(),
+                  stages=timings)
+    return result
+
+def run_case_process(case: dict, repeat: int) -> dict:
+    """
+    Bir durumu yeni bir yorumlayıcıda çalıştırır ve sonucunu okur.
+
+    Args:
+        case (dict): Ölçülecek durum.
+        repeat (int): Her aşamanın tekrar sayısı.
+
+    Returns:
+        dict: run_case sonucu.
+    """
+    completed = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", json.dumps(case),
+                                "-n", str(repeat)], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def get_case_key(result: dict) -> tuple:
+    """
+    Bir sonucu farklı çalıştırmalar arasında eşleştirmek için kullanılan anahtarı döndürür.
+
+    Args:
+        result (dict): Durum sonucu.
+
+    Returns:
+        tuple: (versiyon, çözünürlük, logo türü, merkez logo, başlık)
+    """
+    return result["version"], result["resolution"], result["logos"], result["center_logo"], result["title"]
+
+def compare_results(previous: List[dict], current: List[dict], threshold: float) -> int:
+    """
+    Aşamaların sıcak (yoksa soğuk) sürelerini önceki sonuçlarla kıyaslar ve eşiği aşan gerilemeleri yazdırır.
+
+    Args:
+        previous (List[dict]): Önceki çalıştırmanın sonuçları.
+        current (List[dict]): Bu çalıştırmanın sonuçları.
+        threshold (float): Gerileme sayılacak en küçük oran artışı (0.2 = %20).
+
+    Returns:
+        int: Gerileme sayısı.
+    """
+    previous_by_key = {get_case_key(result): result for result in previous}
+    regressions = 0
+    for result in current:
+        old = previous_by_key.get(get_case_key(result))
+        if old is None:
+            continue
+        for stage, timing in result["stages"].items():
+            old_timing = old["stages"].get(stage)
+            if old_timing is None:
+                continue
+            new_ms = timing["warm_ms"] or timing["cold_ms"]
+            old_ms = old_timing["warm_ms"] or old_timing["cold_ms"]
+            if old_ms and new_ms / old_ms > 1 + threshold:
+                regressions += 1
+                print(f"GERİLEME {get_case_key(result)} {stage}: {old_ms:.2f} ms -> {new_ms:.2f} ms "
+                      f"({new_ms / old_ms:.2f}x)")
+    return regressions
+
+def get_git_commit() -> Optional[str]:
+    """
+    Ölçülen ağacın git commit özetini döndürür.
+
+    Returns:
+        Optional[str]: Commit özeti; git deposu değilse None.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Uçtan uca oluşturma akışı kıyaslaması")
+    parser.add_argument("-v", "--versions", type=int, nargs="+", default=[1, 10, 25, 40])
+    parser.add_argument("-r", "--resolutions", type=int, nargs="+", default=[540, 1080, 4000])
+    parser.add_argument("-l", "--logos", nargs="+", default=["none", "png", "svg"], choices=["none", "png", "svg"])
+    parser.add_argument("-c", "--center_logo", nargs="+", default=["off", "on"], choices=["off", "on"])
+    parser.add_argument("-t", "--titles", nargs="+", default=list(TITLES), choices=list(TITLES))
+    parser.add_argument("-n", "--repeat", type=int, default=3, help="Her aşamanın tekrar sayısı")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("-cmp", "--compare", default=None, help="Kıyaslanacak önceki sonuç dosyası")
+    parser.add_argument("-th", "--threshold", type=float, default=0.2, help="Gerileme eşiği (0.2 = %%20)")
+    parser.add_argument("--case", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(json.loads(args.case), args.repeat), ensure_ascii=False))
+        return 0
+
+    results = []
+    with tempfile.TemporaryDirectory() as logo_dir:
+        logo_files = create_logo_files(logo_dir)
+        print(f"{'versiyon':>8}{'çözünürlük':>12}{'logo':>6}{'merkez':>8}{'başlık':>8}"
+              f"{'oluşturma (ms)':>16}{'toplam (ms)':>13}{'peak RSS (MB)':>15}")
+        for version in args.versions:
+            for resolution in args.resolutions:
+                for logos in args.logos:
+                    for center_logo in args.center_logo:
+                        for title in args.titles:
+                            case = {"version": version, "resolution": resolution, "logos": logos,
+                                    "center_logo": center_logo == "on", "title": title, "logo_files": logo_files}
+                            try:
+                                result = run_case_process(case, args.repeat)
+                            except subprocess.CalledProcessError as e:
+                                error = e.stderr.strip().splitlines()[-1] if e.stderr.strip() else e
+                                print(f"Hata: {version}/{resolution}/{logos}/{center_logo}/{title}: {error}")
+                                continue
+                            results.append(result)
+                            render = result["stages"]["render_whatsapp_qr"]
+                            total = result["stages"]["create_whatsapp_qr"]
+                            print(f"{version:>8}{resolution:>12}{logos:>6}{center_logo:>8}{title:>8}"
+                                  f"{render['warm_ms'] or render['cold_ms']:>16.1f}{total['cold_ms']:>13.1f}"
+                                  f"{result['peak_rss_mb'] or 0:>15.1f}")
+
+    report = {"commit": get_git_commit(), "python": platform.python_version(), "platform": platform.platform(),
+              "repeat": args.repeat, "results": results}
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Sonuçlar {args.output} dosyasına yazıldı.")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare_results(json.load(f)["results"], results, args.threshold)
+        print(f"{regressions} gerileme bulundu.")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
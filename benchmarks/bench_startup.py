@@ -0,0 +1,86 @@
+"""
+Komut satırı başlangıcında içe aktarılan modüllerin sürelerini (python -X importtime) raporlar ve bütçeyi denetler.
+Bir senaryo süre bütçesini aşarsa ya da yüklememesi gereken bir modülü (cairosvg, emoji vb.) yüklerse
+çıkış kodu 1 olur; böylece başlangıç süresindeki gerilemeler yakalanır.
+
+Kullanım:
+    python3 benchmarks/bench_startup.py [-n 5] [-top 15] [-bs 1.0]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (ad, çalıştırılacak kod, bütçe (ms), yüklenmemesi gereken modüller)
+SCENARIOS = (
+    ("cli", "import main", 60,
+     ("PIL", "numpy", "qrcode", "cairosvg", "emoji", "webcolors")),
+    ("render", "import main; from helpers.qr_helper import create_whatsapp_qr", 300,
+     ("cairosvg", "emoji", "webcolors", "multiprocessing")),
+)
+
+def run_importtime(code: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Kodu yeni bir yorumlayıcıda -X importtime ile çalıştırır.
+
+    Args:
+        code (str): Çalıştırılacak Python kodu.
+
+    Returns:
+        List[Tuple[str, int, int, int]]: Her modül için ad, iç içelik düzeyi, kendi süresi ve toplam süresi (µs).
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), depth, int(self_time), int(cumulative)))
+    return modules
+
+def summarize(modules: List[Tuple[str, int, int, int]]) -> Tuple[int, Dict[str, int]]:
+    """
+    Toplam içe aktarma süresini ve doğrudan içe aktarılan modüllerin toplam sürelerini hesaplar.
+
+    Args:
+        modules (List[Tuple[str, int, int, int]]): run_importtime sonucu.
+
+    Returns:
+        Tuple[int, Dict[str, int]]: Toplam süre (µs) ve en üst düzey modüllerin toplam süreleri.
+    """
+    top_level = {name: cumulative for name, depth, _, cumulative in modules if depth == 0}
+    return sum(top_level.values()), top_level
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Başlangıç (içe aktarma) süresi kıyaslaması")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Her senaryonun tekrar sayısı (en hızlısı raporlanır)")
+    parser.add_argument("-top", "--top", type=int, default=15, help="Raporlanacak en yavaş modül sayısı")
+    parser.add_argument("-bs", "--budget_scale", type=float, default=1.0, help="Bütçe çarpanı (yavaş makineler için)")
+    args = parser.parse_args()
+
+    failed = False
+    for name, code, budget_ms, forbidden in SCENARIOS:
+        runs = [run_importtime(code) for _ in range(max(1, args.repeat))]
+        modules = min(runs, key=lambda run: summarize(run)[0])
+        total, _ = summarize(modules)
+        budget = budget_ms * args.budget_scale
+        loaded = {module_name for module_name, _, _, _ in modules}
+        unexpected = sorted(module for module in forbidden if module in loaded)
+
+        status = "TAMAM" if total / 1000 <= budget and not unexpected else "BÜTÇE AŞILDI"
+        print(f"\n[{name}] {code}\ntoplam {total / 1000:.1f} ms / bütçe {budget:.0f} ms - {status}")
+        if unexpected:
+            print(f"yüklenmemesi gereken modüller: {', '.join(unexpected)}")
+        print(f"{'modül':<40}{'kendi (ms)':>12}{'toplam (ms)':>14}")
+        for module_name, _, self_time, cumulative in sorted(modules, key=lambda module: -module[3])[:args.top]:
+            print(f"{module_name:<40}{self_time / 1000:>12.1f}{cumulative / 1000:>14.1f}")
+        failed = failed or status != "TAMAM"
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+Başlık sığdırma (wrap_text) süresini kısa, uzun ve emojili başlıklar için ölçer.
+
+Kullanım:
+    python3 benchmarks/bench_text_fitting.py [-n 200] [-ts 1.0 2.5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from helpers.text_helper import load_font, wrap_text, clear_font_cache  # noqa: E402
+from helpers.math_helper import calculate_dimensions  # noqa: E402
+
+TITLES = {
+    "kısa": "WhatsApp QR Kodu",
+    "uzun": "YTÜ Bilgisayar Mühendisliği Ders Notları, Sınav Arşivi ve Proje Örnekleri İçin Topluluk Grubu "
+            "- katılmak için karekodu okutun ve kurallarımızı okumayı unutmayın",
+    "emoji": ":rocket: Yeni dönem duyuruları :tada: ve etkinlikler :calendar: için gruba katılın :point_down:",
+}
+
+def measure(title: str, scale_factor: float, resolution: int, iterations: int, cold: bool) -> float:
+    """
+    Bir başlığın sığdırılmasının ortalama süresini milisaniye cinsinden döndürür.
+
+    Args:
+        title (str): Sığdırılacak başlık.
+        scale_factor (float): Metin ölçek faktörü.
+        resolution (int): Tuval genişliği.
+        iterations (int): Tekrar sayısı.
+        cold (bool): True ise her tekrardan önce font önbelleği temizlenir.
+
+    Returns:
+        float: Ortalama süre (ms).
+    """
+    margin, max_title_height, _, _ = calculate_dimensions(scale_factor, resolution)
+    total = 0.0
+    for _ in range(iterations):
+        if cold:
+            clear_font_cache()
+        start = time.perf_counter()
+        wrap_text(title, load_font(36, scale_factor), resolution - 2 * margin, max_title_height, scale_factor)
+        total += time.perf_counter() - start
+    return total / iterations * 1000
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Başlık sığdırma kıyaslaması")
+    parser.add_argument("-n", "--iterations", type=int, default=200)
+    parser.add_argument("-r", "--resolution", type=int, default=1080)
+    parser.add_argument("-ts", "--text_scale_factors", type=float, nargs="+", default=[1.0, 2.5])
+    args = parser.parse_args()
+
+    print(f"{'başlık':<8}{'ölçek':>8}{'soğuk (ms)':>14}{'sıcak (ms)':>14}")
+    for name, title in TITLES.items():
+        for scale_factor in args.text_scale_factors:
+            cold = measure(title, scale_factor, args.resolution, args.iterations, cold=True)
+            warm = measure(title, scale_factor, args.resolution, args.iterations, cold=False)
+            print(f"{name:<8}{scale_factor:>8.2f}{cold:>14.3f}{warm:>14.3f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,59 @@
-from .filesystem_helper import *
-from .image_helper import *
-from .qr_helper import *
-from .text_helper import *
-from .math_helper import *
-from .string_helper import *
-from . import range_helper
-from . import argument_helper
-from . import color_helper
\ No newline at end of file
+import importlib
+
+# Paket düzeyindeki adlar ilk kullanımda yüklenir; "import helpers" ağır bağımlılıkları (numpy, qrcode, Pillow)
+# içe aktarmaz. Bir ad istendiğinde önce _LAZY_NAMES'e, sonra bu sırayla yardımcı modüllere bakılır.
+_HELPER_MODULES = ("filesystem_helper", "image_helper", "qr_helper", "text_helper", "math_helper", "string_helper",
+                   "asset_helper", "batch_helper", "vector_helper", "encoder_helper")
+
+# Alt modül olarak erişilebilen yardımcılar (helpers.argument_helper gibi)
+_SUBMODULES = _HELPER_MODULES + ("range_helper", "argument_helper", "color_helper", "cache_helper",
+                                 "parallel_helper", "render_helper", "archive_helper", "canvas_helper",
+                                 "profile_helper", "progress_helper", "shm_helper", "async_helper", "error_helper")
+
+# Sık kullanılan adlar ve tanımlandıkları modüller; bunlar için yalnızca ilgili modül yüklenir
+_LAZY_NAMES = {
+    "create_whatsapp_qr": "qr_helper",
+    "generate_whatsapp_qr": "qr_helper",
+    "render_whatsapp_qr": "qr_helper",
+    "render_whatsapp_qr_versions": "qr_helper",
+    "RenderedVersion": "qr_helper",
+    "create_whatsapp_qr_batch": "batch_helper",
+    "print_batch_report": "batch_helper",
+    "BatchRowResult": "batch_helper",
+    "SharedAssets": "asset_helper",
+    "load_shared_assets": "asset_helper",
+    "VectorImage": "vector_helper",
+    "ArchiveWriter": "archive_helper",
+    "profiling": "profile_helper",
+    "span": "profile_helper",
+    "ProgressReporter": "progress_helper",
+    "AsyncRenderer": "async_helper",
+    "TitleLayout": "text_helper",
+}
+
+def __getattr__(name: str):
+    """
+    Paket düzeyindeki bir adı tanımlandığı modülü yükleyerek döndürür ve sonraki erişimler için saklar.
+
+    Args:
+        name (str): İstenen ad.
+
+    Returns:
+        Any: Alt modül ya da alt modüldeki nesne.
+
+    Raises:
+        AttributeError: Ad hiçbir yardımcı modülde yoksa.
+    """
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_names = (_LAZY_NAMES[name],) if name in _LAZY_NAMES else _HELPER_MODULES
+    for module_name in module_names:
+        module = importlib.import_module(f".{module_name}", __name__)
+        if hasattr(module, name):
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
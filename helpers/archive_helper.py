@@ -0,0 +1,226 @@
+import hashlib
+import io
+import json
+import os
+import queue
+import tarfile
+import threading
+import time
+import zipfile
+from typing import List, Optional
+from .error_helper import ArchiveError
+from .string_helper import create_versioned_filename
+from .profile_helper import span
+
+# Arşiv uzantıları ve tarfile/zipfile açılış kipleri
+ARCHIVE_FORMATS = {".zip": "zip", ".tar": "tar", ".tar.gz": "tar.gz", ".tgz": "tar.gz"}
+
+# Arşivin sonuna eklenen dizin dosyasının adı
+MANIFEST_NAME = "manifest.jsonl"
+
+def get_archive_format(archive_file: str) -> Optional[str]:
+    """
+    Arşiv dosyasının formatını uzantısına göre belirler.
+
+    Args:
+        archive_file (str): Arşiv dosyasının yolu.
+
+    Returns:
+        Optional[str]: "zip", "tar" veya "tar.gz"; uzantı tanınmazsa None.
+    """
+    lower_name = archive_file.lower()
+    for extension, archive_format in ARCHIVE_FORMATS.items():
+        if lower_name.endswith(extension):
+            return archive_format
+    return None
+
+def is_archive_file(output_file: str) -> bool:
+    """
+    Çıktı dosyasının bir arşiv (zip, tar, tar.gz) olup olmadığını kontrol eder.
+
+    Args:
+        output_file (str): Çıktı dosyasının yolu.
+
+    Returns:
+        bool: Uzantı tanınan bir arşiv uzantısıysa True.
+    """
+    return get_archive_format(output_file) is not None
+
+def data_hash(data: str) -> str:
+    """
+    QR kod verisinin dizinde kullanılan özetini hesaplar.
+
+    Args:
+        data (str): QR kodunda kodlanan veri.
+
+    Returns:
+        str: Verinin SHA-256 özeti (onaltılık).
+    """
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+class ArchiveWriter:
+    """
+    Oluşturulan görüntüleri tamamlandıkça tek bir ZIP veya TAR arşivine yazan çıktı hedefi. Yazma ayrı bir
+    iş parçacığında, gönderim sırasıyla yapılır; kuyruk dolduğunda add beklediği için bellekte yalnızca
+    yazılmayı bekleyen en fazla queue_size görüntü tutulur. Arşivin sonuna her dosya için veri özeti,
+    versiyon, dosya adı, bayt konumu ve boyutu içeren manifest.jsonl eklenir.
+    """
+    def __init__(self, archive_file: str, queue_size: int = 16, verbose: bool = True):
+        self.archive_format = get_archive_format(archive_file)
+        if self.archive_format is None:
+            raise ArchiveError(f"Bilinmeyen arşiv formatı: {archive_file} (zip, tar veya tar.gz olmalı)")
+        archive_dir = os.path.dirname(archive_file)
+        if archive_dir:
+            os.makedirs(archive_dir, exist_ok=True)
+
+        self.archive_file = archive_file
+        self.verbose = verbose
+        if self.archive_format == "zip":
+            self.archive = zipfile.ZipFile(archive_file, "w")
+        else:
+            self.archive = tarfile.open(archive_file, "w:gz" if self.archive_format == "tar.gz" else "w")
+        self.entries = []
+        self.error = None
+        self.closed = False
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        self.thread = threading.Thread(target=self._write_loop, name="archive-writer", daemon=True)
+        self.thread.start()
+
+    def add(self, output_file: str, version: int, aliases: List[int], content: bytes, output_format: str,
+            data: str) -> List[str]:
+        """
+        Bir versiyonun kodlanmış görüntüsünü yazılmak üzere sıraya koyar. Aynı QR kodu üreten versiyonlar
+        tekrar yazılmaz: TAR'da sabit bağlantı olarak eklenir, ZIP'te yalnızca manifestte aynı konumu gösterir.
+
+        Args:
+            output_file (str): Temel çıktı adı; arşivdeki adlar diskteki dizin düzeniyle aynıdır (karekod/karekod_v1.png).
+            version (int): QR kod versiyonu.
+            aliases (List[int]): Aynı QR kodu üreten versiyonlar.
+            content (bytes): Kodlanmış görüntü.
+            output_format (str): Çıktı formatı.
+            data (str): QR kodunda kodlanan veri (manifestte özeti tutulur).
+
+        Returns:
+            List[str]: Arşivde oluşturulacak dosyaların adları.
+
+        Raises:
+            ValueError: Yazıcı kapatılmışsa veya önceki bir yazma başarısız olduysa.
+        """
+        if self.closed:
+            raise ArchiveError("Arşiv kapatıldıktan sonra dosya eklenemez.")
+        if self.error is not None:
+            raise ArchiveError(f"Arşiv yazılamadı: {self.error}")
+        output_format = output_format.lower()
+        base_dir = os.path.splitext(os.path.basename(output_file))[0]
+        name = create_versioned_filename(output_file, version, output_format, base_dir).replace(os.sep, "/")
+        alias_names = [create_versioned_filename(output_file, alias, output_format, base_dir).replace(os.sep, "/")
+                       for alias in aliases]
+        self.queue.put((name, version, content, output_format, data_hash(data), list(zip(aliases, alias_names))))
+        return [name] + alias_names
+
+    def _write_loop(self) -> None:
+        """
+        Kuyruktaki görüntüleri sırayla arşive yazar. Bir hata oluşursa kaydedilir ve kuyruk boşaltılmaya
+        devam edilir, böylece add içinde bekleyen çağıran kilitlenmez.
+
+        Returns:
+            None
+        """
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            if self.error is not None:
+                continue
+            try:
+                self._write_entry(*item)
+            except Exception as e:
+                self.error = str(e)
+
+    def _write_entry(self, name: str, version: int, content: bytes, output_format: str, hash_hex: str,
+                     aliases: List[tuple]) -> None:
+        """
+        Tek bir görüntüyü ve bağlantılarını arşive yazar, manifest kayıtlarını ekler.
+
+        Args:
+            name (str): Arşivdeki dosya adı.
+            version (int): QR kod versiyonu.
+            content (bytes): Kodlanmış görüntü.
+            output_format (str): Çıktı formatı.
+            hash_hex (str): QR kod verisinin özeti.
+            aliases (List[tuple]): (versiyon, dosya adı) çiftleri.
+
+        Returns:
+            None
+        """
+        with span("archive_write", version=version):
+            offset = self._write_member(name, content)
+        entry = {"data_hash": hash_hex, "version": version, "filename": name, "offset": offset, "size": len(content)}
+        self.entries.append(entry)
+        for alias, alias_name in aliases:
+            if self.archive_format != "zip":
+                link = tarfile.TarInfo(alias_name)
+                link.type = tarfile.LNKTYPE
+                link.linkname = name
+                link.mtime = int(time.time())
+                self.archive.addfile(link)
+            self.entries.append(dict(entry, version=alias, filename=alias_name, alias_of=name))
+
+    def _write_member(self, name: str, content: bytes) -> int:
+        """
+        Bir dosyayı arşive ekler ve içeriğinin arşivdeki bayt konumunu döndürür. ZIP üyeleri sıkıştırılmadan
+        (stored) yazılır, böylece manifestteki konum ve boyut doğrudan içeriğin baytlarını gösterir.
+        tar.gz için konum sıkıştırılmamış TAR akışı içindedir.
+
+        Args:
+            name (str): Arşivdeki dosya adı.
+            content (bytes): Dosya içeriği.
+
+        Returns:
+            int: İçeriğin başladığı bayt konumu.
+        """
+        if self.archive_format == "zip":
+            info = zipfile.ZipInfo(name, time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            self.archive.writestr(info, content)
+            # Yerel dosya başlığı 30 bayt + dosya adı + ek alan
+            return info.header_offset + 30 + len(info.filename.encode("utf-8")) + len(info.extra)
+
+        info = tarfile.TarInfo(name)
+        info.size = len(content)
+        info.mtime = int(time.time())
+        self.archive.addfile(info, io.BytesIO(content))
+        # addfile sonrasında konum, 512 baytlık bloklara tamamlanmış içeriğin sonundadır
+        return self.archive.offset - (len(content) + tarfile.BLOCKSIZE - 1) // tarfile.BLOCKSIZE * tarfile.BLOCKSIZE
+
+    def close(self) -> None:
+        """
+        Kuyruktaki tüm görüntülerin yazılmasını bekler, manifesti ekler ve arşivi kapatır.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: Yazma sırasında bir hata oluştuysa.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join()
+        try:
+            if self.error is None:
+                manifest = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in self.entries)
+                self._write_member(MANIFEST_NAME, manifest.encode("utf-8"))
+        finally:
+            self.archive.close()
+        if self.error is not None:
+            raise ArchiveError(f"Arşiv yazılamadı: {self.error}")
+        if self.verbose:
+            print(f"{len(self.entries)} dosya {self.archive_file} arşivine yazıldı.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -34,7 +34,8 @@ def add_appearance_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("-t", "--title", help="QR kodun üstüne eklenecek başlık", default="WhatsApp QR Kodu")
     parser.add_argument("-tc", "--title_color", type=str, help="Başlık rengi", default="black")
     parser.add_argument("-r", "--resolution", type=int, help="QR kodun çözünürlüğü (piksel cinsinden genişlik)", default=1080)
-    parser.add_argument("-f", "--format", help="Çıktı dosyası formatı (png, jpg, bmp, vb.)", default="png")
+    parser.add_argument("-nr", "--native_resolution", action="store_true", help="QR kodu yeniden boyutlandırmadan, tam sayı modül boyutuyla doğrudan hedef çözünürlükte çiz (daha hızlı ve daha keskin)", default=False)
+    parser.add_argument("-f", "--format", help="Çıktı dosyası formatı (png, jpg, bmp, vb.; svg ve pdf vektörel çıktı üretir)", default="png")
     parser.add_argument(
         "-fgc", "--foreground_color", 
         type=str, 
@@ -75,6 +76,7 @@ def add_qr_version_arguments(parser: argparse.ArgumentParser) -> None:
     """
     parser.add_argument("-mv", "--min_version", type=int, help="Minimum QR kod versiyonu (1-40 arası)", default=1, choices=range(1, 41))
     parser.add_argument("-xv", "--max_version", type=int, help="Maksimum QR kod versiyonu (1-40 arası)", default=20, choices=range(1, 41))
+    parser.add_argument("-rv", "--redundant_versions", choices=["link", "skip"], help="Veri sığmadığı için aynı QR kodu üreten versiyonlar oluşturulmaz; link: oluşturulan dosyaya bağla, skip: hiç kaydetme", default="link")
 
 def add_center_logo_arguments(parser: argparse.ArgumentParser) -> None:
     """
@@ -92,6 +94,61 @@ def add_center_logo_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("-bs", "--border_size", type=float, help="Merkez logonun kenarlık boyutu (en fazla 0.15 önerilir)", default=0.0)
     parser.add_argument("-bc", "--border_color", help="Merkez logonun kenarlık rengi", default="white")
 
+def add_performance_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Performans ile ilgili argümanları ekler.
+
+    Args:
+        parser (argparse.ArgumentParser): Mevcut argüman ayrıştırıcı
+
+    Returns:
+        None
+    """
+    parser.add_argument("-w", "--workers", type=int, help="Versiyonların (ve toplu modda satırların) paralel oluşturulacağı süreç sayısı", default=1)
+    parser.add_argument("-ac", "--asset_cache", help="SVG'den dönüştürülmüş ve kırpılmış logoların saklanacağı kalıcı önbellek dizini (örn: ~/.cache/karekod)", default=None)
+    parser.add_argument("-acs", "--asset_cache_size", type=int, help="Kalıcı logo önbelleğinin en fazla boyutu (MB)", default=256)
+    parser.add_argument("-rc", "--render_cache", help="Kodlanmış görüntülerin tüm parametrelerin özetiyle saklanacağı oluşturma önbelleği dizini; aynı parametrelerle tekrar istenen görüntüler oluşturulmadan bu dizinden bağlanır", default=None)
+    parser.add_argument("-rcs", "--render_cache_size", type=int, help="Oluşturma önbelleğinin en fazla boyutu (MB)", default=512)
+    parser.add_argument("-rca", "--render_cache_age", type=float, help="Oluşturma önbelleğindeki görüntülerin en fazla yaşı (saat); 0 ise sınırsız", default=0)
+    parser.add_argument("-ep", "--encode_preset", choices=["default", "fast", "balanced", "small"], help="Görüntü kodlama ön ayarı; default: Pillow varsayılanları, fast: düşük sıkıştırma, balanced: kayıpsız palet (PNG), small: en yüksek sıkıştırma ve gerekirse 256 renge indirgeme", default="default")
+
+def add_archive_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Arşiv çıktısı ile ilgili argümanları ekler.
+
+    Args:
+        parser (argparse.ArgumentParser): Mevcut argüman ayrıştırıcı
+
+    Returns:
+        None
+    """
+    parser.add_argument("-a", "--archive", help="Görüntüleri ayrı dosyalar yerine tamamlandıkça tek bir arşive yaz (.zip, .tar, .tar.gz); arşivde manifest.jsonl dizini bulunur", default=None)
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Profil çıktısı ile ilgili argümanları ekler.
+
+    Args:
+        parser (argparse.ArgumentParser): Mevcut argüman ayrıştırıcı
+
+    Returns:
+        None
+    """
+    parser.add_argument("-pf", "--profile", help="Aşama sürelerini (span) bu dosyaya yaz; .jsonl uzantısında JSON Lines, diğerlerinde Chrome trace (chrome://tracing, Perfetto) biçimi", default=None)
+
+def add_progress_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    İlerleme ve olay çıktısı ile ilgili argümanları ekler.
+
+    Args:
+        parser (argparse.ArgumentParser): Mevcut argüman ayrıştırıcı
+
+    Returns:
+        None
+    """
+    parser.add_argument("-ev", "--events", help="Görüntü, hata ve özet (işlem hızı, tahmini kalan süre) olaylarını bu dosyaya JSON Lines olarak yaz; \"-\" standart çıktıya yazar ve dosya başına mesajları kapatır", default=None)
+    parser.add_argument("-q", "--quiet", action="store_true", help="Kaydedilen her dosya için mesaj yazdırma")
+
 def create_argument_parser() -> argparse.ArgumentParser:
     """
     Tüm argümanları içeren tam bir argüman ayrıştırıcı oluşturur.
@@ -104,6 +161,50 @@ def create_argument_parser() -> argparse.ArgumentParser:
     add_image_arguments(parser)
     add_qr_version_arguments(parser)
     add_center_logo_arguments(parser)
+    add_performance_arguments(parser)
+    add_archive_arguments(parser)
+    add_profile_arguments(parser)
+    add_progress_arguments(parser)
+    return parser
+
+def create_batch_argument_parser() -> argparse.ArgumentParser:
+    """
+    Toplu mod (batch alt komutu) için argüman ayrıştırıcı oluşturur. Tekli moddaki tüm görünüm,
+    resim, versiyon ve merkez logo argümanları manifest satırları için varsayılan değer olarak kullanılır.
+
+    Returns:
+        argparse.ArgumentParser: Toplu mod argümanlarını içeren ayrıştırıcı
+    """
+    parser = argparse.ArgumentParser(prog="main.py batch", description="Manifest dosyasından toplu WhatsApp tarzı QR kod oluşturucu",
+                                     formatter_class=AlphabeticalOrderHelpFormatter)
+    parser.add_argument("manifest", help="CSV (başlık satırlı) veya JSONL manifest dosyası. Satırlar data, title, foreground_color, background_color, title_color ve output alanlarını içerebilir")
+    parser.add_argument("-o", "--output", help="Satırda output verilmezse kullanılacak temel çıktı adı (örn: qrcode.png -> qrcode_1.png)", default="karekod.png")
+    add_appearance_arguments(parser)
+    add_image_arguments(parser)
+    add_qr_version_arguments(parser)
+    add_center_logo_arguments(parser)
+    add_performance_arguments(parser)
+    add_archive_arguments(parser)
+    add_profile_arguments(parser)
+    add_progress_arguments(parser)
+    return parser
+
+def create_server_argument_parser() -> argparse.ArgumentParser:
+    """
+    Sunucu modu (serve alt komutu) için argüman ayrıştırıcı oluşturur.
+
+    Returns:
+        argparse.ArgumentParser: Sunucu argümanlarını içeren ayrıştırıcı
+    """
+    parser = argparse.ArgumentParser(prog="main.py serve", description="WhatsApp tarzı QR kod oluşturma sunucusu (HTTP veya Unix soketi)",
+                                     formatter_class=AlphabeticalOrderHelpFormatter)
+    parser.add_argument("-H", "--host", help="Dinlenecek adres", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, help="Dinlenecek port", default=8080)
+    parser.add_argument("-us", "--unix_socket", help="Verilirse TCP yerine bu yoldaki Unix soketi dinlenir", default=None)
+    parser.add_argument("-q", "--queue_size", type=int, help="İşçiler meşgulken bekletilecek en fazla istek sayısı; fazlası 503 ile reddedilir", default=16)
+    parser.add_argument("-ar", "--asset_root", help="İsteklerde images ve center_logo ile verilen logoların bulunabileceği dizin; yollar bu dizine göre çözümlenir ve dışına çıkamaz. Verilmezse istekte logo yolu kabul edilmez", default=None)
+    parser.add_argument("-rt", "--request_timeout", type=float, help="Bir isteğin en fazla bekleme süresi (saniye)", default=60.0)
+    add_performance_arguments(parser)
     return parser
 
 def is_version_valid(min_version: float, max_version: float) -> bool:
@@ -131,6 +232,18 @@ def is_border_size_valid(border_size: int) -> bool:
     """
     return border_size >= 0
 
+def is_workers_valid(workers: int) -> bool:
+    """
+    İşçi süreç sayısının geçerliliğini kontrol eder.
+
+    Args:
+        workers (int): İşçi süreç sayısı
+
+    Returns:
+        bool: İşçi sayısı geçerliyse True, değilse False
+    """
+    return workers >= 1
+
 def is_arguments_valid(args: argparse.Namespace, parser: argparse.ArgumentParser) -> bool:
     """
     Argümanların geçerliliğini kontrol eder.
@@ -149,5 +262,61 @@ def is_arguments_valid(args: argparse.Namespace, parser: argparse.ArgumentParser
     if not is_border_size_valid(args.border_size):
         parser.error("Kenarlık boyutu negatif olamaz.")
         return False
+
+    if not is_workers_valid(args.workers):
+        parser.error("İşçi sayısı en az 1 olmalıdır.")
+        return False
+
+    if args.asset_cache_size <= 0:
+        parser.error("Önbellek boyutu pozitif olmalıdır.")
+        return False
+
+    if args.render_cache_size <= 0:
+        parser.error("Oluşturma önbelleğinin boyutu pozitif olmalıdır.")
+        return False
+
+    if args.render_cache_age < 0:
+        parser.error("Oluşturma önbelleğinin yaşı negatif olamaz.")
+        return False
+
+    if args.archive is not None:
+        # Arşiv modülü (tarfile, zipfile) yalnızca arşiv istendiğinde yüklenir
+        from .archive_helper import is_archive_file
+        if not is_archive_file(args.archive):
+            parser.error("Arşiv dosyası .zip, .tar, .tar.gz veya .tgz uzantılı olmalıdır.")
+            return False
     
     return True
+
+def is_server_arguments_valid(args: argparse.Namespace, parser: argparse.ArgumentParser) -> bool:
+    """
+    Sunucu modu argümanlarının geçerliliğini kontrol eder.
+
+    Args:
+        args (argparse.Namespace): Ayrıştırılmış argümanlar
+        parser (argparse.ArgumentParser): Argüman ayrıştırıcı
+
+    Returns:
+        bool: Argümanlar geçerliyse True, değilse False
+    """
+    if not is_workers_valid(args.workers):
+        parser.error("İşçi sayısı en az 1 olmalıdır.")
+        return False
+
+    if args.queue_size < 0:
+        parser.error("Kuyruk boyutu negatif olamaz.")
+        return False
+
+    if args.asset_cache_size <= 0:
+        parser.error("Önbellek boyutu pozitif olmalıdır.")
+        return False
+
+    if args.render_cache_size <= 0:
+        parser.error("Oluşturma önbelleğinin boyutu pozitif olmalıdır.")
+        return False
+
+    if args.render_cache_age < 0:
+        parser.error("Oluşturma önbelleğinin yaşı negatif olamaz.")
+        return False
+
+    return True
@@ -0,0 +1,198 @@
+import io
+import mimetypes
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, List, Optional, Tuple
+from PIL import Image, ImageFont
+from .image_helper import load_logo, load_font, process_logo, trim_logo, create_center_logo_overlay
+from .cache_helper import LRUCache, DiskCache, file_content_hash
+from .profile_helper import span
+
+# İçerik özetiyle anahtarlanan hazırlanmış varlıklar. Aynı logo farklı yollardan
+# veya binlerce farklı işte kullanılsa da yalnızca bir kez çözülür ve boyutlandırılır.
+_asset_cache = LRUCache(128)
+
+# Disk önbelleğindeki kayıt biçiminin sürümü; biçim değişirse eski girdiler kendiliğinden geçersiz olur
+ASSET_CACHE_FORMAT = "asset-v1"
+
+@dataclass
+class SharedAssets:
+    """
+    Bir çalıştırma boyunca değişmeyen ve tüm versiyonlar (ve toplu moddaki tüm satırlar) arasında paylaşılan,
+    hazırlanmış varlıklar. İçindeki görüntüler önbellekle paylaşıldığı için yerinde değiştirilmemelidir.
+
+    Attributes:
+        logos (List[Image.Image]): Yüklenmiş ve boyutlandırılmış başlık logoları.
+        center_logo (Optional[Image.Image]): Açılmış ve kırpılmış merkez logo (yoksa None).
+        center_logo_hash (Optional[str]): Merkez logo dosyasının içerik özeti.
+        font (Optional[ImageFont.ImageFont]): Başlık için başlangıç fontu.
+        disk_cache (Optional[DiskCache]): Hazırlanmış görüntülerin saklanacağı kalıcı önbellek (yoksa None).
+        logo_sources (List[Optional[Tuple[str, bytes]]]): Vektörel çıktı için başlık logolarının MIME türü ve
+            özgün dosya içeriği. Yalnızca vektörel çıktıda doldurulur; türü bilinmeyen logolar için None.
+        logo_hashes (List[str]): Başlık logosu dosyalarının içerik özetleri (oluşturma önbelleği anahtarı için).
+    """
+    logos: List[Image.Image] = field(default_factory=list)
+    center_logo: Optional[Image.Image] = None
+    center_logo_hash: Optional[str] = None
+    font: Optional[ImageFont.ImageFont] = None
+    disk_cache: Optional[DiskCache] = None
+    logo_sources: List[Optional[Tuple[str, bytes]]] = field(default_factory=list)
+    logo_hashes: List[str] = field(default_factory=list)
+
+def load_shared_assets(image_files: list = None, logo_scale_factor: float = 1.0, center_logo: str = None,
+                       text_scale_factor: float = 1.0, asset_cache: str = None,
+                       asset_cache_size: int = 256, include_sources: bool = False) -> SharedAssets:
+    """
+    Logoları, merkez logoyu ve başlık fontunu bir kez hazırlar.
+
+    Args:
+        image_files (list): Başlık logolarının dosya yolları.
+        logo_scale_factor (float): Logo boyutu için ölçek faktörü.
+        center_logo (str): Merkeze yerleştirilecek logo dosyasının yolu.
+        text_scale_factor (float): Metin boyutu için ölçek faktörü.
+        asset_cache (str, optional): Hazırlanmış görüntülerin saklanacağı kalıcı önbellek dizini.
+        asset_cache_size (int): Kalıcı önbelleğin en fazla boyutu (MB).
+        include_sources (bool): True ise başlık logolarının özgün dosya içerikleri de (vektörel çıktıya gömülmek üzere) okunur.
+
+    Returns:
+        SharedAssets: Hazırlanmış paylaşılan varlıklar.
+    """
+    disk_cache = DiskCache(asset_cache, asset_cache_size * 1024 * 1024) if asset_cache else None
+    logo_max_size = int(50 * logo_scale_factor)
+    logos = [load_cached_logo(image_file, logo_max_size, disk_cache) for image_file in image_files or []]
+    center_logo_img, center_logo_hash = None, None
+    if center_logo:
+        center_logo_hash = file_content_hash(center_logo)
+        center_logo_img = get_cached_image(("center_logo", center_logo_hash),
+                                           lambda: trim_logo(process_logo(center_logo)), disk_cache)
+    font = load_font(36, text_scale_factor)
+    logo_sources = [read_logo_source(image_file) for image_file in image_files or []] if include_sources else []
+    logo_hashes = [file_content_hash(image_file) for image_file in image_files or []]
+    return SharedAssets(logos, center_logo_img, center_logo_hash, font, disk_cache, logo_sources, logo_hashes)
+
+def read_logo_source(image_file: str) -> Optional[Tuple[str, bytes]]:
+    """
+    Logo dosyasının MIME türünü ve özgün içeriğini okur. SVG logolar böylece vektörel çıktıya
+    rasterleştirilmeden gömülebilir.
+
+    Args:
+        image_file (str): Logo dosyasının yolu.
+
+    Returns:
+        Optional[Tuple[str, bytes]]: MIME türü ve dosya içeriği; tür bir görüntü türü değilse None.
+    """
+    mime_type, _ = mimetypes.guess_type(image_file)
+    if mime_type is None or not mime_type.startswith("image/"):
+        return None
+    with open(image_file, "rb") as f:
+        return mime_type, f.read()
+
+def image_to_cache_bytes(image: Image.Image) -> bytes:
+    """
+    Görüntüyü disk önbelleği için baytlara dönüştürür. Paletsiz görüntüler sıkıştırılmadan, ham piksel
+    olarak saklanır; böylece okunurken çözme maliyeti olmaz. Paletli görüntüler PNG olarak saklanır.
+
+    Args:
+        image (Image.Image): Saklanacak görüntü.
+
+    Returns:
+        bytes: Başlık satırı ve görüntü verisi.
+    """
+    if image.mode == "P":
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", compress_level=1)
+        return b"PNG\n" + buffer.getvalue()
+    return f"RAW {image.mode} {image.width} {image.height}\n".encode("ascii") + image.tobytes()
+
+def image_from_cache_bytes(data: bytes) -> Image.Image:
+    """
+    image_to_cache_bytes ile saklanmış görüntüyü geri yükler.
+
+    Args:
+        data (bytes): Disk önbelleğinden okunan veri.
+
+    Returns:
+        Image.Image: Yüklenmiş görüntü.
+    """
+    header, _, payload = data.partition(b"\n")
+    if header == b"PNG":
+        image = Image.open(io.BytesIO(payload))
+        image.load()
+        return image
+    _, mode, width, height = header.decode("ascii").split(" ")
+    return Image.frombytes(mode, (int(width), int(height)), payload)
+
+def get_cached_image(key: Hashable, factory: Callable[[], Image.Image], disk_cache: DiskCache = None) -> Image.Image:
+    """
+    Hazırlanmış bir görüntüyü önce bellek içi, sonra (varsa) disk önbelleğinden döndürür.
+    İkisinde de yoksa factory ile üretir ve iki önbelleğe de yazar.
+
+    Args:
+        key (Hashable): İçerik özetini ve hazırlama parametrelerini içeren anahtar.
+        factory (Callable[[], Image.Image]): Görüntüyü üreten fonksiyon.
+        disk_cache (DiskCache, optional): Kalıcı önbellek.
+
+    Returns:
+        Image.Image: Hazırlanmış görüntü.
+    """
+    def load() -> Image.Image:
+        if disk_cache is not None:
+            data = disk_cache.get((ASSET_CACHE_FORMAT,) + key)
+            if data is not None:
+                return image_from_cache_bytes(data)
+        with span("prepare_asset", asset=key[0]):
+            image = factory()
+        if disk_cache is not None:
+            disk_cache.set((ASSET_CACHE_FORMAT,) + key, image_to_cache_bytes(image))
+        return image
+
+    return _asset_cache.get_or_create(key, load)
+
+def load_cached_logo(image_file: str, logo_max_size: int, disk_cache: DiskCache = None) -> Image.Image:
+    """
+    Başlık logosunu içerik özetine göre önbellekten döndürür; yoksa yükleyip boyutlandırır.
+
+    Args:
+        image_file (str): Logo dosyasının yolu.
+        logo_max_size (int): Logonun maksimum boyutu (piksel cinsinden).
+        disk_cache (DiskCache, optional): Kalıcı önbellek.
+
+    Returns:
+        Image.Image: Yüklenmiş ve boyutlandırılmış logo görüntüsü.
+    """
+    key = ("logo", file_content_hash(image_file), logo_max_size)
+    return get_cached_image(key, lambda: load_logo(image_file, logo_max_size), disk_cache)
+
+def get_center_logo_overlay(assets: SharedAssets, qr_size: int, logo_size: float, is_circle: bool = True,
+                            border_size: float = 0.0, border_color: str = "white") -> Image.Image:
+    """
+    Merkez logonun QR koda yapıştırılmaya hazır halini döndürür. Aynı çözünürlük ve logo ayarları için
+    küçültme, kenarlık ve daire maskesi yalnızca bir kez yapılır.
+
+    Args:
+        assets (SharedAssets): Merkez logoyu içeren hazırlanmış varlıklar.
+        qr_size (int): QR kod görüntüsünün kısa kenarı (piksel cinsinden).
+        logo_size (float): Logo boyutu (0-1 arasında bir oran).
+        is_circle (bool): Logo daire mi olsun, kare mi.
+        border_size (float): Logo etrafındaki kenarlık boyutu.
+        border_color (str): Logo etrafındaki kenarlık rengi.
+
+    Returns:
+        Image.Image: Yapıştırılmaya hazır RGBA merkez logo.
+    """
+    def build() -> Image.Image:
+        return create_center_logo_overlay(assets.center_logo, qr_size, logo_size, is_circle, border_size, border_color)
+
+    if assets.center_logo_hash is None:
+        # İçerik özeti bilinmeyen (elle verilmiş) logolar önbelleğe alınmaz
+        return build()
+    key = ("center_logo_overlay", assets.center_logo_hash, qr_size, logo_size, is_circle, border_size, border_color)
+    return get_cached_image(key, build, assets.disk_cache)
+
+def clear_asset_cache() -> None:
+    """
+    Bellek içi varlık önbelleğini temizler.
+
+    Returns:
+        None
+    """
+    _asset_cache.clear()
@@ -0,0 +1,136 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Union
+from .server_helper import VERSION_PARAM, parse_render_request, render_request
+
+class AsyncRenderer:
+    """
+    asyncio tabanlı uygulamalar için oluşturma arayüzü. Parametrelerin ayrıştırılması dışındaki tüm işler
+    (logo ve font dosyalarının okunması, QR kodun çizilmesi, kodlama) bir iş parçacığı veya süreç havuzunda
+    çalışır; olay döngüsü engellenmez. Aynı anda çalışan iş sayısı max_concurrency ile sınırlıdır.
+
+    Parametreler sunucu modundaki gibi komut satırı argümanlarının uzun adlarıyla verilir (title, resolution,
+    images, center_logo vb.) ve aynı denetimlerden geçer; önbellek dizinleri (asset_cache, render_cache) gibi
+    ayarlar yalnızca defaults ile verilebilir. Parametrelerdeki logo yolları (images, center_logo) asset_root'a
+    göre çözümlenir ve bu dizinin dışına çıkamaz; asset_root verilmezse logolar yalnızca defaults ile verilebilir. executor "thread", "process" veya hazır bir havuz
+    olabilir; hazır havuz close ile kapatılmaz. max_concurrency verilmezse workers kadar iş aynı anda çalışır.
+    """
+    def __init__(self, workers: int = 1, executor: Union[str, Executor] = "thread", max_concurrency: int = None,
+                 defaults: Dict[str, Any] = None, asset_root: str = None):
+        self.workers = max(1, workers)
+        self.defaults = defaults or {}
+        self.asset_root = asset_root
+        self.owns_executor = isinstance(executor, str)
+        if executor == "process":
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+        elif executor == "thread":
+            executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="qr-render")
+        elif isinstance(executor, str):
+            raise ValueError(f"Bilinmeyen havuz türü: {executor} (thread veya process olmalıdır).")
+        self.executor = executor
+        self.semaphore = asyncio.Semaphore(max_concurrency or self.workers)
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """
+        Bir fonksiyonu havuzda çalıştırır ve sonucunu bekler. Bekleyen görev iptal edilirse henüz başlamamış
+        iş de iptal edilir; başlamış bir iş ise tamamlanana kadar eşzamanlılık sınırından düşülmez.
+
+        Args:
+            fn (Callable): Modül seviyesinde tanımlı fonksiyon.
+            *args: Konumsal argümanlar.
+
+        Returns:
+            Any: Fonksiyonun sonucu.
+        """
+        await self.semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self.semaphore.release()
+            raise
+
+        def release(_) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self.semaphore.release)
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    async def render_qr(self, data: str, version: int = None, **params) -> bytes:
+        """
+        Tek bir versiyonu oluşturur ve çıktı formatında kodlanmış olarak döndürür.
+
+        Args:
+            data (str): QR kodunda kodlanacak veri.
+            version (int, optional): QR kod versiyonu. Verilmezse min_version (varsayılan 1).
+            **params: Komut satırı argümanlarının uzun adlarıyla parametreler.
+
+        Returns:
+            bytes: Kodlanmış görüntü.
+
+        Raises:
+            ValueError: Parametreler geçersizse veya görüntü oluşturulamazsa.
+        """
+        params = dict(params, data=data)
+        if version is not None:
+            params[VERSION_PARAM] = version
+        options = parse_render_request(params, self.defaults, self.asset_root)
+        content, _ = await self.run(render_request, options)
+        return content
+
+    async def render_versions(self, data: str, **params) -> AsyncIterator["RenderedVersion"]:
+        """
+        min_version ile max_version arasındaki versiyonları oluşturur ve her birini tamamlandığı anda
+        (versiyon sırasından bağımsız olarak) döndürür. Yineleme erken bırakılırsa veya görev iptal edilirse
+        henüz başlamamış versiyonlar iptal edilir.
+
+        Args:
+            data (str): QR kodunda kodlanacak veri.
+            **params: Komut satırı argümanlarının uzun adlarıyla parametreler (min_version, max_version,
+                redundant_versions dahil).
+
+        Yields:
+            RenderedVersion: Kodlanmış veriyi (data) içeren versiyon.
+
+        Raises:
+            ValueError: Parametreler geçersizse veya versiyonlardan biri oluşturulamazsa.
+        """
+        from .qr_helper import RenderedVersion, plan_versions
+
+        options = parse_render_request(dict(params, data=data), self.defaults, self.asset_root)
+        # Planlama veriyi bir kez kodlar; o da havuzda yapılır
+        version_plan = await self.run(plan_versions, data, options["min_version"], options["max_version"],
+                                      options["redundant_versions"])
+
+        async def render(version: int, aliases: list) -> RenderedVersion:
+            content, _ = await self.run(render_request, dict(options, **{VERSION_PARAM: version}))
+            return RenderedVersion(version, aliases, options["format"].lower(), data=content,
+                                   encode_preset=options["encode_preset"])
+
+        tasks = [asyncio.ensure_future(render(version, aliases)) for version, aliases in version_plan.items()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self) -> None:
+        """
+        Bu nesnenin oluşturduğu havuzu kapatır; bekleyen işler iptal edilir.
+
+        Returns:
+            None
+        """
+        if self.owns_executor:
+            self.executor.shutdown(cancel_futures=True)
+
+    async def __aenter__(self) -> "AsyncRenderer":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # Havuzun kapanması çalışan işleri bekler; olay döngüsünü engellememesi için ayrı iş parçacığında yapılır
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
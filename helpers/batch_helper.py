@@ -0,0 +1,319 @@
+import os
+import csv
+import json
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Tuple
+from .asset_helper import load_shared_assets
+from .qr_helper import create_render_options, encode_whatsapp_qr, iter_cached_jobs, iter_submission_times, iter_version_jobs, plan_versions, render_whatsapp_qr, save_version_outputs
+from .vector_helper import is_vector_format
+from .filesystem_helper import create_output_directory
+from .archive_helper import ArchiveWriter
+from .cache_helper import CacheHit, get_render_cache
+from .math_helper import calculate_max_canvas_bytes
+from .parallel_helper import RenderPool
+from .error_helper import ManifestError
+from .progress_helper import ProgressReporter, classify_error
+
+@dataclass
+class BatchRowResult:
+    """
+    Toplu moddaki tek bir manifest satırının sonucu.
+
+    Attributes:
+        row_number (int): Satırın manifest içindeki sıra numarası (1'den başlar).
+        output_file (str): Satır için kullanılan çıktı dosyası adı.
+        saved_files (List[str]): Başarıyla kaydedilen dosyaların yolları.
+        error (Optional[str]): Satır başarısız olduysa hata mesajı, aksi halde None.
+        error_category (Optional[str]): Satır başarısız olduysa hatanın kategorisi (bkz. classify_error).
+        data (Optional[str]): Satırda kodlanan veri (satırda data yoksa None).
+    """
+    row_number: int
+    output_file: str
+    saved_files: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    error_category: Optional[str] = None
+    data: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    def fail(self, error: Exception) -> None:
+        """
+        Satırı başarısız olarak işaretler; hata mesajı ve kategorisi hatadan alınır.
+
+        Args:
+            error (Exception): Satırın hatası.
+
+        Returns:
+            None
+        """
+        self.error = str(error)
+        self.error_category = classify_error(error)
+
+def is_jsonl_manifest(manifest_file: str) -> bool:
+    """
+    Manifest dosyasının JSONL formatında olup olmadığını uzantısına göre belirler.
+
+    Args:
+        manifest_file (str): Manifest dosyasının yolu.
+
+    Returns:
+        bool: Dosya .jsonl veya .ndjson uzantılıysa True, aksi halde (CSV kabul edilir) False.
+    """
+    return os.path.splitext(manifest_file)[1].lower() in (".jsonl", ".ndjson")
+
+def parse_jsonl_row(line: str) -> dict:
+    """
+    JSONL manifestin bir satırını ayrıştırır.
+
+    Args:
+        line (str): Manifest satırı.
+
+    Returns:
+        dict: Satırdaki alanlar.
+
+    Raises:
+        ManifestError: Satır geçerli bir JSON değilse veya bir JSON nesnesi değilse.
+    """
+    try:
+        row = json.loads(line)
+    except ValueError as e:
+        raise ManifestError(f"Manifest satırı geçerli bir JSON değil: {e}")
+    if not isinstance(row, dict):
+        raise ManifestError("Manifest satırı bir JSON nesnesi değil.")
+    return row
+
+def read_manifest(manifest_file: str) -> Iterator[Tuple[int, dict, Optional[ManifestError]]]:
+    """
+    CSV veya JSONL manifest dosyasını satır satır okur. Dosya belleğe bir kerede yüklenmez. Ayrıştırılamayan
+    JSONL satırları okumayı durdurmaz; hatayla birlikte döndürülür.
+
+    Args:
+        manifest_file (str): Manifest dosyasının yolu.
+
+    Yields:
+        Tuple[int, dict, Optional[ManifestError]]: Satır numarası, satırdaki alanlar (boş değerler atlanır) ve
+        satır ayrıştırılamadıysa hata (bu durumda alanlar boştur).
+    """
+    with open(manifest_file, newline="", encoding="utf-8") as f:
+        jsonl = is_jsonl_manifest(manifest_file)
+        rows = (line for line in f if line.strip()) if jsonl else csv.DictReader(f)
+        for row_number, row in enumerate(rows, 1):
+            if jsonl:
+                try:
+                    row = parse_jsonl_row(row)
+                except ManifestError as e:
+                    yield row_number, {}, e
+                    continue
+            yield row_number, {key: value for key, value in row.items() if value not in (None, "")}, None
+
+def create_row_output_file(output_file: str, row_number: int) -> str:
+    """
+    Manifestte çıktı adı belirtilmeyen satırlar için satır numaralı bir çıktı adı üretir.
+
+    Args:
+        output_file (str): Varsayılan çıktı dosyası adı (örn. karekod.png).
+        row_number (int): Satır numarası.
+
+    Returns:
+        str: Satıra özel çıktı dosyası adı (örn. karekod_1.png).
+    """
+    base, extension = os.path.splitext(output_file)
+    return f"{base}_{row_number}{extension}"
+
+def iter_batch_jobs(manifest_file: str, results: List[BatchRowResult], output_file: str, title: str,
+                    foreground_color: str, background_color: str, title_color: str,
+                    min_version: int, max_version: int, render_options: dict,
+                    redundant_versions: str = "link", render_function: Callable = render_whatsapp_qr) -> Iterator[tuple]:
+    """
+    Manifest satırlarını okurken her satırın her versiyonu için oluşturma görevlerini üretir.
+    Her satırın sonucu okunduğu anda results listesine eklenir; geçersiz satırlar için görev üretilmez.
+
+    Args:
+        manifest_file (str): Manifest dosyasının yolu.
+        results (List[BatchRowResult]): Satır sonuçlarının ekleneceği liste.
+        output_file (str): Satırda output verilmezse kullanılacak temel çıktı adı.
+        title, foreground_color, background_color, title_color: Satırlar için varsayılan değerler.
+        min_version (int): Minimum QR kod versiyonu.
+        max_version (int): Maksimum QR kod versiyonu.
+        render_options (dict): Satırlar arasında ortak görünüm seçenekleri.
+        redundant_versions (str): Veriyi taşıyamayan versiyonlar için "link" (bağla) veya "skip" (atla).
+        render_function (Callable): Görevlerde çalıştırılacak fonksiyon (render_whatsapp_qr veya encode_whatsapp_qr).
+
+    Yields:
+        tuple: Etiketi (BatchRowResult, version, aliases) olan oluşturma görevleri.
+    """
+    for row_number, row, error in read_manifest(manifest_file):
+        result = BatchRowResult(row_number, row.get("output") or create_row_output_file(output_file, row_number))
+        results.append(result)
+        if error is not None:
+            result.fail(error)
+            continue
+        if "data" not in row:
+            result.fail(ManifestError("Satırda 'data' alanı bulunamadı."))
+            continue
+        result.data = str(row["data"])
+        try:
+            version_plan = plan_versions(result.data, min_version, max_version, redundant_versions)
+        except Exception as e:
+            result.fail(e)
+            continue
+        row_options = dict(render_options,
+                           foreground_color=row.get("foreground_color", foreground_color),
+                           background_color=row.get("background_color", background_color),
+                           title_color=row.get("title_color", title_color))
+        yield from iter_version_jobs(result.data, row.get("title", title), version_plan, row_options, tag=result,
+                                     render_function=render_function)
+
+def create_whatsapp_qr_batch(manifest_file: str, output_file: str = "karekod.png", title: str = "WhatsApp QR Kodu",
+                             foreground_color: str = "black", background_color: str = "white",
+                             title_color: str = "black", resolution: int = 1080,
+                             image_files: list = None, output_format: str = "png",
+                             text_scale_factor: float = 1.0, logo_scale_factor: float = 1.0,
+                             min_version: int = 1, max_version: int = 20, center_logo: str = None, center_logo_size: float = 0.2,
+                             is_logo_circle: bool = True, border_size: float = 0.0, border_color: str = "white",
+                             workers: int = 1, asset_cache: str = None, asset_cache_size: int = 256,
+                             native_resolution: bool = False, redundant_versions: str = "link",
+                             archive_file: str = None, encode_preset: str = "default", events_file: str = None,
+                             quiet: bool = False, render_cache: str = None, render_cache_size: int = 512,
+                             render_cache_age: float = 0) -> List[BatchRowResult]:
+    """
+    Bir manifest dosyasındaki her satır için WhatsApp QR kodlarını tek bir süreç içinde oluşturur.
+    Logolar, merkez logo ve font bir kez yüklenir; her satır data, title, renkler ve output alanlarını
+    geçersiz kılabilir. Bir satırdaki hata diğer satırları durdurmaz, sonuç listesinde raporlanır.
+
+    Args:
+        manifest_file (str): CSV (başlık satırlı) veya JSONL manifest dosyasının yolu.
+        output_file (str): Satırda output verilmezse kullanılacak temel çıktı adı.
+        workers (int): Satır ve versiyonların dağıtılacağı süreç sayısı (1 ise aynı süreçte sırayla).
+        asset_cache (str): Hazırlanmış logoların saklanacağı kalıcı önbellek dizini (None ise kullanılmaz).
+        asset_cache_size (int): Kalıcı önbelleğin en fazla boyutu (MB).
+        native_resolution (bool): True ise QR kodlar doğrudan hedef çözünürlükte çizilir.
+        redundant_versions (str): Veriyi taşıyamayan versiyonlar için "link" (bağla) veya "skip" (atla).
+        archive_file (str): Verilirse tüm satırların görüntüleri dizinler yerine tamamlandıkça bu ZIP/TAR
+            arşivine yazılır; satırların verisi arşivdeki manifest.jsonl'de özet olarak tutulur.
+        encode_preset (str): Kodlama ön ayarı (default, fast, balanced, small).
+        events_file (str): Verilirse görüntü, satır hatası ve özet olayları bu dosyaya ("-" ise standart çıktıya)
+            JSON Lines olarak yazılır. Kalan süre tahmini için manifest önceden bir kez sayılır.
+        quiet (bool): True ise kaydedilen her dosya için mesaj yazdırılmaz.
+        render_cache (str): Verilirse kodlanmış görüntüler tüm parametrelerin özetiyle bu dizinde saklanır;
+            aynı parametrelerle tekrar istenen versiyonlar (tekrarlanan satırlar dahil) oluşturulmaz.
+        render_cache_size (int): Oluşturma önbelleğinin en fazla boyutu (MB).
+        render_cache_age (float): Önbellek girdilerinin en fazla yaşı (saat); 0 ise sınırsız.
+        Diğer argümanlar create_whatsapp_qr ile aynıdır ve satırlar için varsayılan değer görevi görür.
+
+    Returns:
+        List[BatchRowResult]: Her satır için başarı/başarısızlık bilgisi.
+    """
+    assets = load_shared_assets(image_files, logo_scale_factor, center_logo, text_scale_factor,
+                                asset_cache, asset_cache_size, is_vector_format(output_format))
+    render_options = create_render_options(foreground_color, background_color, title_color, resolution,
+                                           text_scale_factor, logo_scale_factor, center_logo_size,
+                                           is_logo_circle, border_size, border_color, native_resolution,
+                                           output_format)
+    cache = get_render_cache(render_cache, render_cache_size, render_cache_age) if render_cache else None
+    # Önbelleğe kodlanmış veri yazıldığı için önbellek açıkken görüntüler işçilerde kodlanır
+    encode = bool(archive_file) or cache is not None
+    slot_size = 0
+    if encode:
+        render_options["encode_preset"] = encode_preset
+    elif not is_vector_format(output_format):
+        # Görüntüler kaydedilir edilmez bırakıldığı için işçilerden paylaşılan bellek üzerinden alınabilir
+        slot_size = calculate_max_canvas_bytes(resolution, text_scale_factor)
+    results = []
+    output_dirs = {}  # satır numarası -> çıktı dizini; her satırın dizini bir kez oluşturulur
+    progress = ProgressReporter(events_file, quiet) if events_file or quiet else None
+    verbose = progress is None or progress.verbose
+    if progress is not None and events_file:
+        progress.add_total(rows=sum(1 for _ in read_manifest(manifest_file)))
+    submitted = deque()
+    jobs = iter_batch_jobs(manifest_file, results, output_file, title, foreground_color, background_color,
+                           title_color, min_version, max_version, render_options, redundant_versions,
+                           encode_whatsapp_qr if encode else render_whatsapp_qr)
+    if cache is not None:
+        jobs = iter_cached_jobs(jobs, cache, assets)
+    jobs = iter_submission_times(jobs, submitted)
+    finished_rows = 0  # results içinde sonucu kesinleşmiş satır sayısı
+
+    def finish_rows(until: Optional[BatchRowResult]) -> None:
+        # Satırların görevleri sırayla döndüğü için until'den önceki satırların tümü tamamlanmıştır
+        nonlocal finished_rows
+        while finished_rows < len(results) and results[finished_rows] is not until:
+            row = results[finished_rows]
+            finished_rows += 1
+            if progress is not None:
+                progress.row_done()
+                if not row.success:
+                    progress.error(row.error, row=row.row_number, category=row.error_category)
+
+    archive = ArchiveWriter(archive_file, verbose=verbose) if archive_file else None
+    try:
+        with RenderPool(assets, workers) as pool:
+            for tag, future in pool.map_ordered(jobs, slot_size=slot_size):
+                (result, version, aliases), cache_key = tag if cache is not None else (tag, None)
+                submitted_at = submitted.popleft()
+                finish_rows(result)
+                if not result.success:
+                    continue
+                try:
+                    content = future.result()
+                    hit = content if isinstance(content, CacheHit) else None
+                    if hit is None and cache_key is not None:
+                        cache.set(cache_key, content)
+                    if archive is not None:
+                        content = content.read() if hit is not None else content
+                        files = archive.add(result.output_file, version, aliases, content, output_format, result.data)
+                        size = len(content)
+                    else:
+                        if result.row_number not in output_dirs:
+                            output_dirs[result.row_number] = create_output_directory(result.output_file)
+                        if hit is not None:
+                            files = save_version_outputs(None, result.output_file, version, aliases, output_format,
+                                                         output_dirs[result.row_number], encode_preset, verbose,
+                                                         hit.data, hit.path, cached=True)
+                        elif encode:
+                            files = save_version_outputs(None, result.output_file, version, aliases, output_format,
+                                                         output_dirs[result.row_number], encode_preset, verbose,
+                                                         content)
+                        else:
+                            files = save_version_outputs(content, result.output_file, version, aliases,
+                                                         output_format, output_dirs[result.row_number], encode_preset,
+                                                         verbose)
+                        size = os.path.getsize(files[0])
+                    result.saved_files += files
+                    if progress is not None:
+                        progress.image_saved(version, files, size, submitted_at, row=result.row_number)
+                except Exception as e:
+                    result.fail(e)
+        finish_rows(None)
+    finally:
+        try:
+            if archive is not None:
+                archive.close()
+        finally:
+            if progress is not None:
+                progress.close()
+    return results
+
+def print_batch_report(results: List[BatchRowResult], failures_only: bool = False) -> None:
+    """
+    Toplu işlem sonuçlarını satır satır ve özet olarak yazdırır.
+
+    Args:
+        results (List[BatchRowResult]): create_whatsapp_qr_batch sonuçları.
+        failures_only (bool): True ise yalnızca başarısız satırlar ve özet yazdırılır.
+
+    Returns:
+        None
+    """
+    for result in results:
+        if result.success:
+            if failures_only:
+                continue
+            print(f"Satır {result.row_number}: başarılı ({len(result.saved_files)} dosya, {result.output_file})")
+        else:
+            print(f"Satır {result.row_number}: başarısız ({result.output_file}) - {result.error}")
+    failed = sum(1 for result in results if not result.success)
+    print(f"Toplam {len(results)} satır işlendi: {len(results) - failed} başarılı, {failed} başarısız.")
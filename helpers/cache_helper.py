@@ -0,0 +1,351 @@
+import os
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+class LRUCache:
+    """
+    En uzun süredir kullanılmayan girdiyi atarak boyutu sınırlı tutan, iş parçacığı güvenli bellek içi önbellek.
+    """
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Anahtara karşılık gelen değeri döndürür; yoksa factory ile üretip önbelleğe ekler.
+
+        Args:
+            key (Hashable): Önbellek anahtarı.
+            factory (Callable[[], Any]): Değer önbellekte yoksa çağrılacak fonksiyon.
+
+        Returns:
+            Any: Önbellekteki veya yeni üretilen değer.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = factory()
+        self.set(key, value)
+        return value
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Anahtara karşılık gelen değeri döndürür ve girdiyi son kullanılan olarak işaretler.
+
+        Args:
+            key (Hashable): Önbellek anahtarı.
+
+        Returns:
+            Any: Önbellekteki değer, yoksa None.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Değeri önbelleğe ekler; sınır aşılırsa en uzun süredir kullanılmayan girdiler atılır.
+
+        Args:
+            key (Hashable): Önbellek anahtarı.
+            value (Any): Saklanacak değer.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Önbellekteki tüm girdileri siler.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Dosya yolu, değiştirilme zamanı ve boyutu aynı kaldığı sürece içerik yeniden okunmaz
+_file_hash_cache = LRUCache(1024)
+
+def file_content_hash(path: str) -> str:
+    """
+    Dosyanın içeriğinin SHA-256 özetini döndürür. Dosya değişmediği sürece özet önbellekten gelir.
+
+    Args:
+        path (str): Dosyanın yolu.
+
+    Returns:
+        str: İçeriğin onaltılık SHA-256 özeti.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+    def compute() -> str:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    return _file_hash_cache.get_or_create(key, compute)
+
+# Boyut sınırı aşıldığında girdiler sınırın bu oranına kadar silinir; sınıra yakın her yazmada dizin taranmaz
+EVICT_TARGET_RATIO = 0.9
+
+# Süresi dolan girdiler için dizin en fazla bu aralıkla (saniye) taranır
+EVICT_INTERVAL = 60.0
+
+class DiskCache:
+    """
+    Süreçler ve çalıştırmalar arasında paylaşılan, toplam boyutu sınırlı kalıcı önbellek.
+    Girdiler anahtarın SHA-256 özetiyle adlandırılan dosyalarda tutulur; sınır aşıldığında
+    en uzun süredir okunmayan dosyalar silinir. max_age (saniye) verilirse bu süredir okunmayan
+    girdiler de geçersiz sayılır ve silinir.
+
+    Toplam boyut ilk yazmada dizin bir kez taranarak bulunur, sonraki yazmalarda artımlı olarak güncellenir;
+    dizin yalnızca sınır aşıldığında (ve max_age verilmişse en fazla EVICT_INTERVAL saniyede bir) yeniden
+    taranır. Diğer süreçlerin yazdıkları bir sonraki taramada hesaba katılır.
+    """
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024, max_age: float = None):
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.total_size = None  # dizin henüz taranmadıysa None
+        self.last_evict = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _is_expired(self, mtime_ns: int) -> bool:
+        return self.max_age is not None and time.time() - mtime_ns / 1e9 > self.max_age
+
+    def _path(self, key: Hashable) -> str:
+        name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name[:2], name + ".bin")
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """
+        Anahtara karşılık gelen veriyi döndürür ve girdiyi son kullanılan olarak işaretler.
+
+        Args:
+            key (Hashable): Önbellek anahtarı (repr değeri kararlı olmalıdır).
+
+        Returns:
+            Optional[bytes]: Önbellekteki veri, yoksa None.
+        """
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def get_path(self, key: Hashable) -> Optional[str]:
+        """
+        Anahtara karşılık gelen girdinin dosya yolunu döndürür ve girdiyi son kullanılan olarak işaretler.
+        Dosya yalnızca okunmalı veya kopyalanmalıdır; bağlanırsa (hard link) bağlantıya yazmak girdiyi bozar.
+
+        Args:
+            key (Hashable): Önbellek anahtarı (repr değeri kararlı olmalıdır).
+
+        Returns:
+            Optional[str]: Girdinin yolu; yoksa veya süresi dolmuşsa None.
+        """
+        path = self._path(key)
+        try:
+            if self._is_expired(os.stat(path).st_mtime_ns):
+                os.remove(path)
+                return None
+            os.utime(path)
+            return path
+        except OSError:
+            return None
+
+    def set(self, key: Hashable, data: bytes) -> None:
+        """
+        Veriyi önbelleğe yazar ve gerekirse eski girdileri siler. Yazma atomiktir;
+        aynı anahtarı yazan birden fazla süreç birbirini bozmaz.
+
+        Args:
+            key (Hashable): Önbellek anahtarı.
+            data (bytes): Saklanacak veri.
+
+        Returns:
+            None
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            previous_size = os.stat(path).st_size
+        except OSError:
+            previous_size = 0
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        with self._lock:
+            if self.total_size is not None:
+                self.total_size += len(data) - previous_size
+            due = self.max_age is not None and time.monotonic() - self.last_evict >= EVICT_INTERVAL
+            scan = self.total_size is None or self.total_size > self.max_bytes or due
+        if scan:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Dizini tarar; süresi dolmuş girdileri ve toplam boyut sınırı aşılmışsa en uzun süredir kullanılmayan
+        girdileri, toplam boyut sınırın EVICT_TARGET_RATIO oranına inene kadar siler.
+
+        Returns:
+            None
+        """
+        entries = []
+        total_size = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".bin"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                    if self._is_expired(stat.st_mtime_ns):
+                        os.remove(path)
+                        continue
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+                total_size += stat.st_size
+
+        if total_size > self.max_bytes:
+            target_size = self.max_bytes * EVICT_TARGET_RATIO
+            for _, size, path in sorted(entries):
+                if total_size <= target_size:
+                    break
+                try:
+                    os.remove(path)
+                    total_size -= size
+                except OSError:
+                    pass
+
+        with self._lock:
+            self.total_size = total_size
+            self.last_evict = time.monotonic()
+
+@dataclass
+class CacheHit:
+    """
+    Oluşturma önbelleğinde bulunan kodlanmış görüntü. Bellek katmanından gelen girdilerde veri, disk
+    katmanından gelenlerde dosya yolu bulunur; dosya belleğe okunmadan çıktıya kopyalanabilir.
+
+    Attributes:
+        data (Optional[bytes]): Kodlanmış görüntü.
+        path (Optional[str]): Disk önbelleğindeki dosyanın yolu.
+    """
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+
+    def read(self) -> bytes:
+        """
+        Kodlanmış görüntüyü döndürür; yalnızca dosya yolu varsa dosyayı okur.
+
+        Returns:
+            bytes: Kodlanmış görüntü.
+        """
+        if self.data is None:
+            with open(self.path, "rb") as f:
+                self.data = f.read()
+        return self.data
+
+class RenderCache:
+    """
+    Kodlanmış QR kod görüntülerini tüm oluşturma parametrelerinin özetiyle saklayan iki katmanlı önbellek.
+    Bellek katmanı süreç içinde en son kullanılan memory_entries görüntüyü tutar; directory verilirse disk
+    katmanı süreçler ve çalıştırmalar arasında paylaşılır, boyut (max_bytes) ve yaş (max_age, saniye) sınırıyla
+    temizlenir.
+    """
+    def __init__(self, directory: str = None, max_bytes: int = 512 * 1024 * 1024, max_age: float = None,
+                 memory_entries: int = 64):
+        self.memory = LRUCache(memory_entries)
+        self.disk = DiskCache(directory, max_bytes, max_age) if directory else None
+
+    def lookup(self, key: str) -> Optional[CacheHit]:
+        """
+        Girdiyi önce bellekte, sonra diskte arar. Diskteki girdi okunmaz, yalnızca yolu döndürülür.
+
+        Args:
+            key (str): create_render_cache_key ile oluşturulmuş anahtar.
+
+        Returns:
+            Optional[CacheHit]: Bulunan girdi, yoksa None.
+        """
+        data = self.memory.get(key)
+        if data is not None:
+            return CacheHit(data=data)
+        path = self.disk.get_path(key) if self.disk is not None else None
+        return CacheHit(path=path) if path is not None else None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Kodlanmış görüntüyü döndürür; diskte bulunan girdi bellek katmanına da alınır.
+
+        Args:
+            key (str): Önbellek anahtarı.
+
+        Returns:
+            Optional[bytes]: Kodlanmış görüntü, yoksa None.
+        """
+        data = self.memory.get(key)
+        if data is None and self.disk is not None:
+            data = self.disk.get(key)
+            if data is not None:
+                self.memory.set(key, data)
+        return data
+
+    def set(self, key: str, data: bytes) -> None:
+        """
+        Kodlanmış görüntüyü iki katmana da yazar.
+
+        Args:
+            key (str): Önbellek anahtarı.
+            data (bytes): Kodlanmış görüntü.
+
+        Returns:
+            None
+        """
+        self.memory.set(key, data)
+        if self.disk is not None:
+            self.disk.set(key, data)
+
+# Süreç başına dizin ve sınırlar için tek bir oluşturma önbelleği; bellek katmanı istekler arasında sıcak kalır
+_render_caches = LRUCache(8)
+
+def get_render_cache(directory: str, max_size: int = 512, max_age: float = 0) -> RenderCache:
+    """
+    Verilen dizin ve sınırlar için bu süreçteki oluşturma önbelleğini döndürür; yoksa oluşturur.
+
+    Args:
+        directory (str): Disk katmanının dizini.
+        max_size (int): Disk katmanının en fazla boyutu (MB).
+        max_age (float): Girdilerin en fazla yaşı (saat); 0 ise sınırsız.
+
+    Returns:
+        RenderCache: Oluşturma önbelleği.
+    """
+    return _render_caches.get_or_create(
+        (os.path.expanduser(directory), max_size, max_age),
+        lambda: RenderCache(directory, max_size * 1024 * 1024, max_age * 3600 if max_age else None))
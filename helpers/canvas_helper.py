@@ -0,0 +1,190 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from PIL import Image
+
+# Sıkıştırılmış QR kod alanı RGB'ye bu yükseklikte şeritler halinde açılır; geçici bellek şerit boyutuyla sınırlı kalır
+STRIP_HEIGHT = 512
+
+def get_palette_colors(image: Image.Image) -> List[Tuple[int, int, int]]:
+    """
+    P kipindeki bir görüntünün paletini renk listesi olarak döndürür.
+
+    Args:
+        image (Image.Image): P kipinde görüntü.
+
+    Returns:
+        List[Tuple[int, int, int]]: Palet renkleri (indeks sırasıyla).
+    """
+    palette = image.getpalette("RGB")
+    return [tuple(palette[i:i + 3]) for i in range(0, len(palette), 3)]
+
+def get_image_colors(image: Image.Image, max_colors: int = 256) -> Optional[List[Tuple[int, int, int]]]:
+    """
+    Görüntüde kullanılan renkleri döndürür. P ve L kipinde yalnızca histogram okunur, piksel kopyalanmaz.
+
+    Args:
+        image (Image.Image): P, L veya RGB kipinde görüntü.
+        max_colors (int): En fazla renk sayısı.
+
+    Returns:
+        Optional[List[Tuple[int, int, int]]]: Kullanılan renkler; max_colors'tan fazlaysa None.
+    """
+    if image.mode in ("P", "L"):
+        used = [index for index, count in enumerate(image.histogram()[:256]) if count]
+        if len(used) > max_colors:
+            return None
+        if image.mode == "L":
+            return [(value, value, value) for value in used]
+        palette = get_palette_colors(image)
+        return [palette[index] for index in used]
+
+    colors = image.convert("RGB").getcolors(max_colors)
+    return None if colors is None else [color for _, color in colors]
+
+def is_grayscale_palette(image: Image.Image) -> bool:
+    """
+    P kipindeki görüntünün paletinde yalnızca gri tonlar (R = G = B) olup olmadığını kontrol eder.
+
+    Args:
+        image (Image.Image): P kipinde görüntü.
+
+    Returns:
+        bool: Tüm palet renkleri gri ise True.
+    """
+    return all(red == green == blue for red, green, blue in get_palette_colors(image))
+
+def resize_compact_image(image: Image.Image, resolution: int) -> Image.Image:
+    """
+    P kipindeki QR kod görüntüsünü LANCZOS ile ölçeklendirir. Palet gri tonlardan oluşuyorsa (siyah-beyaz gibi)
+    ölçeklendirme tek kanallı L kipinde yapılır; sonuç RGB ölçeklendirmenin her kanalıyla aynıdır. Diğer renklerde
+    ara tonlar paletle ifade edilemeyeceği için RGB'ye çevrilir.
+
+    Args:
+        image (Image.Image): P (veya RGB) kipinde QR kod görüntüsü.
+        resolution (int): Hedef genişlik.
+
+    Returns:
+        Image.Image: Ölçeklendirilmiş L veya RGB görüntü.
+    """
+    if image.mode == "P":
+        image = image.convert("L" if is_grayscale_palette(image) else "RGB")
+    scale_factor = resolution / image.size[0]
+    return image.resize((resolution, int(image.size[1] * scale_factor)), Image.LANCZOS)
+
+def crop_to_rgb(image: Image.Image, box: Tuple[int, int, int, int], overlay: Image.Image = None,
+                overlay_position: Tuple[int, int] = (0, 0)) -> Image.Image:
+    """
+    Sıkıştırılmış görüntünün bir bölgesini RGB'ye açar ve varsa üstüne bindirilecek (merkez logo gibi) RGBA
+    görüntüyü yapıştırır. Yalnızca süslenen bölgeler bu şekilde tam renge yükseltilir.
+
+    Args:
+        image (Image.Image): P, L veya RGB kipinde görüntü.
+        box (Tuple[int, int, int, int]): Açılacak bölge (sol, üst, sağ, alt).
+        overlay (Image.Image, optional): Görüntü koordinatlarında overlay_position'a yapıştırılacak RGBA görüntü.
+        overlay_position (Tuple[int, int]): Bindirmenin görüntüdeki sol üst köşesi.
+
+    Returns:
+        Image.Image: Bölgenin RGB görüntüsü.
+    """
+    region = image.crop(box).convert("RGB")
+    if overlay is not None:
+        region.paste(overlay, (overlay_position[0] - box[0], overlay_position[1] - box[1]), mask=overlay)
+    return region
+
+def compose_canvas(base: Image.Image, base_y: int, background_color: Tuple[int, int, int],
+                   decorations: List[Tuple[Image.Image, Tuple[int, int]]]) -> Image.Image:
+    """
+    Sıkıştırılmış QR kod alanını ve RGB süsleme bölgelerini (başlık bandı, merkez logo) tek bir tuvalde birleştirir.
+    Tüm renkler 256'ya sığıyorsa tuval P kipinde (piksel başına 1 bayt) oluşturulur: QR kod alanının palet
+    indeksleri olduğu gibi kopyalanır, yalnızca süslemeler indekslenir. Sığmıyorsa RGB tuval QR kod alanı
+    şeritler halinde açılarak doldurulur. Süslemeler verilen sırayla, sonraki öncekinin üstüne gelir.
+
+    Args:
+        base (Image.Image): P, L veya RGB kipinde QR kod alanı.
+        base_y (int): QR kod alanının tuvaldeki y konumu.
+        background_color (Tuple[int, int, int]): Süslemelerin kapsamadığı alanların rengi.
+        decorations (List[Tuple[Image.Image, Tuple[int, int]]]): RGB görüntüler ve tuvaldeki konumları.
+
+    Returns:
+        Image.Image: P veya RGB kipinde tuval.
+    """
+    width, height = base.width, base_y + base.height
+    palette = create_canvas_palette(base, [tuple(background_color)], [decoration for decoration, _ in decorations])
+
+    if palette is None:
+        canvas = Image.new("RGB", (width, height), tuple(background_color))
+        for top in range(0, base.height, STRIP_HEIGHT):
+            strip = base.crop((0, top, width, min(top + STRIP_HEIGHT, base.height)))
+            canvas.paste(strip.convert("RGB"), (0, base_y + top))
+        for decoration, position in decorations:
+            canvas.paste(decoration, position)
+        return canvas
+
+    color_indices = {color: index for index, color in enumerate(palette)}
+    flat_palette = [channel for color in palette for channel in color]
+    if base.mode == "L":
+        # Gri tonlar palet indekslerine çevrilir; putpalette görüntüyü kopyalamadan P kipine geçirir
+        base = base.point([color_indices.get((value, value, value), 0) for value in range(256)])
+        base.putpalette(flat_palette)
+    canvas = Image.new("P", (width, height), color_indices[tuple(background_color)])
+    canvas.putpalette(flat_palette)
+    canvas.paste(base, (0, base_y))
+    for decoration, position in decorations:
+        canvas.paste(index_rgb_image(decoration, palette), position)
+    return canvas
+
+def create_canvas_palette(base: Image.Image, colors: List[Tuple[int, int, int]],
+                          decorations: List[Image.Image]) -> Optional[List[Tuple[int, int, int]]]:
+    """
+    Tuvalin paletini oluşturur. P kipindeki QR kod alanının paleti başa olduğu gibi alınır, böylece indeksleri
+    değiştirilmeden kopyalanabilir; diğer renkler sona eklenir.
+
+    Args:
+        base (Image.Image): P, L veya RGB kipinde QR kod alanı.
+        colors (List[Tuple[int, int, int]]): Palete eklenecek diğer renkler (arka plan gibi).
+        decorations (List[Image.Image]): RGB süsleme görüntüleri.
+
+    Returns:
+        Optional[List[Tuple[int, int, int]]]: Palet; renkler 256'ya sığmıyorsa veya QR kod alanı RGB ise None.
+    """
+    if base.mode == "RGB":
+        return None
+    palette = get_palette_colors(base) if base.mode == "P" else get_image_colors(base)
+    known = set(palette)
+    for image_colors in [colors] + [get_image_colors(decoration) for decoration in decorations]:
+        if image_colors is None:
+            return None
+        for color in image_colors:
+            if color not in known:
+                known.add(color)
+                palette.append(color)
+    return palette if len(palette) <= 256 else None
+
+def index_rgb_image(image: Image.Image, palette: List[Tuple[int, int, int]]) -> Image.Image:
+    """
+    Tüm renkleri palette bulunan bir RGB görüntüyü bu paleti kullanan P kipine kayıpsız çevirir.
+    Pillow'un palete dönüştürmesi renkleri azaltılmış hassasiyetle eşlediği için indeksler doğrudan bulunur;
+    görüntü şeritler halinde işlenir.
+
+    Args:
+        image (Image.Image): RGB görüntü.
+        palette (List[Tuple[int, int, int]]): Görüntüdeki tüm renkleri içeren palet (en fazla 256 renk).
+
+    Returns:
+        Image.Image: P kipinde görüntü.
+    """
+    palette_keys = np.array([(red << 16) | (green << 8) | blue for red, green, blue in palette], dtype=np.int32)
+    order = np.argsort(palette_keys)
+    sorted_keys = palette_keys[order]
+    sorted_indices = order.astype(np.uint8)
+
+    indices = np.empty((image.height, image.width), dtype=np.uint8)
+    for top in range(0, image.height, STRIP_HEIGHT):
+        bottom = min(top + STRIP_HEIGHT, image.height)
+        pixels = np.asarray(image.crop((0, top, image.width, bottom)), dtype=np.int32)
+        keys = (pixels[..., 0] << 16) | (pixels[..., 1] << 8) | pixels[..., 2]
+        indices[top:bottom] = sorted_indices[np.searchsorted(sorted_keys, keys)]
+
+    indexed = Image.fromarray(indices, "P")
+    indexed.putpalette([channel for color in palette for channel in color])
+    return indexed
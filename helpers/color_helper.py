@@ -1,4 +1,5 @@
-import webcolors
+from functools import lru_cache
+from .error_helper import ColorError
 
 def color_name_to_hex(color_name: str) -> str:
     """
@@ -10,6 +11,7 @@ def color_name_to_hex(color_name: str) -> str:
     Returns:
         str: Rengin hexadecimal kodu veya geçersiz renk adı durumunda None
     """
+    import webcolors
     try:
         hex_code = webcolors.name_to_hex(color_name)
         return hex_code
@@ -29,10 +31,12 @@ def hex_to_rgb(hex_color: str) -> tuple:
     """
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+@lru_cache(maxsize=256)
 def get_rgb_from_color_name(color_name: str) -> tuple:
     """
     Verilen renk ismini alır ve karşılık gelen RGB tupılını döndürür.
     Eğer renk ismi geçersizse, ValueError fırlatır.
+    Sonuçlar önbelleğe alınır; aynı renk her versiyon ve satır için yeniden çözümlenmez.
 
     Args:
         color_name (str): Renk ismi.
@@ -43,7 +47,7 @@ def get_rgb_from_color_name(color_name: str) -> tuple:
     # Renk ismini hex koduna dönüştür
     hex_code = color_name_to_hex(color_name)
     if hex_code is None:
-        raise ValueError(f"Geçersiz renk ismi verildi. Hatayı düzeltin. Hatalı renk ismi: {color_name}")
+        raise ColorError(f"Geçersiz renk ismi verildi. Hatayı düzeltin. Hatalı renk ismi: {color_name}")
     # Hex kodunu RGB tupılına dönüştür
     rgb_tuple = hex_to_rgb(hex_code)
     return rgb_tuple
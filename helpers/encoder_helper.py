@@ -0,0 +1,418 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple
+import numpy as np
+import qrcode
+from qrcode import base, constants, exceptions, util, LUT
+
+# qrcode.QRCode.add_data'nın varsayılanı: en az bu uzunluktaki sayı/alfanümerik parçalar ayrı segment olur
+SEGMENT_OPTIMIZE_LENGTH = 20
+
+# Veri kapasitesi dolana kadar sırayla eklenen dolgu baytları
+PAD_CODEWORDS = (util.PAD0, util.PAD1)
+
+# Ceza kuralı 3'teki 1:1:3:1:1 bulucu benzeri desenler (4 modül açık alanla birlikte), 11 bitlik sayı olarak
+FINDER_LIKE_PATTERN_LENGTH = 11
+FINDER_LIKE_PATTERNS = (0b10111010000, 0b00001011101)
+
+@lru_cache(maxsize=1)
+def create_gf_multiplication_table() -> np.ndarray:
+    """
+    Reed-Solomon kodlamasında kullanılan GF(256) çarpım tablosunu qrcode'un üstel/logaritma tablolarından oluşturur.
+
+    Returns:
+        np.ndarray: (256, 256) boyutlu uint8 dizi; [a, b] elemanı a * b.
+    """
+    exp_table = np.array(base.EXP_TABLE, dtype=np.intp)
+    log_table = np.array(base.LOG_TABLE, dtype=np.intp)
+    values = np.arange(256)
+    table = exp_table[(log_table[values][:, np.newaxis] + log_table[values][np.newaxis, :]) % 255].astype(np.uint8)
+    table[0, :] = 0
+    table[:, 0] = 0
+    return table
+
+@lru_cache(maxsize=32)
+def create_generator_polynomial(ec_count: int) -> np.ndarray:
+    """
+    Verilen sayıda hata düzeltme baytı için üreteç polinomunun katsayılarını döndürür.
+
+    Args:
+        ec_count (int): Bloktaki hata düzeltme baytı sayısı.
+
+    Returns:
+        np.ndarray: En yüksek dereceden başlayan (ec_count + 1) katsayı.
+    """
+    if ec_count in LUT.rsPoly_LUT:
+        return np.array(LUT.rsPoly_LUT[ec_count], dtype=np.uint8)
+    multiply = create_gf_multiplication_table()
+    polynomial = np.array([1], dtype=np.uint8)
+    for i in range(ec_count):
+        # (x - a^i) ile çarp
+        shifted = np.append(polynomial, 0).astype(np.uint8)
+        shifted[1:] ^= multiply[polynomial, base.gexp(i)]
+        polynomial = shifted
+    return polynomial
+
+def calculate_ec_codewords(data_blocks: np.ndarray, ec_count: int) -> np.ndarray:
+    """
+    Tüm blokların Reed-Solomon hata düzeltme baytlarını aynı anda hesaplar (polinom bölümünden kalan).
+    Kısa bloklar başlarına sıfır eklenerek hizalanır; baştaki sıfırlar kalanı değiştirmez.
+
+    Args:
+        data_blocks (np.ndarray): (blok sayısı, en uzun blok) boyutlu, sağa hizalanmış veri baytları.
+        ec_count (int): Blok başına hata düzeltme baytı sayısı.
+
+    Returns:
+        np.ndarray: (blok sayısı, ec_count) boyutlu hata düzeltme baytları.
+    """
+    multiply = create_gf_multiplication_table()
+    generator = create_generator_polynomial(ec_count)[1:]
+    remainder = np.zeros((data_blocks.shape[0], ec_count), dtype=np.uint8)
+    for column in data_blocks.T:
+        factor = column ^ remainder[:, 0]
+        remainder[:, :-1] = remainder[:, 1:]
+        remainder[:, -1] = 0
+        remainder ^= multiply[factor[:, np.newaxis], generator[np.newaxis, :]]
+    return remainder
+
+def interleave_blocks(blocks: List[np.ndarray]) -> np.ndarray:
+    """
+    Blokların baytlarını qrcode.util.create_bytes'taki gibi sütun sütun birleştirir.
+
+    Args:
+        blocks (List[np.ndarray]): Farklı uzunlukta olabilen bayt blokları.
+
+    Returns:
+        np.ndarray: Birleştirilmiş baytlar.
+    """
+    width = max(len(block) for block in blocks)
+    grid = np.full((len(blocks), width), -1, dtype=np.int16)
+    for index, block in enumerate(blocks):
+        grid[index, :len(block)] = block
+    flat = grid.T.ravel()
+    return flat[flat >= 0].astype(np.uint8)
+
+@dataclass
+class QRSymbol:
+    """
+    Kodlanmış bir QR kod sembolü. qrcode.QRCode'un görüntü oluşturmada kullanılan alanlarıyla uyumludur.
+
+    Attributes:
+        version (int): Sembolün gerçek versiyonu.
+        modules (List[List[bool]]): Sessiz bölge hariç modül matrisi.
+        border (int): Sessiz bölge genişliği (modül cinsinden).
+        box_size (int): Yeniden boyutlandırılmadan çizildiğinde bir modülün kenar uzunluğu (piksel).
+    """
+    version: int
+    modules: List[List[bool]]
+    border: int = 4
+    box_size: int = 10
+
+    @property
+    def modules_count(self) -> int:
+        return len(self.modules)
+
+@dataclass
+class SymbolTemplate:
+    """
+    Bir versiyonun veriden bağımsız yerleşimi. Her versiyon için bir kez hesaplanır.
+
+    Attributes:
+        function_modules (np.ndarray): Konum, hizalama ve zamanlama desenleri; biçim alanları boş (açık).
+        format_modules (np.ndarray): (8, n, n) boyutlu, her maske için biçim ve versiyon bilgisi yazılmış desenler.
+        data_positions (Tuple[np.ndarray, np.ndarray]): Veri modüllerinin yerleştirme sırasıyla satır ve sütunları.
+        masks (np.ndarray): (8, n) boyutlu, her maskenin veri modüllerinde tersleyip terslemediği.
+    """
+    function_modules: np.ndarray
+    format_modules: np.ndarray
+    data_positions: Tuple[np.ndarray, np.ndarray]
+    masks: np.ndarray
+
+def create_mask_grids(modules_count: int) -> np.ndarray:
+    """
+    qrcode.util.mask_func'taki sekiz maske desenini tüm matris için tek seferde hesaplar.
+
+    Args:
+        modules_count (int): Matrisin kenarındaki modül sayısı.
+
+    Returns:
+        np.ndarray: (8, n, n) boyutlu bool dizi; True olan modüller maskeyle terslenir.
+    """
+    i, j = np.indices((modules_count, modules_count))
+    return np.stack([
+        (i + j) % 2 == 0,
+        i % 2 == 0,
+        j % 3 == 0,
+        (i + j) % 3 == 0,
+        (i // 2 + j // 3) % 2 == 0,
+        (i * j) % 2 + (i * j) % 3 == 0,
+        ((i * j) % 2 + (i * j) % 3) % 2 == 0,
+        ((i * j) % 3 + (i + j) % 2) % 2 == 0,
+    ])
+
+def create_data_positions(reserved: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Veri modüllerinin koordinatlarını qrcode.QRCode.map_data'nın zikzak yerleştirme sırasıyla listeler.
+
+    Args:
+        reserved (np.ndarray): Fonksiyon desenleri ve biçim alanları için True olan (n, n) dizi.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Sırasıyla satır ve sütun indeksleri.
+    """
+    modules_count = reserved.shape[0]
+    rows, cols = [], []
+    inc = -1
+    row = modules_count - 1
+    for col in range(modules_count - 1, 0, -2):
+        if col <= 6:
+            col -= 1
+        while True:
+            for c in (col, col - 1):
+                if not reserved[row, c]:
+                    rows.append(row)
+                    cols.append(c)
+            row += inc
+            if row < 0 or modules_count <= row:
+                row -= inc
+                inc = -inc
+                break
+    return np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)
+
+@lru_cache(maxsize=40)
+def create_symbol_template(version: int, error_correction: int = constants.ERROR_CORRECT_M) -> SymbolTemplate:
+    """
+    Bir versiyonun fonksiyon desenlerini, maskeye göre biçim bilgilerini ve veri yerleştirme sırasını hazırlar.
+    Desenler qrcode'un kendi yöntemleriyle çizilir, böylece sonuç kütüphaneyle birebir aynıdır.
+
+    Args:
+        version (int): QR kod versiyonu.
+        error_correction (int): Hata düzeltme seviyesi.
+
+    Returns:
+        SymbolTemplate: Versiyonun yerleşim şablonu.
+    """
+    qr = qrcode.QRCode(version=version, error_correction=error_correction)
+    count = qr.modules_count = version * 4 + 17
+    qr.modules = [[None] * count for _ in range(count)]
+    qr.setup_position_probe_pattern(0, 0)
+    qr.setup_position_probe_pattern(count - 7, 0)
+    qr.setup_position_probe_pattern(0, count - 7)
+    qr.setup_position_adjust_pattern()
+    qr.setup_timing_pattern()
+    # Maske seçimi sırasında (test modunda) biçim ve versiyon alanları açık kabul edilir
+    qr.setup_type_info(True, 0)
+    if version >= 7:
+        qr.setup_type_number(True)
+
+    reserved = np.array([[module is not None for module in row] for row in qr.modules])
+    function_modules = np.array([[bool(module) for module in row] for row in qr.modules])
+    rows, cols = create_data_positions(reserved)
+
+    format_modules = []
+    for mask_pattern in range(8):
+        qr.setup_type_info(False, mask_pattern)
+        if version >= 7:
+            qr.setup_type_number(False)
+        format_modules.append([[bool(module) for module in row] for row in qr.modules])
+
+    masks = create_mask_grids(count)[:, rows, cols]
+    return SymbolTemplate(function_modules, np.array(format_modules), (rows, cols), masks)
+
+def calculate_run_penalty(lines: np.ndarray) -> int:
+    """
+    Ceza kuralı 1: satırlarda aynı renkte 5 veya daha uzun her seri için (uzunluk - 2) puan.
+
+    Args:
+        lines (np.ndarray): (m, n) boyutlu bool dizi; her satır ayrı değerlendirilir.
+
+    Returns:
+        int: Ceza puanı.
+    """
+    count, width = lines.shape
+    # Her satırın başı, sonu ve renk değişimleri sınırdır. Satır sonu ile sonraki satırın başı
+    # arasındaki uzunluk 1 olduğu için satırlar arası geçiş cezaya katılmaz.
+    boundaries = np.ones((count, width + 1), dtype=bool)
+    boundaries[:, 1:width] = lines[:, 1:] != lines[:, :-1]
+    lengths = np.diff(np.flatnonzero(boundaries))
+    return int((lengths[lengths >= 5] - 2).sum())
+
+def calculate_finder_like_count(lines: np.ndarray) -> int:
+    """
+    Ceza kuralı 3 için satırlardaki bulucu benzeri desenleri sayar.
+
+    Args:
+        lines (np.ndarray): (m, n) boyutlu bool dizi.
+
+    Returns:
+        int: Desen sayısı.
+    """
+    # Her 11 modüllük pencere, ilk modül en yüksek bit olacak şekilde tek bir sayıya dönüştürülür
+    width = lines.shape[1] - FINDER_LIKE_PATTERN_LENGTH + 1
+    windows = np.zeros((lines.shape[0], width), dtype=np.int16)
+    for offset in range(FINDER_LIKE_PATTERN_LENGTH):
+        windows = (windows << 1) | lines[:, offset:offset + width]
+    return int(sum(np.count_nonzero(windows == pattern) for pattern in FINDER_LIKE_PATTERNS))
+
+def calculate_lost_point(modules: np.ndarray) -> int:
+    """
+    qrcode.util.lost_point ile aynı maske ceza puanını NumPy ile hesaplar.
+
+    Args:
+        modules (np.ndarray): (n, n) boyutlu bool modül matrisi.
+
+    Returns:
+        int: Toplam ceza puanı.
+    """
+    count = modules.shape[0]
+    lost_point = calculate_run_penalty(modules) + calculate_run_penalty(modules.T)
+
+    # Kural 2: aynı renkteki her 2x2 blok için 3 puan
+    top_left = modules[:-1, :-1]
+    same_blocks = (top_left == modules[:-1, 1:]) & (top_left == modules[1:, :-1]) & (top_left == modules[1:, 1:])
+    lost_point += 3 * int(same_blocks.sum())
+
+    # Kural 3: her bulucu benzeri desen için 40 puan
+    lost_point += 40 * (calculate_finder_like_count(modules) + calculate_finder_like_count(modules.T))
+
+    # Kural 4: koyu modül oranının %50'den her %5 sapması için 10 puan
+    percent = float(int(modules.sum())) / (count ** 2)
+    lost_point += int(abs(percent * 100 - 50) / 5) * 10
+    return lost_point
+
+class QREncoder:
+    """
+    Veriyi bir kez segmentlere ayırır ve her versiyon için yalnızca versiyona bağlı adımları
+    (dolgu, Reed-Solomon blokları, yerleştirme ve maske seçimi) yapar. Sonuç qrcode.QRCode.make(fit=True)
+    ile modül modül aynıdır.
+    """
+    def __init__(self, data: str, error_correction: int = constants.ERROR_CORRECT_M, border: int = 4):
+        self.error_correction = error_correction
+        self.border = border
+        self.data_list = list(util.optimal_data_chunks(data, minimum=SEGMENT_OPTIMIZE_LENGTH))
+        self._fitted_versions = {}
+        self._segment_bits = {}
+
+    def fit_version(self, version: int = 1) -> int:
+        """
+        Verinin sığdığı, verilen versiyondan büyük veya eşit en küçük versiyonu bulur.
+
+        Args:
+            version (int): Başlangıç versiyonu.
+
+        Returns:
+            int: Kullanılacak versiyon.
+
+        Raises:
+            qrcode.exceptions.DataOverflowError: Veri en büyük versiyona bile sığmıyorsa.
+        """
+        if version not in self._fitted_versions:
+            qr = qrcode.QRCode(error_correction=self.error_correction)
+            qr.data_list = self.data_list
+            self._fitted_versions[version] = qr.best_fit(start=version)
+        return self._fitted_versions[version]
+
+    @property
+    def min_version(self) -> int:
+        return self.fit_version(1)
+
+    def encode_segments(self, version: int) -> Tuple[bytes, int]:
+        """
+        Segmentlerin bit dizisini döndürür. Versiyona yalnızca uzunluk alanlarının genişliği üzerinden
+        bağlı olduğundan (1-9, 10-26, 27-40) en fazla üç kez oluşturulur.
+
+        Args:
+            version (int): QR kod versiyonu.
+
+        Returns:
+            Tuple[bytes, int]: Bit dizisinin baytları (son bayt sıfırla tamamlanmış) ve bit uzunluğu.
+        """
+        length_bits = tuple(util.length_in_bits(segment.mode, version) for segment in self.data_list)
+        if length_bits not in self._segment_bits:
+            buffer = util.BitBuffer()
+            for segment, bits in zip(self.data_list, length_bits):
+                buffer.put(segment.mode, 4)
+                buffer.put(len(segment), bits)
+                segment.write(buffer)
+            self._segment_bits[length_bits] = (bytes(buffer.buffer), len(buffer))
+        return self._segment_bits[length_bits]
+
+    def create_codewords(self, version: int) -> np.ndarray:
+        """
+        qrcode.util.create_data ile aynı kod sözcüklerini üretir: bitiş işareti, bayt hizalama, dolgu baytları
+        ve araya karıştırılmış Reed-Solomon blokları.
+
+        Args:
+            version (int): QR kod versiyonu.
+
+        Returns:
+            np.ndarray: Yerleştirilecek kod sözcükleri.
+
+        Raises:
+            qrcode.exceptions.DataOverflowError: Veri bu versiyona sığmıyorsa.
+        """
+        segment_bytes, bit_length = self.encode_segments(version)
+        rs_blocks = base.rs_blocks(version, self.error_correction)
+        data_count = sum(block.data_count for block in rs_blocks)
+        if bit_length > data_count * 8:
+            raise exceptions.DataOverflowError(
+                "Code length overflow. Data size (%s) > size available (%s)" % (bit_length, data_count * 8))
+
+        # Bitiş işareti (en fazla dört 0) ve bayt hizalama, sıfırla tamamlanmış son baytta zaten vardır
+        used_bytes = (min(bit_length + 4, data_count * 8) + 7) // 8
+        data = np.empty(data_count, dtype=np.uint8)
+        data[:used_bytes] = np.frombuffer(segment_bytes.ljust(used_bytes, b"\0")[:used_bytes], dtype=np.uint8)
+        data[used_bytes:] = np.resize(np.array(PAD_CODEWORDS, dtype=np.uint8), data_count - used_bytes)
+
+        # Bloklara böl ve hata düzeltme baytlarını tüm bloklar için birlikte hesapla
+        offsets = np.cumsum([0] + [block.data_count for block in rs_blocks])
+        data_blocks = [data[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+        ec_count = rs_blocks[0].total_count - rs_blocks[0].data_count
+        aligned = np.zeros((len(rs_blocks), max(len(block) for block in data_blocks)), dtype=np.uint8)
+        for index, block in enumerate(data_blocks):
+            aligned[index, aligned.shape[1] - len(block):] = block
+        ec_blocks = list(calculate_ec_codewords(aligned, ec_count))
+        return np.concatenate([interleave_blocks(data_blocks), interleave_blocks(ec_blocks)])
+
+    def encode(self, version: int) -> QRSymbol:
+        """
+        Veriyi verilen versiyonda (sığmazsa sığdığı ilk versiyonda) QR kod sembolüne dönüştürür.
+        Sekiz maskenin hepsi vektörel olarak yerleştirilip puanlanır ve en düşük cezalı olan seçilir.
+
+        Args:
+            version (int): İstenen QR kod versiyonu.
+
+        Returns:
+            QRSymbol: Kodlanmış sembol.
+        """
+        version = self.fit_version(version)
+        template = create_symbol_template(version, self.error_correction)
+        rows, cols = template.data_positions
+
+        codewords = self.create_codewords(version)
+        bits = np.zeros(len(rows), dtype=bool)
+        data_bits = np.unpackbits(codewords).astype(bool)[:len(rows)]
+        bits[:len(data_bits)] = data_bits
+        masked_bits = bits ^ template.masks
+
+        # Tüm maskeler için test sembollerini tek seferde oluştur ve puanla
+        candidates = np.repeat(template.function_modules[np.newaxis], 8, axis=0)
+        candidates[:, rows, cols] = masked_bits
+        mask_pattern = int(np.argmin([calculate_lost_point(candidate) for candidate in candidates]))
+
+        modules = template.format_modules[mask_pattern].copy()
+        modules[rows, cols] = masked_bits[mask_pattern]
+        return QRSymbol(version, modules.tolist(), self.border)
+
+@lru_cache(maxsize=256)
+def get_encoder(data: str) -> QREncoder:
+    """
+    Verinin kodlayıcısını döndürür. Aynı veri için tüm versiyonlar aynı segmentleri kullanır.
+
+    Args:
+        data (str): QR kodunda kodlanacak veri.
+
+    Returns:
+        QREncoder: Veriye ait kodlayıcı.
+    """
+    return QREncoder(data)
@@ -0,0 +1,37 @@
+class CategorizedError(ValueError):
+    """
+    İzleme araçlarında gruplanacak kategorisi hatanın kaynağında belirlenen hata. ValueError alt sınıfı olduğu
+    için mevcut "except ValueError" blokları ve sunucunun 400 yanıtı değişmez; kategori mesajın metnine bağlı
+    değildir.
+    """
+    category = "internal"
+
+class TitleError(CategorizedError):
+    """
+    Başlık metni yerleştirilemediğinde (okunamayacak kadar küçük, geçersiz yazı tipi boyutu) fırlatılır.
+    """
+    category = "title"
+
+class ColorError(CategorizedError):
+    """
+    Renk adı veya kodu çözümlenemediğinde fırlatılır.
+    """
+    category = "color"
+
+class ManifestError(CategorizedError):
+    """
+    Toplu moddaki bir manifest satırı ayrıştırılamadığında veya zorunlu alanları içermediğinde fırlatılır.
+    """
+    category = "manifest"
+
+class ArchiveError(CategorizedError):
+    """
+    Arşiv çıktısı yazılamadığında fırlatılır.
+    """
+    category = "archive"
+
+class FormatError(CategorizedError):
+    """
+    Çıktı formatı veya kodlama ön ayarı bilinmediğinde ya da görüntü bu formatta kaydedilemediğinde fırlatılır.
+    """
+    category = "format"
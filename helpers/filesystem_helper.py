@@ -1,8 +1,158 @@
+import io
 import os
+import shutil
 from PIL import Image
-from typing import Union
+from typing import Tuple, Union, Optional
 from .string_helper import create_versioned_filename
-def save_qr_image(background: Union[Image.Image, object], output_file: str, version: int, output_format: str) -> None:
+from .canvas_helper import index_rgb_image
+from .error_helper import FormatError
+from .profile_helper import span
+
+# Dosya uzantısı Pillow'daki format adından farklı olan formatlar
+IMAGE_FORMAT_NAMES = {"jpg": "JPEG", "tif": "TIFF"}
+
+# Kodlama ön ayarları: Pillow format adına göre save seçenekleri ve palet kipi.
+# "default" Pillow varsayılanlarıdır. palette "exact" ise en fazla 256 renkli görüntüler kayıpsız olarak
+# palet (P) kipine çevrilir; "quantize" ise daha fazla renkli görüntüler de 256 renge indirgenir.
+# Palette 2, 4 veya 16 renk varsa PNG 1, 2 veya 4 bit derinlikle yazılır.
+ENCODE_PRESETS = {
+    "default": {},
+    "fast": {"PNG": {"compress_level": 1},
+             "JPEG": {"quality": 85},
+             "WEBP": {"lossless": True, "quality": 0, "method": 0}},
+    "balanced": {"palette": "exact",
+                 "PNG": {"compress_level": 6},
+                 "JPEG": {"quality": 90},
+                 "WEBP": {"lossless": True, "quality": 80, "method": 4}},
+    "small": {"palette": "quantize",
+              "PNG": {"compress_level": 9, "optimize": True},
+              "JPEG": {"quality": 80, "optimize": True},
+              "WEBP": {"lossless": True, "quality": 90, "method": 5}},
+}
+
+# Palet kipinden yararlanan formatlar (WebP kayıpsız kodlayıcı paleti kendisi de kullanır)
+PALETTE_FORMATS = {"PNG", "GIF", "BMP", "TIFF", "WEBP"}
+
+def get_image_format_name(output_format: str) -> str:
+    """
+    Çıktı formatını (dosya uzantısı) Pillow'un beklediği format adına dönüştürür.
+
+    Args:
+        output_format (str): Çıktı formatı (örn. 'png', 'jpg').
+
+    Returns:
+        str: Pillow format adı (örn. 'PNG', 'JPEG').
+    """
+    output_format = output_format.lower()
+    return IMAGE_FORMAT_NAMES.get(output_format, output_format.upper())
+
+def get_encode_preset(preset: str) -> dict:
+    """
+    Kodlama ön ayarını döndürür.
+
+    Args:
+        preset (str): Ön ayar adı (default, fast, balanced, small).
+
+    Returns:
+        dict: Ön ayarın seçenekleri.
+
+    Raises:
+        ValueError: Ön ayar bilinmiyorsa.
+    """
+    if preset not in ENCODE_PRESETS:
+        raise FormatError(f"Bilinmeyen kodlama ön ayarı: {preset} ({', '.join(ENCODE_PRESETS)} olmalı)")
+    return ENCODE_PRESETS[preset]
+
+def to_palette_image(image: Image.Image, quantize: bool = False) -> Image.Image:
+    """
+    RGB görüntüyü palet (P) kipine çevirir. Görüntüde en fazla 256 renk varsa dönüşüm kayıpsızdır ve
+    palet yalnızca kullanılan renklerden oluşur; böylece PNG daha düşük bit derinliğiyle yazılabilir.
+
+    Args:
+        image (Image.Image): Çevrilecek görüntü.
+        quantize (bool): True ise 256'dan fazla renkli görüntüler 256 renge indirgenir,
+            False ise olduğu gibi döndürülür.
+
+    Returns:
+        Image.Image: Palet kipindeki görüntü (çevrilemiyorsa veya zaten P kipindeyse orijinal görüntü).
+    """
+    if image.mode == "L":
+        image = image.convert("RGB")
+    if image.mode != "RGB":
+        return image
+    colors = image.getcolors(256)
+    if colors is None:
+        return image.quantize(256, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE) if quantize else image
+    # En sık kullanılan renk ilk indekse gelir
+    return index_rgb_image(image, [color for _, color in sorted(colors, reverse=True)])
+
+def prepare_qr_image(image: Union[Image.Image, object], output_format: str, preset: str = "default") -> Tuple[Union[Image.Image, object], dict]:
+    """
+    Görüntüyü kodlama ön ayarına göre hazırlar ve Pillow'un save fonksiyonuna verilecek seçenekleri döndürür.
+
+    Args:
+        image (Union[Image.Image, object]): Kodlanacak görüntü (PIL Image veya VectorImage).
+        output_format (str): Çıktı formatı (örn. 'png', 'jpg').
+        preset (str): Kodlama ön ayarı.
+
+    Returns:
+        Tuple[Union[Image.Image, object], dict]: Hazırlanmış görüntü ve save seçenekleri.
+
+    Raises:
+        ValueError: Ön ayar bilinmiyorsa.
+    """
+    options = get_encode_preset(preset)
+    if not isinstance(image, Image.Image):
+        return image, {}
+    format_name = get_image_format_name(output_format)
+    if options.get("palette") and format_name in PALETTE_FORMATS:
+        image = to_palette_image(image, options["palette"] == "quantize")
+    elif image.mode in ("P", "L"):
+        # Palet kipindeki tuval, ön ayar palet kullanmıyorsa RGB olarak kodlanır
+        image = image.convert("RGB")
+    return image, options.get(format_name, {})
+
+def encode_qr_image(image: Union[Image.Image, object], output_format: str, preset: str = "default") -> bytes:
+    """
+    QR kod görüntüsünü diske yazmadan, bellekte verilen formatta kodlar.
+
+    Args:
+        image (Union[Image.Image, object]): Kodlanacak görüntü (PIL Image veya VectorImage).
+        output_format (str): Çıktı formatı (örn. 'png', 'jpg', 'svg').
+        preset (str): Kodlama ön ayarı (default, fast, balanced, small).
+
+    Returns:
+        bytes: Kodlanmış görüntü.
+
+    Raises:
+        ValueError: Format veya ön ayar bilinmiyorsa.
+    """
+    with span("encode", output_format=output_format, preset=preset):
+        image, options = prepare_qr_image(image, output_format, preset)
+        buffer = io.BytesIO()
+        try:
+            image.save(buffer, format=get_image_format_name(output_format), **options)
+        except KeyError:
+            raise FormatError(f"Bilinmeyen çıktı formatı: {output_format}")
+        return buffer.getvalue()
+
+def remove_existing_output(versioned_output: str) -> None:
+    """
+    Önceki bir çalıştırmadan kalan çıktı dosyasını siler. Aynı QR kodu üreten versiyonlar birbirine sabit
+    bağlantıyla bağlandığından dosyanın üzerine yazmak bağlı tüm dosyaları değiştirirdi; yeni içerik her zaman
+    yeni bir dosyaya yazılır.
+
+    Args:
+        versioned_output (str): Çıktı dosyasının yolu.
+
+    Returns:
+        None
+    """
+    if os.path.lexists(versioned_output):
+        os.remove(versioned_output)
+
+def save_qr_image(background: Union[Image.Image, object], output_file: str, version: int, output_format: str,
+                  output_dir: str = None, preset: str = "default", verbose: bool = True) -> Optional[str]:
     """
     QR kod görüntüsünü belirtilen formatta ve sürüm numarasıyla kaydeder.
 
@@ -11,19 +161,89 @@ def save_qr_image(background: Union[Image.Image, object], output_file: str, vers
         output_file (str): Kaydedilecek dosyanın yolu ve adı.
         version (int): QR kod sürüm numarası.
         output_format (str): Çıktı dosyasının formatı (örn. 'png', 'jpg').
+        output_dir (str, optional): Önceden oluşturulmuş çıktı dizini. Verilmezse oluşturulur.
+        preset (str): Kodlama ön ayarı (default, fast, balanced, small).
+        verbose (bool): False ise başarıyla kaydedilen dosya için mesaj yazdırılmaz.
 
     Returns:
-        None: Fonksiyon bir değer döndürmez, ancak dosya sisteminde bir görüntü oluşturur.
+        Optional[str]: Kaydedilen dosyanın yolu, kaydedilemediyse None.
     """
-    output_dir = create_output_directory(output_file)
+    output_dir = output_dir or create_output_directory(output_file)
     versioned_output = create_versioned_filename(output_file, version, output_format, output_dir)
 
     try:
-        background.save(versioned_output)
-        print(f"QR kod versiyonu {version} başarıyla oluşturuldu ve {versioned_output} olarak kaydedildi.")
+        background, options = prepare_qr_image(background, output_format, preset)
+        remove_existing_output(versioned_output)
+        background.save(versioned_output, **options)
+        if verbose:
+            print(f"QR kod versiyonu {version} başarıyla oluşturuldu ve {versioned_output} olarak kaydedildi.")
+        return versioned_output
     except ValueError as e:
         print(f"Hata: {e}")
         print(f"QR kod versiyonu {version} kaydedilemedi. Lütfen geçerli bir format belirtin.")
+        return None
+
+def save_encoded_qr_image(content: Optional[bytes], output_file: str, version: int, output_format: str,
+                          output_dir: str = None, source_file: str = None, cached: bool = False,
+                          verbose: bool = True) -> str:
+    """
+    Önceden kodlanmış bir görüntüyü sürüm numarasıyla kaydeder. content verilmezse içerik source_file'dan
+    (oluşturma önbelleğindeki dosya gibi) kopyalanır. Önbellek dosyasına bağlantı oluşturulmaz; çıktının
+    üzerine sonradan yazılması önbellekteki girdiyi değiştirmez.
+
+    Args:
+        content (Optional[bytes]): Kodlanmış görüntü (source_file verilmişse None olabilir).
+        output_file (str): Kaydedilecek dosyanın yolu ve adı.
+        version (int): QR kod sürüm numarası.
+        output_format (str): Çıktı dosyasının formatı.
+        output_dir (str, optional): Önceden oluşturulmuş çıktı dizini. Verilmezse oluşturulur.
+        source_file (str, optional): İçeriği aynı olan, content verilmezse kopyalanacak dosya.
+        cached (bool): Görüntü önbellekten mi geldi (yalnızca mesaj için).
+        verbose (bool): False ise kaydedilen dosya için mesaj yazdırılmaz.
+
+    Returns:
+        str: Kaydedilen dosyanın yolu.
+    """
+    output_dir = output_dir or create_output_directory(output_file)
+    versioned_output = create_versioned_filename(output_file, version, output_format, output_dir)
+    remove_existing_output(versioned_output)
+    if content is None:
+        shutil.copyfile(source_file, versioned_output)
+    else:
+        with open(versioned_output, "wb") as f:
+            f.write(content)
+    if verbose:
+        action = "önbellekten alındı" if cached else "başarıyla oluşturuldu"
+        print(f"QR kod versiyonu {version} {action} ve {versioned_output} olarak kaydedildi.")
+    return versioned_output
+
+def link_qr_image(source_file: str, output_file: str, version: int, output_format: str, output_dir: str = None,
+                  verbose: bool = True) -> str:
+    """
+    Aynı QR kodu üreten bir versiyon için, zaten kaydedilmiş dosyaya sabit bağlantı (hard link) oluşturur.
+    Dosya sistemi bağlantıyı desteklemiyorsa dosya kopyalanır.
+
+    Args:
+        source_file (str): Kaydedilmiş, içeriği aynı olan dosyanın yolu.
+        output_file (str): Kaydedilecek dosyanın yolu ve adı.
+        version (int): Bağlantının adındaki QR kod sürüm numarası.
+        output_format (str): Çıktı dosyasının formatı.
+        output_dir (str, optional): Önceden oluşturulmuş çıktı dizini. Verilmezse oluşturulur.
+        verbose (bool): False ise bağlantı için mesaj yazdırılmaz.
+
+    Returns:
+        str: Oluşturulan bağlantının yolu.
+    """
+    output_dir = output_dir or create_output_directory(output_file)
+    versioned_output = create_versioned_filename(output_file, version, output_format, output_dir)
+    remove_existing_output(versioned_output)
+    try:
+        os.link(source_file, versioned_output)
+    except OSError:
+        shutil.copyfile(source_file, versioned_output)
+    if verbose:
+        print(f"QR kod versiyonu {version}, {os.path.basename(source_file)} ile aynı olduğundan {versioned_output} olarak bağlandı.")
+    return versioned_output
 
 def create_output_directory(output_file: str) -> str:
     """
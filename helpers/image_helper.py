@@ -1,9 +1,9 @@
 import io
 from PIL import Image, ImageFont, ImageDraw, ImageChops, ImageOps
-import cairosvg
-from typing import List, Tuple
+from typing import List, Tuple, Union
 from .math_helper import calculate_dimensions
-import emoji
+from .text_helper import TitleLayout, load_font
+from .profile_helper import span
 def load_logos(image_files: list, logo_max_size: int) -> list:
     """
     Verilen dosya yollarından logo görüntülerini yükler ve boyutlandırır.
@@ -15,34 +15,23 @@ def load_logos(image_files: list, logo_max_size: int) -> list:
     Returns:
         list: Yüklenmiş ve boyutlandırılmış logo görüntülerinin listesi.
     """
-    logos = []
-    for image_file in image_files or []:
-        if image_file.lower().endswith('.svg'):
-            png_data = cairosvg.svg2png(url=image_file)
-            logo_img = Image.open(io.BytesIO(png_data))
-        else:
-            logo_img = Image.open(image_file)
-        
-        ratio = min(logo_max_size / logo_img.width, logo_max_size / logo_img.height)
-        new_size = (int(logo_img.width * ratio), int(logo_img.height * ratio))
-        logos.append(logo_img.resize(new_size, Image.LANCZOS))
-    return logos
+    return [load_logo(image_file, logo_max_size) for image_file in image_files or []]
 
-def load_font(font_size: int, scale_factor: float) -> ImageFont:
+def load_logo(image_file: str, logo_max_size: int) -> Image.Image:
     """
-    Belirtilen boyutta bir font yükler.
+    Tek bir logo dosyasını yükler (SVG ise PNG'ye dönüştürür) ve oranını koruyarak boyutlandırır.
 
     Args:
-        font_size (int): Yüklenecek fontun boyutu.
-        scale_factor (float): Font boyutunu ölçeklendirmek için kullanılacak faktör.
+        image_file (str): Logo dosyasının yolu.
+        logo_max_size (int): Logonun maksimum boyutu (piksel cinsinden).
 
     Returns:
-        ImageFont: Yüklenen font nesnesi.
+        Image.Image: Yüklenmiş ve boyutlandırılmış logo görüntüsü.
     """
-    try:
-        return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", int(font_size * scale_factor))
-    except IOError:
-        return ImageFont.load_default()
+    logo_img = process_logo(image_file)
+    ratio = min(logo_max_size / logo_img.width, logo_max_size / logo_img.height)
+    new_size = (int(logo_img.width * ratio), int(logo_img.height * ratio))
+    return logo_img.resize(new_size, Image.LANCZOS)
 
 def svg_to_png(svg_file: str) -> Image:
     """
@@ -54,7 +43,10 @@ def svg_to_png(svg_file: str) -> Image:
     Returns:
         Image: Dönüştürülmüş PNG görüntüsü.
     """
-    png_data = cairosvg.svg2png(url=svg_file)
+    # cairosvg (ve cairo/cffi yığını) yalnızca SVG logo kullanıldığında yüklenir
+    import cairosvg
+    with span("svg_to_png"):
+        png_data = cairosvg.svg2png(url=svg_file)
     return Image.open(io.BytesIO(png_data))
 
 def resize_qr_image(qr_image: Image.Image, resolution: int) -> Image.Image:
@@ -73,14 +65,39 @@ def resize_qr_image(qr_image: Image.Image, resolution: int) -> Image.Image:
     return qr_image.resize(new_size, Image.LANCZOS)
 
 
-def add_logo_to_qr(qr_image: Image.Image, logo_path: str, logo_size: float, is_circle: bool = True,
+def pad_image_to_size(image: Image.Image, size: int, fill_color: tuple) -> Image.Image:
+    """
+    Görüntüyü ortalayarak verilen boyutta kare bir tuvale yerleştirir; kalan alan fill_color ile doldurulur.
+
+    Args:
+        image (Image.Image): Genişletilecek görüntü.
+        size (int): Hedef kenar uzunluğu (piksel).
+        fill_color (tuple): Eklenen kenarların rengi.
+
+    Returns:
+        Image.Image: size x size boyutlu görüntü. P kipindeki görüntüler paletiyle birlikte genişletilir;
+        fill_color paletde bulunmalıdır.
+    """
+    if image.mode == "P":
+        palette = image.getpalette("RGB")
+        fill_index = [tuple(palette[i:i + 3]) for i in range(0, len(palette), 3)].index(tuple(fill_color))
+        canvas = Image.new("P", (size, size), fill_index)
+        canvas.putpalette(palette)
+        canvas.paste(image, ((size - image.width) // 2, (size - image.height) // 2))
+        return canvas
+
+    canvas = Image.new(image.mode, (size, size), fill_color)
+    canvas.paste(image, ((size - image.width) // 2, (size - image.height) // 2))
+    return canvas
+
+def add_logo_to_qr(qr_image: Image.Image, logo: Union[str, Image.Image], logo_size: float, is_circle: bool = True,
                     border_size: float = 0.0, border_color: str = "white") -> Image.Image:
     """
     QR kod görüntüsünün merkezine logo ekler. Logo daire veya kare olarak eklenebilir.
 
     Args:
         qr_image (Image.Image): Orijinal QR kod görüntüsü.
-        logo_path (str): Eklenecek logo dosyasının yolu.
+        logo (Union[str, Image.Image]): Eklenecek logo dosyasının yolu ya da önceden açılıp kırpılmış logo görüntüsü.
         logo_size (float): Logo boyutu (0-1 arasında bir oran).
         is_circle (bool): Logo daire mi olsun, kare mi. Varsayılan True (daire).
         border_size (float): Logo etrafındaki kenarlık boyutu.
@@ -89,19 +106,36 @@ def add_logo_to_qr(qr_image: Image.Image, logo_path: str, logo_size: float, is_c
     Returns:
         Image.Image: Logo eklenmiş QR kod görüntüsü.
     """
+    if not isinstance(logo, Image.Image):
+        # Logo dosyasını aç, işle ve etrafındaki beyazlıkları hafifçe kırp
+        logo = trim_logo(process_logo(logo))
 
-    # Logo dosyasını aç ve işle
-    logo = process_logo(logo_path)
+    overlay = create_center_logo_overlay(logo, min(qr_image.size), logo_size, is_circle, border_size, border_color)
+    paste_center_logo(qr_image, overlay)
+    return qr_image
 
-    # Logo etrafındaki beyazlıkları hafifçe kırp
-    logo = trim_logo(logo)
+def create_center_logo_overlay(logo: Image.Image, qr_size: int, logo_size: float, is_circle: bool = True,
+                               border_size: float = 0.0, border_color: str = "white") -> Image.Image:
+    """
+    Merkez logoyu QR kodun boyutuna göre küçültür, kenarlığını ekler ve gerekirse daire şeklinde maskeler.
+    Sonuç yalnızca QR kod boyutuna bağlı olduğundan aynı çözünürlükteki tüm versiyonlarda yeniden kullanılabilir.
 
+    Args:
+        logo (Image.Image): Açılmış ve kırpılmış logo görüntüsü (yerinde değiştirilmez).
+        qr_size (int): QR kod görüntüsünün kısa kenarı (piksel cinsinden).
+        logo_size (float): Logo boyutu (0-1 arasında bir oran).
+        is_circle (bool): Logo daire mi olsun, kare mi.
+        border_size (float): Logo etrafındaki kenarlık boyutu.
+        border_color (str): Logo etrafındaki kenarlık rengi.
+
+    Returns:
+        Image.Image: QR kodun ortasına yapıştırılmaya hazır RGBA logo görüntüsü.
+    """
     # QR kodunun boyutunun %logo_size'ını hesapla
-    qr_width, qr_height = qr_image.size
-    max_logo_size = int(min(qr_width, qr_height) * logo_size)
+    max_logo_size = int(qr_size * logo_size)
 
-    # Logo boyutunu oranları koruyarak yeniden boyutlandır
-    logo.thumbnail((max_logo_size, max_logo_size), Image.LANCZOS)
+    # Logo boyutunu oranları koruyarak yeniden boyutlandır (küçük logolar da bu boyuta büyütülür)
+    logo = ImageOps.contain(logo, (max_logo_size, max_logo_size), Image.LANCZOS)
 
     # Beyaz arka planlı yeni bir resim oluştur
     border_size = int(logo.width * border_size)  # Kenar boşluğu (border_size oranında)
@@ -120,13 +154,22 @@ def add_logo_to_qr(qr_image: Image.Image, logo_path: str, logo_size: float, is_c
         # Maskeyi arka plana uygula
         background.putalpha(mask)
 
-    # Logoyu merkeze yerleştirmek için pozisyonu hesapla
-    pos = ((qr_width - new_size[0]) // 2, (qr_height - new_size[1]) // 2)
+    return background
 
-    # Logoyu QR koda ekle
-    qr_image.paste(background, pos, mask=background if background.mode == 'RGBA' else None)
+def paste_center_logo(qr_image: Image.Image, overlay: Image.Image) -> None:
+    """
+    Hazırlanmış merkez logoyu QR kod görüntüsünün ortasına yapıştırır.
 
-    return qr_image
+    Args:
+        qr_image (Image.Image): QR kod görüntüsü (yerinde değiştirilir).
+        overlay (Image.Image): create_center_logo_overlay ile hazırlanmış logo.
+
+    Returns:
+        None: Fonksiyon bir değer döndürmez, ancak QR kod görüntüsünü değiştirir.
+    """
+    qr_width, qr_height = qr_image.size
+    pos = ((qr_width - overlay.width) // 2, (qr_height - overlay.height) // 2)
+    qr_image.paste(overlay, pos, mask=overlay)
 
 
 
@@ -205,7 +248,29 @@ def create_empty_background(background_color: str, width: int, height: int, titl
     return Image.new('RGB', (width, total_height), color=background_color)
 
 
-def create_background(qr_img: Image.Image, title: str, background_color: str, scale_factor: float, prepare_title_text: callable) -> Tuple[Image.Image, List[str], int, int, int, ImageFont.ImageFont]:
+def calculate_background_layout(img_w: int, img_h: int, title: str, scale_factor: float,
+                                prepare_title_text: callable) -> Tuple[TitleLayout, int, int]:
+    """
+    Arka plan oluşturmadan başlık yerleşimini, logo alanının yüksekliğini ve boşluğu hesaplar.
+
+    Args:
+        img_w (int): QR kod görüntüsünün genişliği.
+        img_h (int): QR kod görüntüsünün yüksekliği.
+        title (str): Eklenecek başlık metni.
+        scale_factor (float): Ölçeklendirme faktörü.
+        prepare_title_text (callable): Başlık metnini hazırlayıp TitleLayout döndüren fonksiyon.
+
+    Returns:
+        Tuple[TitleLayout, int, int]: Başlık yerleşimi, maksimum logo boyutu ve boşluk.
+    """
+    margin, max_title_height, spacing, logo_max_size = calculate_dimensions(scale_factor, img_h)
+    max_title_width = img_w - 2 * margin
+
+    # Başlık metnini hazırla (aynı başlık ve kutu için önbellekten gelir)
+    layout = prepare_title_text(title, max_title_width, max_title_height, scale_factor)
+    return layout, logo_max_size, spacing
+
+def create_background(qr_img: Image.Image, title: str, background_color: str, scale_factor: float, prepare_title_text: callable) -> Tuple[Image.Image, TitleLayout, int, int]:
     """
     QR kodu ve başlık için arka plan oluşturur.
 
@@ -214,27 +279,23 @@ def create_background(qr_img: Image.Image, title: str, background_color: str, sc
         title (str): Eklenecek başlık metni.
         background_color (str): Arka plan rengi.
         scale_factor (float): Ölçeklendirme faktörü.
-        prepare_title_text (callable): Başlık metnini hazırlayan fonksiyon.
+        prepare_title_text (callable): Başlık metnini hazırlayıp TitleLayout döndüren fonksiyon.
 
     Returns:
-        Tuple[Image.Image, List[str], int, int, int, ImageFont.ImageFont]: 
-        Arka plan görüntüsü, sarılmış metin, başlık yüksekliği, maksimum logo boyutu, boşluk ve font.
+        Tuple[Image.Image, TitleLayout, int, int]: 
+        Arka plan görüntüsü, başlık yerleşimi, maksimum logo boyutu ve boşluk.
     """
     # QR kod görüntüsünün boyutlarını al
     img_w, img_h = qr_img.size
-    
-    # Boyutları hesapla
-    margin, max_title_height, spacing, logo_max_size = calculate_dimensions(scale_factor, img_h)
-    max_title_width = img_w - 2 * margin
 
-    # Başlık metnini hazırla
-    font, wrapped_text, title_height = prepare_title_text(title, max_title_width, max_title_height, scale_factor)
+    # Başlık yerleşimini ve boyutları hesapla
+    layout, logo_max_size, spacing = calculate_background_layout(img_w, img_h, title, scale_factor, prepare_title_text)
 
     # Beyaz arka planı oluştur
-    background = create_empty_background(background_color, img_w, img_h, title_height, spacing, logo_max_size)
+    background = create_empty_background(background_color, img_w, img_h, layout.height, spacing, logo_max_size)
 
     # Sonuçları döndür
-    return background, wrapped_text, title_height, logo_max_size, spacing, font
+    return background, layout, logo_max_size, spacing
 
 
 def paste_logos(background: Image.Image, logos: List[Image.Image], logo_max_size: int, logo_spacing: int) -> None:
@@ -313,15 +374,14 @@ def paste_logo(background: Image.Image, logo: Image.Image, position: tuple) -> N
     """
     background.paste(logo, position, logo if logo.mode == 'RGBA' else None)
 
-def draw_title(background: Image.Image, wrapped_text: List[str], font: ImageFont.ImageFont,
-               logo_max_size: int, spacing: int, title_color: str = "black") -> None:
+def draw_title(background: Image.Image, layout: TitleLayout, logo_max_size: int, spacing: int,
+               title_color: str = "black") -> None:
     """
     Arka plan görüntüsüne başlık metnini çizer (emoji desteği ile).
 
     Args:
         background (Image.Image): Metnin çizileceği arka plan görüntüsü.
-        wrapped_text (List[str]): Çizilecek metin satırlarının listesi.
-        font (ImageFont.ImageFont): Kullanılacak font (emoji desteği olan).
+        layout (TitleLayout): Sarılmış, emojileri genişletilmiş ve ölçülmüş başlık.
         logo_max_size (int): Logoların maksimum boyutu (metin konumlandırması için kullanılır).
         spacing (int): Metin ile logolar arasındaki boşluk miktarı.
         title_color (str): Metin rengi.
@@ -333,12 +393,9 @@ def draw_title(background: Image.Image, wrapped_text: List[str], font: ImageFont
     bg_width = background.size[0]
     start_y = calculate_start_y(logo_max_size, spacing)
     
-    for line in wrapped_text:
-        # Emoji kısayollarını gerçek emoji karakterlerine dönüştür
-        line_with_emoji = emoji.emojize(line, language='alias')
-        line_width, line_height = calculate_line_dimensions(font, line_with_emoji)
+    for line, (line_width, line_height) in zip(layout.lines, layout.line_sizes):
         x_position = calculate_x_position(bg_width, line_width)
-        draw_text_line(draw, line_with_emoji, font, x_position, start_y, title_color)
+        draw_text_line(draw, line, layout.font, x_position, start_y, title_color)
         start_y += line_height
 
 def create_draw_object(image: Image.Image) -> ImageDraw.ImageDraw:
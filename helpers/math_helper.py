@@ -46,6 +46,20 @@ def calculate_dimensions(scale_factor: float, img_h: int) -> Tuple[int, int, int
         calculate_logo_max_size(scale_factor)
     )
 
+def calculate_box_size(resolution: int, modules_count: int, border: int) -> int:
+    """
+    Sessiz bölge dahil QR kodun verilen genişliğe sığacağı en büyük tam sayı modül boyutunu hesaplar.
+
+    Args:
+        resolution (int): Hedef genişlik (piksel).
+        modules_count (int): QR kodun bir kenarındaki modül sayısı.
+        border (int): Sessiz bölge genişliği (modül cinsinden).
+
+    Returns:
+        int: Modül boyutu (en az 1 piksel).
+    """
+    return max(1, resolution // (modules_count + 2 * border))
+
 def calculate_margin(scale_factor: float) -> int:
     """
     Kenar boşluğunu hesaplar.
@@ -93,3 +107,17 @@ def calculate_logo_max_size(scale_factor: float) -> int:
         int: Hesaplanan maksimum logo boyutu.
     """
     return int(50 * scale_factor)
+
+def calculate_max_canvas_bytes(resolution: int, scale_factor: float) -> int:
+    """
+    Başlıklı QR kod tuvalinin RGB kipinde kaplayabileceği en fazla bellek miktarını hesaplar.
+
+    Args:
+        resolution (int): QR kodunun çözünürlüğü (piksel cinsinden).
+        scale_factor (float): Metin ölçeklendirme faktörü.
+
+    Returns:
+        int: Bayt cinsinden üst sınır.
+    """
+    band_height = calculate_max_title_height(scale_factor) + calculate_spacing(scale_factor) + calculate_logo_max_size(scale_factor)
+    return resolution * (resolution + band_height) * 3
@@ -0,0 +1,250 @@
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, Iterator, Tuple
+from .asset_helper import SharedAssets
+from .profile_helper import SpanRecorder, get_recorder, set_recorder, job_context
+
+# İşçi süreçte paylaşılan varlıklar; havuz başlatılırken bir kez doldurulur
+_worker_assets = None
+
+def _init_worker(assets: SharedAssets, profile: bool = False) -> None:
+    """
+    İşçi süreç başlatıcısı. Paylaşılan varlıklar her göreve değil, her işçiye yalnızca bir kez gönderilir.
+
+    Args:
+        assets (SharedAssets): İşçi süreçte saklanacak varlıklar.
+        profile (bool): True ise işçide span'ler kaydedilir ve görev sonucuyla birlikte geri gönderilir.
+
+    Returns:
+        None
+    """
+    global _worker_assets
+    _worker_assets = assets
+    if profile:
+        set_recorder(SpanRecorder())
+
+def cached_result(value: Any, assets: SharedAssets = None) -> Any:
+    """
+    Sonucu önceden bilinen (örneğin önbellekten gelen) görevler için kullanılır. Bu fonksiyonla gönderilen
+    görevler işçiye gönderilmez; sonuç gönderim sırasındaki yerini koruyarak hemen döndürülür.
+
+    Args:
+        value (Any): Görevin sonucu.
+        assets (SharedAssets, optional): Kullanılmaz.
+
+    Returns:
+        Any: value.
+    """
+    return value
+
+def _call_with_worker_assets(fn: Callable, args: tuple, kwargs: dict) -> Any:
+    """
+    Görevi işçi süreçteki paylaşılan varlıklarla çalıştırır.
+
+    Args:
+        fn (Callable): Modül seviyesinde tanımlı, assets anahtar argümanı alan fonksiyon.
+        args (tuple): Konumsal argümanlar.
+        kwargs (dict): Anahtar argümanlar.
+
+    Returns:
+        Any: Fonksiyonun sonucu.
+    """
+    return fn(*args, assets=_worker_assets, **kwargs)
+
+def _call_profiled_with_worker_assets(fn: Callable, args: tuple, kwargs: dict, job: int) -> Tuple[Any, list]:
+    """
+    Görevi işçi süreçte çalıştırır ve sonucu, görev sırasında kaydedilen span'lerle birlikte döndürür.
+
+    Args:
+        fn (Callable): Modül seviyesinde tanımlı, assets anahtar argümanı alan fonksiyon.
+        args (tuple): Konumsal argümanlar.
+        kwargs (dict): Anahtar argümanlar.
+        job (int): Görevin gönderim sırası (span'lere job alanı olarak eklenir).
+
+    Returns:
+        Tuple[Any, list]: Fonksiyonun sonucu ve span kayıtları.
+    """
+    with job_context(job=job):
+        result = fn(*args, assets=_worker_assets, **kwargs)
+    return result, get_recorder().drain()
+
+class RenderPool:
+    """
+    Versiyon ve satır oluşturma görevlerini çalıştıran havuz. workers 1 ise görevler aynı süreçte
+    sırayla çalışır, daha büyükse paylaşılan varlıklar bir kez gönderilerek süreç havuzuna dağıtılır.
+    """
+    def __init__(self, assets: SharedAssets, workers: int = 1):
+        self.assets = assets
+        self.workers = max(1, workers)
+        self.executor = None
+        # Havuz profil açıkken oluşturulduysa işçilerdeki span'ler bu kaydediciye aktarılır
+        self.recorder = get_recorder()
+        if self.workers > 1:
+            # multiprocessing yalnızca paralel çalıştırmada yüklenir
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                initargs=(assets, self.recorder is not None))
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Bir görevi paylaşılan varlıklarla çalıştırılmak üzere gönderir.
+
+        Args:
+            fn (Callable): Modül seviyesinde tanımlı, assets anahtar argümanı alan fonksiyon.
+            *args: Konumsal argümanlar.
+            **kwargs: Anahtar argümanlar.
+
+        Returns:
+            Future: Görevin sonucunu (veya hatasını) taşıyan nesne.
+        """
+        return self._submit(fn, args, kwargs)
+
+    def _submit(self, fn: Callable, args: tuple, kwargs: dict, job: int = None) -> Future:
+        """
+        submit ile aynıdır; profil açıksa görevin span'lerine job alanını ekler ve işçide kaydedilen
+        span'leri görev tamamlandığında havuzu oluşturan sürecin kaydedicisine aktarır.
+
+        Args:
+            fn (Callable): Modül seviyesinde tanımlı, assets anahtar argümanı alan fonksiyon.
+            args (tuple): Konumsal argümanlar.
+            kwargs (dict): Anahtar argümanlar.
+            job (int, optional): Görevin gönderim sırası.
+
+        Returns:
+            Future: Görevin sonucunu (veya hatasını) taşıyan nesne.
+        """
+        if self.executor is not None and fn is not cached_result:
+            if self.recorder is None:
+                return self.executor.submit(_call_with_worker_assets, fn, args, kwargs)
+            return self._submit_profiled(fn, args, kwargs, job)
+
+        future = Future()
+        try:
+            with job_context(job=job):
+                future.set_result(fn(*args, assets=self.assets, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _submit_profiled(self, fn: Callable, args: tuple, kwargs: dict, job: int) -> Future:
+        """
+        Görevi işçiye gönderir; işçiden dönen span'leri kaydediciye ekleyip yalnızca sonucu taşıyan bir Future döndürür.
+
+        Args:
+            fn (Callable): Modül seviyesinde tanımlı, assets anahtar argümanı alan fonksiyon.
+            args (tuple): Konumsal argümanlar.
+            kwargs (dict): Anahtar argümanlar.
+            job (int): Görevin gönderim sırası.
+
+        Returns:
+            Future: Görevin sonucunu (veya hatasını) taşıyan nesne.
+        """
+        future = Future()
+
+        def transfer(worker_future: Future) -> None:
+            if worker_future.cancelled():
+                future.cancel()
+                return
+            try:
+                result, spans = worker_future.result()
+            except Exception as e:
+                future.set_exception(e)
+                return
+            for recorded_span in spans:
+                self.recorder.add(recorded_span)
+            future.set_result(result)
+
+        self.executor.submit(_call_profiled_with_worker_assets, fn, args, kwargs, job).add_done_callback(transfer)
+        return future
+
+    def map_ordered(self, jobs: Iterable[Tuple[Any, Callable, tuple, dict]], window: int = None,
+                    slot_size: int = 0) -> Iterator[Tuple[Any, Future]]:
+        """
+        Görevleri gönderir ve sonuçlarını tamamlanma sırasından bağımsız olarak gönderim sırasıyla döndürür.
+        Aynı anda en fazla window kadar görev bekletilir, böylece bellek kullanımı sınırlı kalır.
+        Fonksiyonu cached_result olan görevler işçiye gönderilmez, sonuçları sıradaki yerinde döndürülür.
+
+        slot_size verilirse ve görevler işçi süreçlerde çalışıyorsa, işçiler oluşturdukları görüntüyü
+        window + 1 yuvalı bir paylaşılan bellek halkasına yazar ve süreçler arasında yalnızca yuva numarası ile
+        boyutlar taşınır; böylece aktarım maliyeti çözünürlükten bağımsız kalır. Bu durumda döndürülen görüntüler
+        yuvanın belleğini kopyalamadan kullanır ve yalnızca bir sonraki sonuç istenene kadar geçerlidir;
+        daha uzun süre saklanacaksa kopyalanmalıdır. Yuvaya sığmayan görüntüler olağan yoldan taşınır.
+
+        Args:
+            jobs (Iterable[Tuple[Any, Callable, tuple, dict]]): (etiket, fonksiyon, argümanlar, anahtar argümanlar) dörtlüleri.
+                Etiket işçiye gönderilmez, yalnızca sonuçla birlikte geri döndürülür.
+            window (int, optional): Aynı anda bekletilecek en fazla görev sayısı. Varsayılan workers * 2.
+            slot_size (int): Paylaşılan bellek halkasındaki yuva boyutu (bayt); 0 ise halka kullanılmaz.
+
+        Yields:
+            Tuple[Any, Future]: Etiket ve görevin sonucunu taşıyan nesne.
+        """
+        window = window or self.workers * 2
+        if not slot_size or self.executor is None:
+            pending = deque()
+            for job, (tag, fn, args, kwargs) in enumerate(jobs):
+                pending.append((tag, self._submit(fn, args, kwargs, job)))
+                if len(pending) >= window:
+                    yield pending.popleft()
+            while pending:
+                yield pending.popleft()
+            return
+
+        # Paylaşılan bellek yalnızca halka kullanıldığında yüklenir
+        from .shm_helper import SharedCanvasRing, render_to_shared_canvas
+        # Bekleyen window - 1 görev ve işlenmekte olan sonuç için en fazla window yuva kullanılır
+        ring = SharedCanvasRing(window + 1, slot_size)
+        pending = deque()
+        try:
+            for job, (tag, fn, args, kwargs) in enumerate(jobs):
+                if fn is cached_result:
+                    pending.append((tag, None, self._submit(fn, args, kwargs, job)))
+                else:
+                    slot = ring.acquire()
+                    pending.append((tag, slot, self._submit(render_to_shared_canvas,
+                                                            (fn, args, ring.name, slot, slot_size), kwargs, job)))
+                if len(pending) >= window:
+                    yield from self._yield_shared(pending.popleft(), ring)
+            while pending:
+                yield from self._yield_shared(pending.popleft(), ring)
+        finally:
+            # Erken çıkışta hâlâ yazan işçiler kendi eşlemelerini kullanır; bellek onlar da bırakınca serbest kalır
+            ring.close()
+
+    def _yield_shared(self, item: Tuple[Any, int, Future], ring: "SharedCanvasRing") -> Iterator[Tuple[Any, Future]]:
+        """
+        Halkaya yazılmış bir görevin sonucunu yuvadaki görüntüyle döndürür ve sonraki sonuç istendiğinde
+        yuvayı geri verir.
+
+        Args:
+            item (Tuple[Any, int, Future]): Etiket, yuva numarası ve görevin sonucu.
+            ring (SharedCanvasRing): Paylaşılan bellek halkası.
+
+        Yields:
+            Tuple[Any, Future]: Etiket ve görüntüyü (veya hatayı) taşıyan nesne.
+        """
+        tag, slot, future = item
+        if slot is None:
+            yield tag, future
+            return
+        try:
+            yield tag, ring.resolve(future)
+        finally:
+            ring.release(slot)
+
+    def close(self) -> None:
+        """
+        Süreç havuzunu kapatır.
+
+        Returns:
+            None
+        """
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def __enter__(self) -> "RenderPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
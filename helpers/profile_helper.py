@@ -0,0 +1,268 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, TextIO
+
+# Etkin kaydedici; None iken span() paylaşılan boş bir nesne döndürür ve hiçbir şey ölçülmez
+_recorder = None
+
+# Açık span'lere eklenecek görev alanları (job, version); iş parçacıkları arasında karışmaz
+_job_fields = ContextVar("job_fields", default={})
+
+class _NullSpan:
+    """
+    Profil kapalıyken kullanılan, hiçbir şey yapmayan span.
+    """
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    """
+    Bir aşamanın başlangıç ve bitiş zamanını ölçüp kaydediciye ileten span.
+    """
+    __slots__ = ("recorder", "name", "fields", "start")
+
+    def __init__(self, recorder: "SpanRecorder", name: str, fields: dict):
+        self.recorder = recorder
+        self.name = name
+        self.fields = fields
+        self.start = 0
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        end = time.perf_counter_ns()
+        self.recorder.record(self.name, self.start, end - self.start, {**_job_fields.get(), **self.fields})
+
+class SpanRecorder:
+    """
+    Tamamlanan span'leri toplayan kaydedici. Her kayıt ad, başlangıç (ns), süre (ns), süreç ve iş parçacığı
+    kimliği ile görev alanlarını (job, version) içerir. callback verilirse her span tamamlandığında çağrılır;
+    paralel çalıştırmada işçilerden gelen span'ler için havuzun iş parçacığından çağrılabilir.
+    """
+    def __init__(self, callback: Callable[[dict], None] = None):
+        self.callback = callback
+        self.spans = []
+        self.origin = time.perf_counter_ns()
+        self.lock = threading.Lock()
+
+    def record(self, name: str, start: int, duration: int, fields: dict) -> None:
+        """
+        Tamamlanmış bir span'i kaydeder.
+
+        Args:
+            name (str): Aşamanın adı.
+            start (int): Başlangıç zamanı (perf_counter_ns).
+            duration (int): Süre (ns).
+            fields (dict): Görev ve span alanları.
+
+        Returns:
+            None
+        """
+        self.add({"name": name, "start_ns": start, "duration_ns": duration, "pid": os.getpid(),
+                  "tid": threading.get_ident(), **fields})
+
+    def add(self, span: dict) -> None:
+        """
+        Hazır bir span kaydını (örneğin işçi süreçten gelen) ekler.
+
+        Args:
+            span (dict): record ile oluşturulmuş kayıt.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.spans.append(span)
+        if self.callback is not None:
+            self.callback(span)
+
+    def drain(self) -> List[dict]:
+        """
+        Kaydedilen span'leri döndürür ve kaydediciyi boşaltır.
+
+        Returns:
+            List[dict]: Span kayıtları.
+        """
+        with self.lock:
+            spans, self.spans = self.spans, []
+        return spans
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Span'leri ada göre toplar.
+
+        Returns:
+            Dict[str, dict]: Her aşama için çağrı sayısı ve toplam süre (ms), toplam süreye göre azalan sırada.
+        """
+        totals = {}
+        for span in self.spans:
+            total = totals.setdefault(span["name"], {"count": 0, "total_ms": 0.0})
+            total["count"] += 1
+            total["total_ms"] += span["duration_ns"] / 1e6
+        return dict(sorted(totals.items(), key=lambda item: -item[1]["total_ms"]))
+
+    def write(self, profile_file: str) -> None:
+        """
+        Span'leri dosyaya yazar. Uzantı .jsonl ise her satıra bir span (JSON Lines), aksi halde
+        chrome://tracing ve Perfetto ile açılabilen Chrome trace biçimi kullanılır.
+
+        Args:
+            profile_file (str): Profil dosyasının yolu.
+
+        Returns:
+            None
+        """
+        with open(profile_file, "w", encoding="utf-8") as f:
+            if profile_file.lower().endswith(".jsonl"):
+                for span in self.spans:
+                    f.write(json.dumps(self._relative(span), ensure_ascii=False, default=str) + "\n")
+            else:
+                json.dump({"traceEvents": [self._trace_event(span) for span in self.spans],
+                           "displayTimeUnit": "ms"}, f, ensure_ascii=False, default=str)
+
+    def _relative(self, span: dict) -> dict:
+        """
+        Span'in başlangıcını kaydedicinin başlangıcına göre mikrosaniye cinsinden ifade eder.
+
+        Args:
+            span (dict): Span kaydı.
+
+        Returns:
+            dict: start_us ve duration_us alanlarını içeren kayıt.
+        """
+        fields = {key: value for key, value in span.items() if key not in ("start_ns", "duration_ns")}
+        return dict(fields, start_us=(span["start_ns"] - self.origin) / 1000, duration_us=span["duration_ns"] / 1000)
+
+    def _trace_event(self, span: dict) -> dict:
+        """
+        Span'i Chrome trace "complete" (ph: X) olayına dönüştürür.
+
+        Args:
+            span (dict): Span kaydı.
+
+        Returns:
+            dict: Trace olayı.
+        """
+        relative = self._relative(span)
+        args = {key: value for key, value in relative.items()
+                if key not in ("name", "pid", "tid", "start_us", "duration_us")}
+        return {"name": span["name"], "ph": "X", "ts": relative["start_us"], "dur": relative["duration_us"],
+                "pid": span["pid"], "tid": span["tid"], "args": args}
+
+def span(name: str, **fields):
+    """
+    Bir aşamayı ölçen bağlam yöneticisi döndürür. Profil kapalıyken paylaşılan boş bir nesne döner;
+    maliyeti tek bir global okumadır.
+
+    Args:
+        name (str): Aşamanın adı (örn. "resize", "encode").
+        **fields: Span'e eklenecek alanlar (örn. version).
+
+    Returns:
+        Bağlam yöneticisi.
+    """
+    if _recorder is None:
+        return _NULL_SPAN
+    return _Span(_recorder, name, fields)
+
+def get_recorder() -> Optional[SpanRecorder]:
+    """
+    Bu süreçteki etkin kaydediciyi döndürür.
+
+    Returns:
+        Optional[SpanRecorder]: Etkin kaydedici; profil kapalıysa None.
+    """
+    return _recorder
+
+def set_recorder(recorder: Optional[SpanRecorder]) -> Optional[SpanRecorder]:
+    """
+    Süreçteki etkin kaydediciyi değiştirir.
+
+    Args:
+        recorder (Optional[SpanRecorder]): Yeni kaydedici; None ise profil kapatılır.
+
+    Returns:
+        Optional[SpanRecorder]: Önceki kaydedici.
+    """
+    global _recorder
+    previous, _recorder = _recorder, recorder
+    return previous
+
+@contextmanager
+def profiling(callback: Callable[[dict], None] = None) -> Iterator[SpanRecorder]:
+    """
+    Blok boyunca span'leri kaydeder. Blok içinde oluşturulan RenderPool'ların işçi süreçlerindeki span'ler de
+    görev tamamlandığında bu kaydediciye aktarılır.
+
+    Args:
+        callback (Callable[[dict], None], optional): Her span tamamlandığında çağrılacak fonksiyon.
+
+    Yields:
+        SpanRecorder: Etkin kaydedici.
+    """
+    recorder = SpanRecorder(callback)
+    previous = set_recorder(recorder)
+    try:
+        yield recorder
+    finally:
+        set_recorder(previous)
+
+@contextmanager
+def job_context(**fields) -> Iterator[None]:
+    """
+    Blok içinde açılan tüm span'lere görev alanları (job, version) ekler. Profil kapalıyken hiçbir şey yapmaz.
+
+    Args:
+        **fields: Eklenecek alanlar.
+
+    Yields:
+        None
+    """
+    if _recorder is None:
+        yield
+        return
+    token = _job_fields.set({**_job_fields.get(), **fields})
+    try:
+        yield
+    finally:
+        _job_fields.reset(token)
+
+@contextmanager
+def profile_to_file(profile_file: Optional[str], stream: TextIO = None) -> Iterator[Optional[SpanRecorder]]:
+    """
+    profile_file verilmişse blok boyunca span'leri kaydeder, blok bitince dosyaya yazar ve aşamaların
+    toplam sürelerini yazdırır. Verilmemişse hiçbir şey yapmaz.
+
+    Args:
+        profile_file (Optional[str]): Profil dosyasının yolu (.jsonl: JSON Lines, diğerleri: Chrome trace).
+        stream (TextIO, optional): Özetin yazılacağı akış; verilmezse standart çıktı. Olaylar standart çıktıya
+            yazılıyorsa JSON satırlarına karışmaması için standart hata verilmelidir.
+
+    Yields:
+        Optional[SpanRecorder]: Etkin kaydedici veya None.
+    """
+    if not profile_file:
+        yield None
+        return
+    with profiling() as recorder:
+        try:
+            yield recorder
+        finally:
+            stream = stream or sys.stdout
+            recorder.write(profile_file)
+            print(f"Profil {profile_file} dosyasına yazıldı ({len(recorder.spans)} span).", file=stream)
+            print(f"{'aşama':<20}{'çağrı':>8}{'toplam (ms)':>14}", file=stream)
+            for name, total in recorder.summary().items():
+                print(f"{name:<20}{total['count']:>8}{total['total_ms']:>14.1f}", file=stream)
@@ -0,0 +1,222 @@
+import json
+import os
+import sys
+import time
+from typing import List, Union
+
+def classify_error(error: Union[Exception, str]) -> str:
+    """
+    Bir hatayı izleme araçlarında gruplanabilecek bir kategoriye ayırır. Kategori mesajın metninden değil
+    hatanın türünden belirlenir: error_helper'daki hatalar kategorilerini taşır, qrcode'un DataOverflowError'ı
+    data_overflow, OSError io sayılır. Yalnızca mesajı bilinen hatalar internal olur.
+
+    Args:
+        error (Union[Exception, str]): Hata veya hata mesajı.
+
+    Returns:
+        str: "data_overflow", "title", "color", "manifest", "archive", "format", "io" veya "internal".
+    """
+    category = getattr(error, "category", None)
+    if category is not None:
+        return category
+    # qrcode yalnızca bu sınıf adı için içe aktarılmaz
+    if type(error).__name__ == "DataOverflowError":
+        return "data_overflow"
+    if isinstance(error, OSError):
+        return "io"
+    return "internal"
+
+class ProgressReporter:
+    """
+    Uzun taramalar ve toplu işlemler için makinece okunabilir ilerleme çıktısı. Her kaydedilen görüntü ve hata
+    için bir olay, belirli aralıklarla da işlem hızı ve tahmini kalan süreyi içeren bir özet JSON Lines olarak
+    yazılır. Olaylar standart çıktıya ("-") yazılıyorsa veya quiet True ise dosya başına yazdırma kapatılır;
+    böylece standart çıktıda yalnızca JSON satırları bulunur.
+
+    Olay türleri:
+        image: version, row (toplu modda), files, bytes, latency_ms (işin gönderilmesinden kaydedilmesine kadar)
+        error: version, row, category, message
+        summary: images, errors, bytes, elapsed_s, images_per_s, mb_per_s, eta_s (toplam biliniyorsa), final
+    """
+    def __init__(self, events_file: str = None, quiet: bool = False, summary_interval: float = 5.0):
+        self.events_file = events_file
+        if events_file == "-":
+            self.stream = sys.stdout
+        elif events_file:
+            events_dir = os.path.dirname(events_file)
+            if events_dir:
+                os.makedirs(events_dir, exist_ok=True)
+            self.stream = open(events_file, "w", encoding="utf-8")
+        else:
+            self.stream = None
+        self.verbose = not quiet and events_file != "-"
+        self.summary_interval = summary_interval
+        self.start = time.perf_counter()
+        self.last_summary = self.start
+        self.images = 0
+        self.errors = 0
+        self.bytes_written = 0
+        self.rows = 0
+        self.total_images = None
+        self.total_rows = None
+        self.closed = False
+
+    def emit(self, event: dict) -> None:
+        """
+        Bir olayı (olay akışı açıksa) JSON satırı olarak yazar.
+
+        Args:
+            event (dict): Olay alanları.
+
+        Returns:
+            None
+        """
+        if self.stream is None:
+            return
+        self.stream.write(json.dumps({"time": round(time.time(), 3), **event}, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def log(self, message: str, error: bool = False) -> None:
+        """
+        İnsan için mesaj yazdırır. Bilgi mesajları sessiz kipte veya olaylar standart çıktıdaysa yazdırılmaz;
+        hata mesajları her zaman yazdırılır, olaylar standart çıktıdaysa standart hataya.
+
+        Args:
+            message (str): Mesaj.
+            error (bool): Mesaj bir hata mesajı mı.
+
+        Returns:
+            None
+        """
+        if error:
+            print(message, file=sys.stderr if self.stream is sys.stdout else sys.stdout)
+        elif self.verbose:
+            print(message)
+
+    def add_total(self, images: int = 0, rows: int = 0) -> None:
+        """
+        Tahmini kalan süre için beklenen görüntü veya satır sayısını artırır.
+
+        Args:
+            images (int): Eklenecek görüntü sayısı.
+            rows (int): Eklenecek satır sayısı (toplu modda kalan süre satırlara göre hesaplanır).
+
+        Returns:
+            None
+        """
+        if images:
+            self.total_images = (self.total_images or 0) + images
+        if rows:
+            self.total_rows = (self.total_rows or 0) + rows
+
+    def image_saved(self, version: int, files: List[str], size: int, submitted_at: float, row: int = None) -> None:
+        """
+        Kaydedilen bir görüntüyü raporlar.
+
+        Args:
+            version (int): QR kod versiyonu.
+            files (List[str]): Kaydedilen ve bağlanan dosyalar (veya arşivdeki adlar).
+            size (int): Yazılan bayt sayısı (bağlantılar hariç).
+            submitted_at (float): İşin havuza gönderildiği an (time.perf_counter).
+            row (int, optional): Toplu modda satır numarası.
+
+        Returns:
+            None
+        """
+        self.images += 1
+        self.bytes_written += size
+        event = {"event": "image", "version": version, "files": len(files), "bytes": size,
+                 "latency_ms": round((time.perf_counter() - submitted_at) * 1000, 3), "output": files[0] if files else None}
+        if row is not None:
+            event["row"] = row
+        self.emit(event)
+        self.maybe_summary()
+
+    def error(self, error: Union[Exception, str], version: int = None, row: int = None,
+              category: str = None) -> None:
+        """
+        Bir hatayı kategorisiyle raporlar.
+
+        Args:
+            error (Union[Exception, str]): Hata veya hata mesajı.
+            version (int, optional): Hatanın oluştuğu versiyon.
+            row (int, optional): Toplu modda satır numarası.
+            category (str, optional): Hata yalnızca mesaj olarak verildiğinde önceden belirlenmiş kategorisi.
+
+        Returns:
+            None
+        """
+        self.errors += 1
+        event = {"event": "error", "category": category or classify_error(error), "message": str(error)}
+        if version is not None:
+            event["version"] = version
+        if row is not None:
+            event["row"] = row
+        self.emit(event)
+        self.maybe_summary()
+
+    def row_done(self) -> None:
+        """
+        Toplu modda bir satırın tamamlandığını kaydeder.
+
+        Returns:
+            None
+        """
+        self.rows += 1
+
+    def maybe_summary(self) -> None:
+        """
+        Son özetten bu yana summary_interval saniye geçtiyse özet olayı yazar.
+
+        Returns:
+            None
+        """
+        now = time.perf_counter()
+        if now - self.last_summary >= self.summary_interval:
+            self.last_summary = now
+            self.emit(self.summary())
+
+    def summary(self, final: bool = False) -> dict:
+        """
+        İşlem hızını ve tahmini kalan süreyi hesaplar.
+
+        Args:
+            final (bool): Çalıştırmanın son özeti mi.
+
+        Returns:
+            dict: summary olayı.
+        """
+        elapsed = time.perf_counter() - self.start
+        event = {"event": "summary", "images": self.images, "errors": self.errors, "bytes": self.bytes_written,
+                 "elapsed_s": round(elapsed, 3),
+                 "images_per_s": round(self.images / elapsed, 3) if elapsed else 0.0,
+                 "mb_per_s": round(self.bytes_written / elapsed / 1e6, 3) if elapsed else 0.0}
+        if self.total_rows:
+            event.update(rows=self.rows, total_rows=self.total_rows)
+            done, total = self.rows, self.total_rows
+        else:
+            done, total = self.images + self.errors, self.total_images
+        if total and done and not final:
+            event["eta_s"] = round(elapsed / done * max(total - done, 0), 3)
+        event["final"] = final
+        return event
+
+    def close(self) -> None:
+        """
+        Son özeti yazar ve olay dosyasını kapatır.
+
+        Returns:
+            None
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.emit(self.summary(final=True))
+        if self.stream is not None and self.stream is not sys.stdout:
+            self.stream.close()
+
+    def __enter__(self) -> "ProgressReporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,17 +1,84 @@
-import qrcode
-from qrcode.image.styledpil import StyledPilImage
-from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
-from qrcode.image.styles.colormasks import SolidFillColorMask
-from PIL import Image, ImageFont
-from .text_helper import wrap_text
-from .image_helper import load_logos, load_font, add_logo_to_qr, resize_qr_image, create_background, paste_logos, draw_title
-from .filesystem_helper import save_qr_image
-from typing import Tuple, List
-from .math_helper import calculate_text_height
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from PIL import Image, ImageFont, __version__ as PILLOW_VERSION
+from .text_helper import TitleLayout, get_title_layout, load_font
+from .image_helper import add_logo_to_qr, resize_qr_image, pad_image_to_size, calculate_background_layout, create_empty_background, paste_logos, draw_title
+from .filesystem_helper import save_qr_image, save_encoded_qr_image, link_qr_image, create_output_directory, encode_qr_image
+from typing import Callable, Dict, List, Optional, Union, Iterator
+from functools import partial
+from .math_helper import calculate_box_size, calculate_dimensions, calculate_max_canvas_bytes
 from .color_helper import get_rgb_from_color_name
+from .error_helper import FormatError, TitleError
+from .render_helper import render_rounded_modules, render_indexed_modules
+from .canvas_helper import resize_compact_image, crop_to_rgb, compose_canvas
+from .asset_helper import SharedAssets, load_shared_assets, get_center_logo_overlay
+from .parallel_helper import RenderPool, cached_result
+from .cache_helper import CacheHit, RenderCache, get_render_cache
+from .encoder_helper import QRSymbol, get_encoder
+from .vector_helper import VectorImage, is_vector_format, create_whatsapp_qr_svg, svg_to_pdf
+from .archive_helper import ArchiveWriter
+from .profile_helper import span, job_context
+from .progress_helper import ProgressReporter
+
+# Oluşturma önbelleği anahtarlarının sürümü; çizim veya kodlama değişirse artırılır, eski girdiler kullanılmaz
+RENDER_CACHE_FORMAT = "render-v1"
+
+@dataclass
+class RenderedVersion:
+    """
+    Bellekte oluşturulmuş tek bir QR kod versiyonu. Görüntü ya da kodlanmış veri (veya ikisi) bulunur.
+
+    Attributes:
+        version (int): Oluşturulan QR kod versiyonu.
+        aliases (List[int]): Veri sığmadığı için aynı QR kodu üreten versiyonlar.
+        output_format (str): Çıktı formatı.
+        image (Optional[Union[Image.Image, VectorImage]]): Oluşturulan görüntü (encode ile istenmişse None).
+        data (Optional[bytes]): Kodlanmış görüntü; ilk encode çağrısında doldurulur.
+        encode_preset (str): Kodlamada kullanılan ön ayar (default, fast, balanced, small).
+        submitted_at (float): Oluşturma işinin havuza gönderildiği an (time.perf_counter); gecikme ölçümü içindir.
+        source_file (Optional[str]): Görüntü oluşturma önbelleğinin disk katmanından geldiyse önbellekteki dosya;
+            data ilk encode çağrısında bu dosyadan okunur.
+        cached (bool): Görüntü oluşturma önbelleğinden mi geldi.
+    """
+    version: int
+    aliases: List[int] = field(default_factory=list)
+    output_format: str = "png"
+    image: Optional[Union[Image.Image, VectorImage]] = None
+    data: Optional[bytes] = None
+    encode_preset: str = "default"
+    submitted_at: float = 0.0
+    source_file: Optional[str] = None
+    cached: bool = False
+
+    def encode(self) -> bytes:
+        """
+        Görüntüyü çıktı formatında kodlar; sonuç saklanır, tekrar kodlanmaz.
+
+        Returns:
+            bytes: Kodlanmış görüntü.
+        """
+        if self.data is None and self.source_file is not None:
+            self.data = CacheHit(path=self.source_file).read()
+        elif self.data is None:
+            self.data = encode_qr_image(self.image, self.output_format, self.encode_preset)
+        return self.data
+
+    def getbuffer(self) -> memoryview:
+        """
+        Kodlanmış görüntüyü kopyalamadan okunabilecek bir bellek görünümü olarak döndürür.
+
+        Returns:
+            memoryview: Kodlanmış görüntünün görünümü.
+        """
+        return memoryview(self.encode())
 def create_qr_code(data: str, version: int, foreground_color: str, background_color: str,
-                   resolution: int, center_logo: str = None, center_logo_size: float = 0.2, 
-                   is_logo_circle: bool = True, border_size: float = 0.0, border_color: str = "white") -> Image.Image:
+                   resolution: int, center_logo: Union[str, Image.Image] = None, center_logo_size: float = 0.2, 
+                   is_logo_circle: bool = True, border_size: float = 0.0, border_color: str = "white",
+                   native_resolution: bool = False, compact: bool = False) -> Image.Image:
     """
     Özelleştirilmiş bir QR kodu oluşturur.
 
@@ -19,23 +86,39 @@ def create_qr_code(data: str, version: int, foreground_color: str, background_co
         data (str): QR kodunda kodlanacak veri.
         version (int): QR kodunun sürümü (1-40 arası).
         resolution (int): Oluşturulacak QR kodunun çözünürlüğü.
-        center_logo (str, optional): Merkeze eklenecek logo dosyasının yolu.
+        center_logo (Union[str, Image.Image], optional): Merkeze eklenecek logo dosyasının yolu ya da önceden yüklenmiş logo.
         center_logo_size (float): Merkez logonun boyutu.
         is_logo_circle (bool): Merkez logonun daire şeklinde olup olmayacağı.
         border_size (float): QR kodunun etrafındaki boş alanın genişliği.
         border_color (str): QR kodunun kenarlık rengi.
+        native_resolution (bool): True ise QR kod doğrudan hedef çözünürlükte çizilir, yeniden boyutlandırılmaz.
+        compact (bool): True ise görüntü RGB yerine P (palet) veya L kipinde, piksel başına 1 baytla döndürülür.
+            Renkli ön/arka plan ile yeniden boyutlandırılan görüntüler ara tonlar palete sığmadığı için RGB kalır.
+            Merkez logo verilirse görüntü RGB'ye çevrilir.
 
     Returns:
         Image.Image: Oluşturulan QR kod görüntüsü.
     """
-    qr_image = generate_qr_image(data, version, foreground_color, background_color)
-    
+    if native_resolution:
+        qr_image = generate_qr_image(data, version, foreground_color, background_color, resolution=resolution,
+                                     compact=compact)
+    else:
+        qr_image = generate_qr_image(data, version, foreground_color, background_color, compact=compact)
+
+    if qr_image.width != resolution:
+        with span("resize"):
+            qr_image = resize_compact_image(qr_image, resolution) if compact else resize_qr_image(qr_image, resolution)
+
+    # Merkez logo, hedef çözünürlükte eklenir; böylece boyutu versiyondan bağımsızdır
     if center_logo:
-        qr_image = add_logo_to_qr(qr_image, center_logo, center_logo_size, is_logo_circle, border_size, border_color)
-    
-    return resize_qr_image(qr_image, resolution)
+        with span("center_logo"):
+            qr_image = add_logo_to_qr(qr_image.convert("RGB"), center_logo, center_logo_size, is_logo_circle,
+                                      border_size, border_color)
+
+    return qr_image
 
-def generate_qr_image(data: str, version: int, background_color: str = "white", foreground_color: str = "black") -> Image.Image:
+def generate_qr_image(data: str, version: int, background_color: str = "white", foreground_color: str = "black",
+                      resolution: int = None, compact: bool = False) -> Image.Image:
     """
     Verilen data, sürüm bilgisi ve renk seçeneklerine göre QR kod görüntüsü oluşturur.
 
@@ -44,59 +127,619 @@ def generate_qr_image(data: str, version: int, background_color: str = "white",
         version (int): QR kodunun sürümü.
         background_color (str): QR kodunun arka plan rengi. Varsayılan değer "white".
         foreground_color (str): QR kodunun ön plan (modül) rengi. Varsayılan değer "black".
+        resolution (int, optional): Verilirse modül boyutu bu genişliğe sığacak en büyük tam sayı olarak seçilir
+            ve görüntü kenarlara eşit boşluk eklenerek tam bu genişliğe tamamlanır. Verilmezse modül boyutu 10 pikseldir.
+        compact (bool): True ise görüntü aynı pikselleri taşıyan P (palet) kipinde oluşturulur.
 
     Returns:
         Image.Image: Oluşturulan temel QR kod görüntüsü.
     """
     # QR kod nesnesini oluştur
-    qr = qrcode.QRCode(version=version, box_size=10, border=4)
-    qr.add_data(data)
-    qr.make(fit=True)
+    with span("encode_modules"):
+        qr = make_qr(data, version)
     
     # Renk isimlerini hex kodlarına dönüştür
     background_color_rgb = get_rgb_from_color_name(background_color)
     foreground_color_rgb = get_rgb_from_color_name(foreground_color)
     
-    # Renkleri ayarlamak için SolidFillColorMask kullanın
-    color_mask = SolidFillColorMask(
-        back_color=foreground_color_rgb,   # Modüllerin rengi
-        front_color=background_color_rgb   # Arka planın rengi
-    )
-    
-    # QR kod görüntüsünü oluştur
-    img = qr.make_image(
-        image_factory=StyledPilImage,
-        module_drawer=RoundedModuleDrawer(),
-        color_mask=color_mask
-    )
+    box_size = qr.box_size
+    if resolution is not None:
+        box_size = calculate_box_size(resolution, qr.modules_count, qr.border)
+
+    # QR kod görüntüsünü oluştur. Sonuç StyledPilImage + RoundedModuleDrawer + SolidFillColorMask ile
+    # piksel piksel aynıdır, ancak modüller tek tek çizilmek yerine NumPy ile döşenir.
+    render_modules = render_indexed_modules if compact else render_rounded_modules
+    with span("draw_modules"):
+        img = render_modules(
+            qr.modules, box_size, qr.border,
+            back_color=foreground_color_rgb,   # SolidFillColorMask'taki back_color ile aynı
+            front_color=background_color_rgb   # SolidFillColorMask'taki front_color ile aynı
+        )
+
+    if resolution is not None and img.width < resolution:
+        # Tam sayı modül boyutundan kalan pikselleri sessiz bölgeye ekle
+        img = pad_image_to_size(img, resolution, foreground_color_rgb)
     return img
 
+def make_qr(data: str, version: int) -> QRSymbol:
+    """
+    Veriyi kodlayıp modül matrisi hazır bir QR kod sembolü oluşturur. Veri her süreçte bir kez segmentlere
+    ayrılır; versiyonlar arasında yalnızca versiyona bağlı adımlar tekrarlanır.
+
+    Args:
+        data (str): QR kodunda kodlanacak veri.
+        version (int): QR kodunun sürümü (veri sığmazsa otomatik büyütülür).
+
+    Returns:
+        QRSymbol: qrcode.QRCode.make(fit=True) ile aynı modül matrisine sahip sembol.
+    """
+    return get_encoder(data).encode(version)
+
+def calculate_min_version(data: str) -> int:
+    """
+    Verinin sığabileceği en küçük QR kod versiyonunu hesaplar. Bundan küçük versiyonlar istendiğinde
+    make(fit=True) bu versiyona yükseltir, yani hepsi aynı QR kodu üretir.
+
+    Args:
+        data (str): QR kodunda kodlanacak veri.
+
+    Returns:
+        int: En küçük uygun versiyon (1-40 arası).
+
+    Raises:
+        qrcode.exceptions.DataOverflowError: Veri en büyük versiyona bile sığmıyorsa.
+    """
+    return get_encoder(data).min_version
+
+def plan_versions(data: str, min_version: int, max_version: int, redundant_versions: str = "link") -> Dict[int, List[int]]:
+    """
+    İstenen versiyon aralığında hangi versiyonların gerçekten oluşturulacağını belirler. Veriyi taşıyamayan
+    versiyonlar en küçük uygun versiyonla aynı QR kodu üreteceğinden ayrıca oluşturulmaz.
+
+    Args:
+        data (str): QR kodunda kodlanacak veri.
+        min_version (int): Minimum QR kod versiyonu.
+        max_version (int): Maksimum QR kod versiyonu.
+        redundant_versions (str): "link" ise gereksiz versiyonlar oluşturulan dosyaya bağlanır, "skip" ise atlanır.
+
+    Returns:
+        Dict[int, List[int]]: Oluşturulacak her versiyon ve ona bağlanacak (aynı QR kodu üreten) versiyonlar.
+            Sözlük versiyon sırasıyla doldurulur.
+    """
+    first_version = calculate_min_version(data)
+    if first_version <= min_version:
+        return {version: [] for version in range(min_version, max_version + 1)}
+
+    # Veri hiçbir istenen versiyona sığmıyorsa tüm aralık tek bir QR kodu üretir
+    representative = min(first_version, max_version)
+    aliases = list(range(min_version, representative)) if redundant_versions == "link" else []
+    plan = {representative: aliases}
+    plan.update({version: [] for version in range(representative + 1, max_version + 1)})
+    return plan
+
+def format_version_plan(plan: Dict[int, List[int]]) -> str:
+    """
+    Oluşturulan ve bağlanan versiyonları kullanıcıya gösterilecek şekilde biçimlendirir.
+
+    Args:
+        plan (Dict[int, List[int]]): plan_versions sonucu.
+
+    Returns:
+        str: Özet metni.
+    """
+    summary = f"Oluşturulan versiyonlar: {', '.join(str(version) for version in plan)}"
+    linked = [version for aliases in plan.values() for version in aliases]
+    if linked:
+        summary += f" (aynı QR kodu ürettiği için bağlanan versiyonlar: {', '.join(str(version) for version in linked)})"
+    return summary
+
+def save_version_outputs(image: Union[Image.Image, VectorImage], output_file: str, version: int,
+                         aliases: List[int], output_format: str, output_dir: str = None,
+                         encode_preset: str = "default", verbose: bool = True, content: bytes = None,
+                         source_file: str = None, cached: bool = False) -> List[str]:
+    """
+    Oluşturulan versiyonu kaydeder ve aynı QR kodu üreten versiyonları bu dosyaya bağlar.
+
+    Args:
+        image (Union[Image.Image, VectorImage]): Kaydedilecek görüntü (content veya source_file verilmişse None).
+        output_file (str): Çıktı dosyasının yolu.
+        version (int): Oluşturulan QR kod versiyonu.
+        aliases (List[int]): Bu dosyaya bağlanacak versiyonlar.
+        output_format (str): Çıktı dosyasının formatı.
+        output_dir (str, optional): Önceden oluşturulmuş çıktı dizini. Verilmezse oluşturulur.
+        encode_preset (str): Kodlama ön ayarı (default, fast, balanced, small).
+        verbose (bool): False ise kaydedilen ve bağlanan dosyalar için mesaj yazdırılmaz.
+        content (bytes, optional): Önceden kodlanmış görüntü; verilirse görüntü yeniden kodlanmadan yazılır.
+        source_file (str, optional): İçeriği aynı olan dosya (oluşturma önbelleğindeki gibi); content verilmezse kopyalanır.
+        cached (bool): Görüntü oluşturma önbelleğinden mi geldi (yalnızca mesaj için).
 
+    Returns:
+        List[str]: Kaydedilen ve bağlanan dosyaların yolları.
 
-def prepare_title_text(title: str, max_width: int, max_height: int, scale_factor: float) -> Tuple[ImageFont.ImageFont, List[str], int]:
+    Raises:
+        ValueError: Görüntü kaydedilemezse.
     """
-    Başlık metnini hazırlar ve sarar.
+    output_dir = output_dir or create_output_directory(output_file)
+    with span("save", version=version, output_format=output_format):
+        if content is not None or source_file is not None:
+            saved_file = save_encoded_qr_image(content, output_file, version, output_format, output_dir,
+                                               source_file, cached, verbose)
+        else:
+            saved_file = save_qr_image(image, output_file, version, output_format, output_dir, encode_preset, verbose)
+    if saved_file is None:
+        raise FormatError(f"QR kod versiyonu {version} '{output_format}' formatında kaydedilemedi.")
+    with span("link", version=version):
+        return [saved_file] + [link_qr_image(saved_file, output_file, alias, output_format, output_dir, verbose)
+                               for alias in aliases]
+
+def prepare_title_text(title: str, max_width: int, max_height: int, scale_factor: float,
+                       font: ImageFont.ImageFont = None) -> TitleLayout:
+    """
+    Başlık metnini hazırlar ve sarar. Aynı başlık, font ve kutu için sonuç önbellekten gelir;
+    böylece versiyonlar ve toplu moddaki satırlar arasında metin yeniden sarılmaz.
 
     Args:
         title (str): Başlık metni.
         max_width (int): Maksimum metin genişliği.
         max_height (int): Maksimum metin yüksekliği.
         scale_factor (float): Ölçeklendirme faktörü.
+        font (ImageFont.ImageFont, optional): Önceden yüklenmiş başlangıç fontu. Verilmezse yüklenir.
+
+    Returns:
+        TitleLayout: Kullanılan font, sarılmış ve ölçülmüş satırlar ve başlık yüksekliği.
+    """
+    if font is None:
+        font = load_font(36, scale_factor)
+    return get_title_layout(title, font, max_width, max_height, scale_factor)
+
+def render_whatsapp_qr(data: str, version: int, title: str, assets: SharedAssets, foreground_color: str = "black",
+                       background_color: str = "white", title_color: str = "black", resolution: int = 1080,
+                       text_scale_factor: float = 1.0, logo_scale_factor: float = 1.0, center_logo_size: float = 0.2,
+                       is_logo_circle: bool = True, border_size: float = 0.0, border_color: str = "white",
+                       native_resolution: bool = False, output_format: str = "png") -> Union[Image.Image, VectorImage]:
+    """
+    Tek bir versiyon için başlıklı ve logolu QR kod görüntüsünü oluşturur.
+
+    Args:
+        data (str): QR kodunda kodlanacak veri.
+        version (int): QR kodunun sürümü.
+        title (str): QR kodunun başlığı.
+        assets (SharedAssets): Önceden yüklenmiş logolar, merkez logo ve font.
+        foreground_color (str): QR kodunun ön plan rengi.
+        background_color (str): QR kodunun arka plan rengi.
+        title_color (str): Başlık rengi.
+        resolution (int): QR kodunun çözünürlüğü (piksel cinsinden).
+        text_scale_factor (float): Metin boyutu için ölçek faktörü.
+        logo_scale_factor (float): Logo boyutu için ölçek faktörü.
+        center_logo_size (float): Merkez logonun boyutu.
+        is_logo_circle (bool): Merkez logonun daire şeklinde olup olmayacağı.
+        border_size (float): Merkez logonun etrafındaki boş alanın genişliği.
+        border_color (str): Merkez logonun kenarlık rengi.
+        native_resolution (bool): True ise QR kod doğrudan hedef çözünürlükte çizilir.
+        output_format (str): Çıktı formatı. svg ve pdf için raster görüntü yerine vektörel belge oluşturulur.
+
+    Returns:
+        Union[Image.Image, VectorImage]: Kaydedilmeye hazır QR kod görüntüsü veya vektörel belge.
+
+    Raises:
+        ValueError: Başlık metni okunamayacak kadar küçükse veya renkler geçersizse.
+    """
+    with job_context(version=version), span("render", output_format=output_format):
+        if is_vector_format(output_format):
+            return render_vector_whatsapp_qr(data, version, title, assets, foreground_color, background_color,
+                                             title_color, resolution, text_scale_factor, logo_scale_factor,
+                                             center_logo_size, is_logo_circle, border_size, border_color,
+                                             output_format)
+        return render_raster_whatsapp_qr(data, version, title, assets, foreground_color, background_color,
+                                         title_color, resolution, text_scale_factor, logo_scale_factor,
+                                         center_logo_size, is_logo_circle, border_size, border_color,
+                                         native_resolution)
+
+def render_raster_whatsapp_qr(data: str, version: int, title: str, assets: SharedAssets, foreground_color: str = "black",
+                              background_color: str = "white", title_color: str = "black", resolution: int = 1080,
+                              text_scale_factor: float = 1.0, logo_scale_factor: float = 1.0,
+                              center_logo_size: float = 0.2, is_logo_circle: bool = True, border_size: float = 0.0,
+                              border_color: str = "white", native_resolution: bool = False) -> Image.Image:
+    """
+    Tek bir versiyon için başlıklı ve logolu QR kodu raster görüntü olarak oluşturur. Renkler 256'ya sığıyorsa
+    görüntü P (palet) kipinde, aksi halde RGB kipinde döner.
+
+    Args:
+        render_whatsapp_qr ile aynı argümanlar (output_format hariç).
+
+    Returns:
+        Image.Image: Kaydedilmeye hazır QR kod görüntüsü.
+
+    Raises:
+        ValueError: Başlık metni okunamayacak kadar küçükse veya renkler geçersizse.
+    """
+    # QR kodunu palet (P) veya L kipinde, piksel başına 1 baytla oluştur
+    qr_img = create_qr_code(data, version, foreground_color, background_color, resolution,
+                            native_resolution=native_resolution, compact=True)
+
+    # Önceden hazırlanmış merkez logo yalnızca kapladığı bölgede tam renge yükseltilir
+    overlay, overlay_position = None, (0, 0)
+    if assets.center_logo is not None:
+        with span("center_logo"):
+            overlay = get_center_logo_overlay(assets, min(qr_img.size), center_logo_size, is_logo_circle,
+                                              border_size, border_color)
+        overlay_position = ((qr_img.width - overlay.width) // 2, (qr_img.height - overlay.height) // 2)
+
+    with span("title_layout"):
+        layout, logo_max_size, spacing = calculate_background_layout(
+            qr_img.width, qr_img.height, title, text_scale_factor, partial(prepare_title_text, font=assets.font))
+
+    if not layout.lines:
+        raise TitleError("Başlık metni çok küçük, okunamaz durumda.")
+
+    # Başlık bandı RGB olarak oluşturulur. Son satırın alt kısmı bandın dışına taşabildiği için
+    # QR kodun üst satırları da banda alınır ve başlık bunların üzerine çizilir.
+    band_height = layout.height + spacing + logo_max_size
+    overflow = min(qr_img.height, sum(layout.font.getmetrics()))
+    band = create_empty_background(background_color, qr_img.width, overflow, layout.height, spacing, logo_max_size)
+    band.paste(crop_to_rgb(qr_img, (0, 0, qr_img.width, overflow), overlay, overlay_position), (0, band_height))
+
+    # Logoları yapıştır
+    if assets.logos:
+        with span("paste_logos"):
+            paste_logos(band, assets.logos, int(50 * logo_scale_factor), int(10 * logo_scale_factor))
+
+    # Başlığı çiz
+    with span("draw_title"):
+        draw_title(band, layout, logo_max_size, spacing, title_color)
+
+    decorations = []
+    if overlay is not None:
+        box = (max(overlay_position[0], 0), max(overlay_position[1], 0),
+               min(overlay_position[0] + overlay.width, qr_img.width),
+               min(overlay_position[1] + overlay.height, qr_img.height))
+        decorations.append((crop_to_rgb(qr_img, box, overlay, overlay_position), (box[0], band_height + box[1])))
+    decorations.append((band, (0, 0)))
+
+    # QR kod alanı, merkez logo ve başlık bandını birleştir; renkler 256'ya sığıyorsa tuval P kipinde kalır
+    with span("compose_canvas"):
+        return compose_canvas(qr_img, band_height, get_rgb_from_color_name(background_color), decorations)
+
+def render_vector_whatsapp_qr(data: str, version: int, title: str, assets: SharedAssets, foreground_color: str = "black",
+                              background_color: str = "white", title_color: str = "black", resolution: int = 1080,
+                              text_scale_factor: float = 1.0, logo_scale_factor: float = 1.0,
+                              center_logo_size: float = 0.2, is_logo_circle: bool = True, border_size: float = 0.0,
+                              border_color: str = "white", output_format: str = "svg") -> VectorImage:
+    """
+    Tek bir versiyon için başlıklı ve logolu QR kodu, raster tuval oluşturmadan SVG veya PDF olarak üretir.
+    Yerleşim raster çıktıyla aynıdır; resolution yalnızca belge birimlerini belirler, çizim maliyeti
+    modül sayısına bağlıdır.
+
+    Args:
+        render_whatsapp_qr ile aynı argümanlar.
+        output_format (str): "svg" veya "pdf".
+
+    Returns:
+        VectorImage: Kaydedilmeye hazır vektörel belge.
+
+    Raises:
+        ValueError: Başlık metni okunamayacak kadar küçükse veya renkler geçersizse.
+    """
+    qr = make_qr(data, version)
+    background_rgb = get_rgb_from_color_name(background_color)
+    foreground_rgb = get_rgb_from_color_name(foreground_color)
+
+    # Başlık yerleşimi create_background ile aynı şekilde hesaplanır
+    margin, max_title_height, spacing, logo_max_size = calculate_dimensions(text_scale_factor, resolution)
+    layout = prepare_title_text(title, resolution - 2 * margin, max_title_height, text_scale_factor, font=assets.font)
+    if not layout.lines:
+        raise TitleError("Başlık metni çok küçük, okunamaz durumda.")
+
+    with span("draw_svg"):
+        svg = create_whatsapp_qr_svg(qr.modules, qr.border, resolution, background_rgb, foreground_rgb,
+                                     layout, logo_max_size, spacing, title_color,
+                                     assets.logos, assets.logo_sources, int(50 * logo_scale_factor),
+                                     int(10 * logo_scale_factor), assets.center_logo, center_logo_size,
+                                     is_logo_circle, border_size, border_color)
+    if output_format.lower() == "pdf":
+        with span("svg_to_pdf"):
+            return VectorImage(svg_to_pdf(svg), "pdf")
+    return VectorImage(svg.encode("utf-8"), "svg")
+
+def encode_whatsapp_qr(data: str, version: int, title: str, assets: SharedAssets, encode_preset: str = "default",
+                       **render_options) -> bytes:
+    """
+    Tek bir versiyonu oluşturur ve çıktı formatında kodlar. İşçi süreçte çalıştırıldığında ana sürece
+    ham piksel yerine yalnızca kodlanmış (çok daha küçük) veri gönderilir.
+
+    Args:
+        data (str): QR kodunda kodlanacak veri.
+        version (int): QR kodunun sürümü.
+        title (str): QR kodunun başlığı.
+        assets (SharedAssets): Önceden yüklenmiş logolar, merkez logo ve font.
+        encode_preset (str): Kodlama ön ayarı (default, fast, balanced, small).
+        **render_options: create_render_options ile oluşturulmuş seçenekler.
+
+    Returns:
+        bytes: Kodlanmış görüntü.
+    """
+    with job_context(version=version):
+        image = render_whatsapp_qr(data, version, title, assets, **render_options)
+        return encode_qr_image(image, render_options.get("output_format", "png"), encode_preset)
+
+def create_render_options(foreground_color: str = "black", background_color: str = "white", title_color: str = "black",
+                          resolution: int = 1080, text_scale_factor: float = 1.0, logo_scale_factor: float = 1.0,
+                          center_logo_size: float = 0.2, is_logo_circle: bool = True, border_size: float = 0.0,
+                          border_color: str = "white", native_resolution: bool = False,
+                          output_format: str = "png") -> dict:
+    """
+    render_whatsapp_qr fonksiyonuna verilecek, versiyondan bağımsız görünüm seçeneklerini bir araya getirir.
+
+    Args:
+        render_whatsapp_qr ile aynı görünüm argümanları.
+
+    Returns:
+        dict: render_whatsapp_qr için anahtar argümanlar.
+    """
+    return dict(foreground_color=foreground_color, background_color=background_color, title_color=title_color,
+                resolution=resolution, text_scale_factor=text_scale_factor, logo_scale_factor=logo_scale_factor,
+                center_logo_size=center_logo_size, is_logo_circle=is_logo_circle, border_size=border_size,
+                border_color=border_color, native_resolution=native_resolution, output_format=output_format.lower())
+
+def iter_version_jobs(data: str, title: str, version_plan: Dict[int, List[int]], render_options: dict, tag=None,
+                      render_function: Callable = render_whatsapp_qr) -> Iterator[tuple]:
+    """
+    Oluşturulacak her versiyon için RenderPool.map_ordered'a verilecek oluşturma görevlerini üretir.
+
+    Args:
+        data (str): QR kodunda kodlanacak veri.
+        title (str): QR kodunun başlığı.
+        version_plan (Dict[int, List[int]]): plan_versions ile belirlenmiş versiyonlar.
+        render_options (dict): create_render_options ile oluşturulmuş seçenekler.
+        tag (optional): Verilirse etiket (tag, version, aliases) olur, verilmezse (version, aliases).
+        render_function (Callable): Görevde çalıştırılacak fonksiyon (render_whatsapp_qr veya encode_whatsapp_qr).
+
+    Yields:
+        tuple: (etiket, fonksiyon, argümanlar, anahtar argümanlar).
+    """
+    for version, aliases in version_plan.items():
+        job_tag = (version, aliases) if tag is None else (tag, version, aliases)
+        yield job_tag, render_function, (data, version, title), render_options
+
+def create_render_cache_key(data: str, version: int, title: str, render_options: dict, encode_preset: str,
+                            assets: SharedAssets) -> Optional[str]:
+    """
+    Bir versiyonun kodlanmış görüntüsünü belirleyen tüm parametrelerin (veri, başlık, versiyon, görünüm
+    seçenekleri, çıktı formatı, kodlama ön ayarı) ve logo dosyalarının içerik özetlerinden oluşturma önbelleği
+    anahtarı üretir. Çıktı yolu, işçi sayısı gibi görüntüyü değiştirmeyen parametreler anahtara girmez.
+
+    Args:
+        data (str): QR kodunda kodlanacak veri.
+        version (int): QR kodunun sürümü.
+        title (str): QR kodunun başlığı.
+        render_options (dict): create_render_options ile oluşturulmuş seçenekler.
+        encode_preset (str): Kodlama ön ayarı.
+        assets (SharedAssets): Logoların içerik özetlerini içeren varlıklar.
 
     Returns:
-        Tuple[ImageFont.ImageFont, List[str], int]: Kullanılan font, sarılmış metin ve başlık yüksekliği.
+        Optional[str]: Onaltılık SHA-256 anahtarı; logoların içerik özeti bilinmiyorsa None.
+    """
+    if len(assets.logo_hashes) != len(assets.logos) or (assets.center_logo is not None and assets.center_logo_hash is None):
+        return None
+    params = {"format": RENDER_CACHE_FORMAT, "pillow": PILLOW_VERSION, "data": data, "version": version,
+              "title": title, "options": render_options, "encode_preset": encode_preset,
+              "logos": assets.logo_hashes, "center_logo": assets.center_logo_hash}
+    return hashlib.sha256(json.dumps(params, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+def iter_cached_jobs(jobs: Iterator[tuple], render_cache: RenderCache, assets: SharedAssets) -> Iterator[tuple]:
+    """
+    encode_whatsapp_qr görevlerinden oluşturma önbelleğinde bulunanları, işçiye gönderilmeyen cached_result
+    görevleriyle değiştirir. Her görevin etiketi (etiket, önbellek anahtarı) olur.
+
+    Args:
+        jobs (Iterator[tuple]): iter_version_jobs ile üretilmiş, encode_preset içeren görevler.
+        render_cache (RenderCache): Oluşturma önbelleği.
+        assets (SharedAssets): Görevlerde kullanılacak varlıklar.
+
+    Yields:
+        tuple: Önbellekte bulunanlar için sonucu CacheHit olan, diğerleri için özgün görevler.
+    """
+    for tag, fn, args, kwargs in jobs:
+        options = dict(kwargs)
+        encode_preset = options.pop("encode_preset", "default")
+        key = create_render_cache_key(*args, options, encode_preset, assets)
+        hit = render_cache.lookup(key) if key is not None else None
+        if hit is not None:
+            yield (tag, key), cached_result, (hit,), {}
+        else:
+            yield (tag, key), fn, args, kwargs
+
+def iter_submission_times(jobs: Iterator[tuple], submitted: deque) -> Iterator[tuple]:
+    """
+    Görevleri olduğu gibi iletir ve her birinin havuza alındığı anı submitted kuyruğuna ekler. map_ordered
+    görevi üretildiği anda gönderdiği ve sonuçları gönderim sırasıyla döndürdüğü için her sonucun gönderim
+    zamanı kuyruğun başındadır.
+
+    Args:
+        jobs (Iterator[tuple]): RenderPool.map_ordered'a verilecek görevler.
+        submitted (deque): Gönderim zamanlarının (time.perf_counter) ekleneceği kuyruk.
+
+    Yields:
+        tuple: Görevler.
     """
-    font = load_font(36, scale_factor)
-    wrapped_text, font = wrap_text(title, font, max_width, max_height, scale_factor)
-    title_height = calculate_text_height(wrapped_text, font)
-    return font, wrapped_text, title_height
+    for job in jobs:
+        submitted.append(time.perf_counter())
+        yield job
+
+def render_whatsapp_qr_versions(data: str, title: str, foreground_color: str = "black", background_color: str = "white",
+                                title_color: str = "black", resolution: int = 1080,
+                                image_files: list = None, output_format: str = "png",
+                                text_scale_factor: float = 1.0, logo_scale_factor: float = 1.0,
+                                min_version: int = 1, max_version: int = 20, center_logo: str = None,
+                                center_logo_size: float = 0.2, is_logo_circle: bool = True, border_size: float = 0.0,
+                                border_color: str = "white", assets: SharedAssets = None, workers: int = 1,
+                                pool: RenderPool = None, asset_cache: str = None, asset_cache_size: int = 256,
+                                native_resolution: bool = False, redundant_versions: str = "link",
+                                encode: bool = False, encode_preset: str = "default",
+                                sink: Callable[[RenderedVersion], None] = None,
+                                shared_memory: bool = False, render_cache: RenderCache = None) -> List[RenderedVersion]:
+    """
+    İstenen tüm versiyonları diske yazmadan bellekte oluşturur. Versiyonlar paralel oluşturulsa bile
+    sonuçlar versiyon sırasıyla döndürülür (veya sink'e verilir).
+
+    Args:
+        generate_whatsapp_qr ile aynı argümanlar (output_file hariç), ek olarak:
+        encode (bool): True ise görüntüler çıktı formatında kodlanır ve yalnızca RenderedVersion.data doldurulur.
+            Paralel çalıştırmada kodlama işçide yapılır, böylece süreçler arasında ham piksel taşınmaz.
+        encode_preset (str): Kodlama ön ayarı (default, fast, balanced, small); encode False ise
+            RenderedVersion.encode çağrıldığında kullanılır.
+        sink (Callable[[RenderedVersion], None], optional): Verilirse her versiyon hazır olduğu anda bu fonksiyona
+            verilir ve sonuçlar biriktirilmez; bellekte yalnızca işlenmekte olan versiyonlar tutulur.
+        shared_memory (bool): True ise, sink verilmişse ve raster görüntüler paralel oluşturuluyorsa görüntüler
+            işçilerden paylaşılan bellek halkası üzerinden kopyalanmadan alınır. Bu durumda sink'e verilen
+            görüntü yalnızca sink çalışırken geçerlidir; saklanacaksa kopyalanmalıdır.
+        render_cache (RenderCache, optional): Verilirse görüntüler her zaman kodlanır; önbellekte bulunan
+            versiyonlar oluşturulmaz (RenderedVersion.cached True olur, disk katmanından gelenlerde source_file
+            doldurulur), yeni oluşturulanlar önbelleğe yazılır.
+
+    Returns:
+        List[RenderedVersion]: Oluşturulan versiyonlar (sink verilmişse boş liste).
+
+    Raises:
+        ValueError: Versiyonlardan biri oluşturulamazsa.
+    """
+    version_plan = plan_versions(data, min_version, max_version, redundant_versions)
+    owns_pool = pool is None
+    if owns_pool:
+        if assets is None:
+            assets = load_shared_assets(image_files, logo_scale_factor, center_logo, text_scale_factor,
+                                        asset_cache, asset_cache_size, is_vector_format(output_format))
+        pool = RenderPool(assets, workers)
+
+    render_options = create_render_options(foreground_color, background_color, title_color, resolution,
+                                           text_scale_factor, logo_scale_factor, center_logo_size,
+                                           is_logo_circle, border_size, border_color, native_resolution,
+                                           output_format)
+    render_function = render_whatsapp_qr
+    encode = encode or render_cache is not None
+    if encode:
+        render_function = encode_whatsapp_qr
+        render_options["encode_preset"] = encode_preset
+    slot_size = 0
+    if shared_memory and sink is not None and not encode and not is_vector_format(output_format):
+        slot_size = calculate_max_canvas_bytes(resolution, text_scale_factor)
+    try:
+        rendered = []
+        submitted = deque()
+        jobs = iter_version_jobs(data, title, version_plan, render_options, render_function=render_function)
+        if render_cache is not None:
+            jobs = iter_cached_jobs(jobs, render_cache, pool.assets)
+        jobs = iter_submission_times(jobs, submitted)
+        for tag, future in pool.map_ordered(jobs, slot_size=slot_size):
+            (version, aliases), cache_key = tag if render_cache is not None else (tag, None)
+            result = future.result()
+            if isinstance(result, CacheHit):
+                rendered_version = RenderedVersion(version, aliases, output_format.lower(), data=result.data,
+                                                   encode_preset=encode_preset, submitted_at=submitted.popleft(),
+                                                   source_file=result.path, cached=True)
+            else:
+                if cache_key is not None:
+                    render_cache.set(cache_key, result)
+                rendered_version = RenderedVersion(version, aliases, output_format.lower(),
+                                                   image=None if encode else result, data=result if encode else None,
+                                                   encode_preset=encode_preset, submitted_at=submitted.popleft())
+            if sink is not None:
+                sink(rendered_version)
+            else:
+                rendered.append(rendered_version)
+        return rendered
+    finally:
+        if owns_pool:
+            pool.close()
+
+def generate_whatsapp_qr(data: str, output_file: str, title: str, foreground_color: str = "black", background_color: str = "white",
+                         title_color: str = "black", resolution: int = 1080,
+                         image_files: list = None, output_format: str = "png",
+                         text_scale_factor: float = 1.0, logo_scale_factor: float = 1.0,
+                         min_version: int = 1, max_version: int = 20, center_logo: str = None, center_logo_size: float = 0.2,
+                         is_logo_circle: bool = True, border_size: float = 0.0, border_color: str = "white",
+                         assets: SharedAssets = None, workers: int = 1, pool: RenderPool = None,
+                         asset_cache: str = None, asset_cache_size: int = 256, native_resolution: bool = False,
+                         redundant_versions: str = "link", archive: ArchiveWriter = None,
+                         encode_preset: str = "default", progress: ProgressReporter = None,
+                         render_cache: RenderCache = None) -> List[str]:
+    """
+    İstenen tüm versiyonları oluşturup kaydeder. Hataları yakalamaz, çağırana iletir.
+    Versiyonlar paralel oluşturulsa bile dosyalar versiyon sırasıyla kaydedilir.
+    Çıktı dizini çalıştırma başına yalnızca bir kez oluşturulur.
+
+    Args:
+        create_whatsapp_qr ile aynı argümanlar, ek olarak:
+        assets (SharedAssets, optional): Önceden yüklenmiş varlıklar. Verilmezse image_files,
+            center_logo ve text_scale_factor kullanılarak bir kez yüklenir.
+        workers (int): Versiyonların dağıtılacağı süreç sayısı (1 ise aynı süreçte sırayla).
+        pool (RenderPool, optional): Kullanılacak hazır havuz. Verilirse assets ve workers yok sayılır.
+        asset_cache (str, optional): Hazırlanmış logoların saklanacağı kalıcı önbellek dizini.
+        asset_cache_size (int): Kalıcı önbelleğin en fazla boyutu (MB).
+        native_resolution (bool): True ise QR kod doğrudan hedef çözünürlükte çizilir.
+        redundant_versions (str): Veriyi taşıyamayan versiyonlar için "link" (bağla) veya "skip" (atla).
+        archive (ArchiveWriter, optional): Verilirse görüntüler ayrı dosyalar yerine bu arşive yazılır;
+            kodlama işçilerde yapılır.
+        encode_preset (str): Kodlama ön ayarı (default, fast, balanced, small).
+        progress (ProgressReporter, optional): Verilirse her kaydedilen görüntü için gecikme ve boyut içeren
+            bir olay yazılır; dosya başına mesajlar progress.verbose'a göre yazdırılır.
+        render_cache (RenderCache, optional): Verilirse daha önce aynı parametrelerle oluşturulmuş versiyonlar
+            yeniden oluşturulmaz; kodlanmış veri yazılır veya diskteki önbellek dosyası çıktıya kopyalanır.
+
+    Returns:
+        List[str]: Kaydedilen ve bağlanan dosyaların yolları (arşive yazılıyorsa arşivdeki adlar).
+
+    Raises:
+        ValueError: Versiyonlardan biri kaydedilemezse veya oluşturulamazsa.
+    """
+    saved_files = []
+    version_plan = {}
+    output_dir = None
+    verbose = progress is None or progress.verbose
+    if progress is not None:
+        progress.add_total(images=len(plan_versions(data, min_version, max_version, redundant_versions)))
+
+    def save(rendered_version: RenderedVersion) -> None:
+        nonlocal output_dir
+        version_plan[rendered_version.version] = rendered_version.aliases
+        if archive is not None:
+            content = rendered_version.encode()
+            files = archive.add(output_file, rendered_version.version, rendered_version.aliases, content,
+                                output_format, data)
+            size = len(content)
+        else:
+            output_dir = output_dir or create_output_directory(output_file)
+            # QR kodunu kaydet, aynı QR kodu üreten versiyonları bağla
+            files = save_version_outputs(rendered_version.image, output_file, rendered_version.version,
+                                         rendered_version.aliases, output_format, output_dir, encode_preset, verbose,
+                                         rendered_version.data, rendered_version.source_file, rendered_version.cached)
+            size = os.path.getsize(files[0])
+        saved_files.extend(files)
+        if progress is not None:
+            progress.image_saved(rendered_version.version, files, size, rendered_version.submitted_at)
+
+    render_whatsapp_qr_versions(data, title, foreground_color, background_color, title_color, resolution,
+                                image_files, output_format, text_scale_factor, logo_scale_factor, min_version,
+                                max_version, center_logo, center_logo_size, is_logo_circle, border_size, border_color,
+                                assets=assets, workers=workers, pool=pool, asset_cache=asset_cache,
+                                asset_cache_size=asset_cache_size, native_resolution=native_resolution,
+                                redundant_versions=redundant_versions, encode=archive is not None,
+                                encode_preset=encode_preset, sink=save, shared_memory=True,
+                                render_cache=render_cache)
+    if verbose:
+        print(format_version_plan(version_plan))
+    return saved_files
 
 def create_whatsapp_qr(data: str, output_file: str, title: str, foreground_color: str = "black", background_color: str = "white",
                        title_color: str = "black", resolution: int = 1080, 
                        image_files: list = None, output_format: str = "png",
                        text_scale_factor: float = 1.0, logo_scale_factor: float = 1.0, 
                        min_version: int = 1, max_version: int = 20, center_logo: str = None, center_logo_size: float = 0.2,
-                       is_logo_circle: bool = True,  border_size: float = 0.0, border_color: str = "white") -> None:
+                       is_logo_circle: bool = True,  border_size: float = 0.0, border_color: str = "white",
+                       workers: int = 1, asset_cache: str = None, asset_cache_size: int = 256,
+                       native_resolution: bool = False, redundant_versions: str = "link", archive_file: str = None,
+                       encode_preset: str = "default", events_file: str = None, quiet: bool = False,
+                       render_cache: str = None, render_cache_size: int = 512, render_cache_age: float = 0) -> None:
     """
     WhatsApp QR kodu oluşturur ve kaydeder.
 
@@ -116,45 +759,58 @@ def create_whatsapp_qr(data: str, output_file: str, title: str, foreground_color
         is_logo_circle (bool): Merkez logonun daire şeklinde olup olmayacağı.
         border_size (float): QR kodunun etrafındaki boş alanın genişliği.
         border_color (str): QR kodunun kenarlık rengi.
+        workers (int): Versiyonların paralel oluşturulacağı süreç sayısı.
+        asset_cache (str): Hazırlanmış logoların saklanacağı kalıcı önbellek dizini (None ise kullanılmaz).
+        asset_cache_size (int): Kalıcı önbelleğin en fazla boyutu (MB).
+        native_resolution (bool): True ise QR kod LANCZOS ile yeniden boyutlandırılmak yerine doğrudan
+            hedef çözünürlükte, tam sayı modül boyutuyla çizilir.
+        redundant_versions (str): Veri sığmadığı için aynı QR kodu üreten versiyonlar oluşturulmaz;
+            "link" ise oluşturulan dosyaya bağlanır, "skip" ise hiç kaydedilmez.
+        archive_file (str): Verilirse tüm versiyonlar ayrı dosyalar yerine bu ZIP/TAR arşivine yazılır.
+        encode_preset (str): Kodlama ön ayarı. "default" Pillow varsayılanlarıdır; "fast" düşük sıkıştırma,
+            "balanced" kayıpsız palet, "small" en yüksek sıkıştırma ve gerekirse 256 renge indirgeme kullanır.
+        events_file (str): Verilirse görüntü, hata ve özet olayları bu dosyaya ("-" ise standart çıktıya)
+            JSON Lines olarak yazılır.
+        quiet (bool): True ise kaydedilen her dosya için mesaj yazdırılmaz.
+        render_cache (str): Verilirse kodlanmış görüntüler tüm parametrelerin özetiyle bu dizinde saklanır;
+            aynı parametrelerle tekrar istenen versiyonlar oluşturulmadan önbellekten alınır.
+        render_cache_size (int): Oluşturma önbelleğinin en fazla boyutu (MB).
+        render_cache_age (float): Önbellek girdilerinin en fazla yaşı (saat); 0 ise sınırsız.
 
     Returns:
         None: Fonksiyon bir değer döndürmez, ancak bir QR kodu dosyası oluşturur.
     """
+    progress = ProgressReporter(events_file, quiet) if events_file or quiet else None
+    log_error = print if progress is None else partial(progress.log, error=True)
     try:
-        for version in range(min_version, max_version + 1):
-            # QR kodunu oluştur
-            qr_img = create_qr_code(data, version, foreground_color, background_color, resolution,
-                                    center_logo, center_logo_size, is_logo_circle, border_size, border_color)
-            
-            # Logoları yükle
-            logos = load_logos(image_files, int(50 * logo_scale_factor))
-            
-            # Arka planı oluştur
-            background, wrapped_text, title_height, logo_max_size, spacing, font = create_background(qr_img, title, background_color, text_scale_factor, prepare_title_text)
-            
-            if not wrapped_text:
-                raise ValueError("Başlık metni çok küçük, okunamaz durumda.")
-            
-            # Logoları yapıştır
-            if logos:
-                paste_logos(background, logos, int(50 * logo_scale_factor), int(10 * logo_scale_factor))
-            
-            # QR kodunu arka plana yapıştır
-            background.paste(qr_img, (0, title_height + spacing + logo_max_size))
-            
-            # Başlığı çiz
-            draw_title(background, wrapped_text, font, logo_max_size, spacing, title_color)
-            
-            # QR kodunu kaydet
-            save_qr_image(background, output_file, version, output_format)
+        archive = ArchiveWriter(archive_file, verbose=progress is None or progress.verbose) if archive_file else None
+        try:
+            generate_whatsapp_qr(data, output_file, title, foreground_color, background_color, title_color, resolution,
+                                 image_files, output_format, text_scale_factor, logo_scale_factor, min_version, max_version,
+                                 center_logo, center_logo_size, is_logo_circle, border_size, border_color, workers=workers,
+                                 asset_cache=asset_cache, asset_cache_size=asset_cache_size,
+                                 native_resolution=native_resolution, redundant_versions=redundant_versions,
+                                 archive=archive, encode_preset=encode_preset, progress=progress,
+                                 render_cache=get_render_cache(render_cache, render_cache_size, render_cache_age)
+                                 if render_cache else None)
+        finally:
+            if archive is not None:
+                archive.close()
     except ValueError as e:
+        if progress is not None:
+            progress.error(e)
         if "invalid width" in str(e):
-            print(f"Hata: Ölçek faktörü çok büyük, geçersiz bir genişliğe neden oluyor.")
-            print("Lütfen daha küçük bir ölçek faktörü deneyin veya çözünürlüğü artırın.")
-        elif "Başlık metni çok küçük" in str(e):
-            print(f"Hata: Metin ölçek faktörü ile başlık metni çok küçük ve okunamaz durumda.")
-            print("Lütfen daha büyük bir metin ölçek faktörü deneyin veya çözünürlüğü artırın.")
+            log_error(f"Hata: Ölçek faktörü çok büyük, geçersiz bir genişliğe neden oluyor.")
+            log_error("Lütfen daha küçük bir ölçek faktörü deneyin veya çözünürlüğü artırın.")
+        elif isinstance(e, TitleError):
+            log_error(f"Hata: Metin ölçek faktörü ile başlık metni çok küçük ve okunamaz durumda.")
+            log_error("Lütfen daha büyük bir metin ölçek faktörü deneyin veya çözünürlüğü artırın.")
         else:
-            print(f"Beklenmeyen bir hata oluştu: {e}")
+            log_error(f"Beklenmeyen bir hata oluştu: {e}")
     except Exception as e:
-        print(f"Beklenmeyen bir hata oluştu: {e}")
\ No newline at end of file
+        if progress is not None:
+            progress.error(e)
+        log_error(f"Beklenmeyen bir hata oluştu: {e}")
+    finally:
+        if progress is not None:
+            progress.close()
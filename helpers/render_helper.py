@@ -0,0 +1,212 @@
+from functools import lru_cache
+from typing import List, Tuple
+import numpy as np
+from PIL import Image, ImageDraw
+
+# qrcode kütüphanesinin RoundedModuleDrawer'ı köşeleri bu katsayıyla büyütülmüş çizip küçültür
+ANTIALIASING_FACTOR = 4
+
+# Döşeme indeksleri: 0 boş modül, 1 göz (tam kare), 2-17 yuvarlatılmış köşe desenleri (2 + 4 bitlik maske)
+EMPTY_TILE = 0
+EYE_TILE = 1
+ROUNDED_TILE_OFFSET = 2
+
+def create_round_corner(corner_width: int, back_color: Tuple[int, int, int]) -> np.ndarray:
+    """
+    RoundedModuleDrawer'ın kuzeybatı yuvarlak köşesini aynı yöntemle (4 kat büyük çizip LANCZOS ile küçülterek) üretir.
+
+    Args:
+        corner_width (int): Köşe karesinin kenar uzunluğu (piksel).
+        back_color (Tuple[int, int, int]): Arka plan rengi.
+
+    Returns:
+        np.ndarray: (corner_width, corner_width, 3) boyutlu köşe döşemesi. Modül rengi siyahtır.
+    """
+    fake_width = corner_width * ANTIALIASING_FACTOR
+    radius = fake_width
+    diameter = radius * 2
+    base = Image.new("RGB", (fake_width, fake_width), back_color)
+    base_draw = ImageDraw.Draw(base)
+    base_draw.ellipse((0, 0, diameter, diameter), fill=(0, 0, 0))
+    base_draw.rectangle((radius, 0, fake_width, fake_width), fill=(0, 0, 0))
+    base_draw.rectangle((0, radius, fake_width, fake_width), fill=(0, 0, 0))
+    return np.asarray(base.resize((corner_width, corner_width), Image.LANCZOS))
+
+def apply_solid_color_mask(pixels: np.ndarray, back_color: Tuple[int, int, int], front_color: Tuple[int, int, int]) -> np.ndarray:
+    """
+    qrcode'un SolidFillColorMask renklendirmesini vektörel olarak uygular. Siyah (modül) ile arka plan arasındaki
+    her pikselin konumu bulunur ve aynı oranla arka plan ile ön plan rengi arasına yerleştirilir.
+
+    Args:
+        pixels (np.ndarray): Siyah modüllerle çizilmiş (..., 3) boyutlu görüntü verisi.
+        back_color (Tuple[int, int, int]): Arka plan rengi.
+        front_color (Tuple[int, int, int]): Modül rengi.
+
+    Returns:
+        np.ndarray: Renklendirilmiş görüntü verisi.
+    """
+    if tuple(back_color) == (255, 255, 255) and tuple(front_color) == (0, 0, 0):
+        # Görüntü zaten siyah-beyaz çizildi, renklendirmeye gerek yok
+        return pixels
+
+    channels = [channel for channel in range(3) if back_color[channel] != 0]
+    if not channels:
+        # Arka plan modül rengiyle aynıysa her piksel arka plan rengini alır
+        return np.broadcast_to(np.array(back_color, dtype=np.uint8), pixels.shape).copy()
+
+    # Kanal kanal oran hesabı ve toplama sırası qrcode'daki Python koduyla aynı tutulur (bit düzeyinde eşit sonuç)
+    norm = None
+    for channel in channels:
+        ratio = (pixels[..., channel].astype(np.float64) - back_color[channel]) / (0 - back_color[channel])
+        norm = ratio if norm is None else norm + ratio
+    norm = norm / len(channels)
+
+    result = np.empty(pixels.shape, dtype=np.float64)
+    for channel in range(3):
+        result[..., channel] = front_color[channel] * norm + back_color[channel] * (1 - norm)
+    return np.clip(np.trunc(result), 0, 255).astype(np.uint8)
+
+@lru_cache(maxsize=64)
+def create_module_tiles(box_size: int, back_color: Tuple[int, int, int], front_color: Tuple[int, int, int]) -> np.ndarray:
+    """
+    Bir modülün alabileceği tüm görünümleri (boş, göz karesi ve 16 yuvarlatılmış köşe deseni) renklendirilmiş
+    olarak bir kez üretir. Aynı kutu boyutu ve renkler için sonuç önbellekten gelir.
+
+    Args:
+        box_size (int): Bir modülün kenar uzunluğu (piksel).
+        back_color (Tuple[int, int, int]): Arka plan rengi.
+        front_color (Tuple[int, int, int]): Modül rengi.
+
+    Returns:
+        np.ndarray: (18, box_size, box_size, 3) boyutlu döşeme dizisi.
+    """
+    # Kutu boyutu tekse uzak yarı bir piksel geniştir; köşeler uzak yarının boyutunda çizilir ve yakın yarıda
+    # iç kenarlarından (dolu taraf) kırpılır, böylece modüller arasında arka plan renginde çizgi kalmaz
+    corner_width = int(box_size / 2)
+    far_width = box_size - corner_width
+    nw_round = create_round_corner(far_width, back_color)
+    near, far = slice(0, corner_width), slice(corner_width, box_size)
+    quadrants = (
+        ((near, near), nw_round[:corner_width, :corner_width]),  # kuzeybatı
+        ((near, far), nw_round[:corner_width, ::-1]),            # kuzeydoğu
+        ((far, far), nw_round[::-1, ::-1]),                      # güneydoğu
+        ((far, near), nw_round[::-1, :corner_width]),            # güneybatı
+    )
+
+    tiles = np.empty((ROUNDED_TILE_OFFSET + 16, box_size, box_size, 3), dtype=np.uint8)
+    tiles[:] = back_color
+    tiles[EYE_TILE] = 0
+    for pattern in range(16):
+        tile = tiles[ROUNDED_TILE_OFFSET + pattern]
+        for bit, (region, corner) in enumerate(quadrants):
+            tile[region] = corner if pattern & (1 << bit) else 0
+
+    return apply_solid_color_mask(tiles, back_color, front_color)
+
+def create_tile_indices(modules: np.ndarray, border: int) -> np.ndarray:
+    """
+    Her modül için komşularına bakarak hangi döşemenin kullanılacağını hesaplar.
+
+    Args:
+        modules (np.ndarray): (n, n) boyutlu bool modül matrisi.
+        border (int): Sessiz bölge genişliği (modül cinsinden).
+
+    Returns:
+        np.ndarray: Sessiz bölge dahil (n + 2*border, n + 2*border) boyutlu döşeme indeksleri.
+    """
+    count = modules.shape[0]
+    padded = np.pad(modules, 1, constant_values=False)
+    north = padded[:-2, 1:-1]
+    south = padded[2:, 1:-1]
+    west = padded[1:-1, :-2]
+    east = padded[1:-1, 2:]
+
+    # Yuvarlatılacak köşeler: iki komşusu da boş olan köşeler
+    pattern = ((~west & ~north).astype(np.uint8)
+               | ((~north & ~east).astype(np.uint8) << 1)
+               | ((~east & ~south).astype(np.uint8) << 2)
+               | ((~south & ~west).astype(np.uint8) << 3))
+    indices = np.where(modules, ROUNDED_TILE_OFFSET + pattern, EMPTY_TILE).astype(np.uint8)
+
+    # Konum işaretleri (gözler) yuvarlatılmadan tam kare çizilir
+    eyes = np.zeros_like(modules)
+    eyes[:7, :7] = True
+    eyes[:7, count - 7:] = True
+    eyes[count - 7:, :7] = True
+    indices[eyes & modules] = EYE_TILE
+
+    return np.pad(indices, border, constant_values=EMPTY_TILE)
+
+def render_rounded_modules(modules: List[List[bool]], box_size: int, border: int,
+                           back_color: Tuple[int, int, int], front_color: Tuple[int, int, int]) -> Image.Image:
+    """
+    Modül matrisinden yuvarlatılmış modüllü QR kod görüntüsünü NumPy ile oluşturur. Sonuç, StyledPilImage +
+    RoundedModuleDrawer + SolidFillColorMask ile piksel piksel aynıdır, ancak modüller tek tek çizilmez:
+    döşemeler bir kez hazırlanır ve komşuluk desenine göre tek seferde yerleştirilir.
+
+    Args:
+        modules (List[List[bool]]): qrcode.QRCode.modules matrisi.
+        box_size (int): Bir modülün kenar uzunluğu (piksel).
+        border (int): Sessiz bölge genişliği (modül cinsinden).
+        back_color (Tuple[int, int, int]): Arka plan rengi.
+        front_color (Tuple[int, int, int]): Modül rengi.
+
+    Returns:
+        Image.Image: RGB QR kod görüntüsü.
+    """
+    indices = create_tile_indices(np.asarray(modules, dtype=bool), border)
+    tiles = create_module_tiles(box_size, tuple(back_color), tuple(front_color))
+    grid = indices.shape[0]
+    pixels = tiles[indices].transpose(0, 2, 1, 3, 4).reshape(grid * box_size, grid * box_size, 3)
+    return Image.fromarray(pixels, "RGB")
+
+@lru_cache(maxsize=64)
+def create_indexed_module_tiles(box_size: int, back_color: Tuple[int, int, int], front_color: Tuple[int, int, int]):
+    """
+    create_module_tiles döşemelerini palet indekslerine çevirir. Döşemelerdeki renkler yalnızca ön plan ile arka plan
+    arasındaki yumuşatılmış köşe tonlarından oluştuğu için genellikle 256'yı aşmaz.
+
+    Args:
+        box_size (int): Bir modülün kenar uzunluğu (piksel).
+        back_color (Tuple[int, int, int]): Arka plan rengi.
+        front_color (Tuple[int, int, int]): Modül rengi.
+
+    Returns:
+        Optional[Tuple[List[int], np.ndarray]]: Düz palet listesi ve (18, box_size, box_size) boyutlu uint8 indeks
+        dizisi; döşemelerde 256'dan fazla renk varsa None.
+    """
+    tiles = create_module_tiles(box_size, back_color, front_color).astype(np.int32)
+    # Renkler 0xRRGGBB anahtarlarına çevrilerek tek boyutta sıralanır
+    keys, indices = np.unique((tiles[..., 0] << 16) | (tiles[..., 1] << 8) | tiles[..., 2], return_inverse=True)
+    if len(keys) > 256:
+        return None
+    palette = np.stack([keys >> 16, (keys >> 8) & 0xFF, keys & 0xFF], axis=1)
+    return palette.flatten().tolist(), indices.reshape(tiles.shape[:3]).astype(np.uint8)
+
+def render_indexed_modules(modules: List[List[bool]], box_size: int, border: int,
+                           back_color: Tuple[int, int, int], front_color: Tuple[int, int, int]) -> Image.Image:
+    """
+    render_rounded_modules ile aynı görüntüyü piksel başına 3 yerine 1 bayt kullanan palet (P) kipinde oluşturur.
+    Palet dönüştürülemeyecek kadar çok renk içeriyorsa RGB görüntü döndürülür.
+
+    Args:
+        modules (List[List[bool]]): qrcode.QRCode.modules matrisi.
+        box_size (int): Bir modülün kenar uzunluğu (piksel).
+        border (int): Sessiz bölge genişliği (modül cinsinden).
+        back_color (Tuple[int, int, int]): Arka plan rengi.
+        front_color (Tuple[int, int, int]): Modül rengi.
+
+    Returns:
+        Image.Image: P (veya gerekirse RGB) kipinde QR kod görüntüsü.
+    """
+    indexed_tiles = create_indexed_module_tiles(box_size, tuple(back_color), tuple(front_color))
+    if indexed_tiles is None:
+        return render_rounded_modules(modules, box_size, border, back_color, front_color)
+
+    palette, tiles = indexed_tiles
+    indices = create_tile_indices(np.asarray(modules, dtype=bool), border)
+    grid = indices.shape[0]
+    pixels = tiles[indices].transpose(0, 2, 1, 3).reshape(grid * box_size, grid * box_size)
+    image = Image.fromarray(pixels, "P")
+    image.putpalette(palette)
+    return image
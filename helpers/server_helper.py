@@ -0,0 +1,482 @@
+import argparse
+import json
+import mimetypes
+import os
+import socketserver
+import stat
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+from .argument_helper import (add_appearance_arguments, add_center_logo_arguments, add_image_arguments,
+                              add_qr_version_arguments, create_argument_parser, is_arguments_valid)
+
+# İsteklerde komut satırı argümanlarına ek olarak kabul edilen, oluşturulacak versiyonu seçen alan
+VERSION_PARAM = "version"
+
+# İstekte dosya yolu alan parametreler; yalnızca sunucunun varlık dizini (asset_root) altındaki dosyaları gösterebilir
+ASSET_PARAMS = ("images", "center_logo")
+
+# İstek gövdesinin en fazla boyutu (bayt)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+class ServerBusyError(Exception):
+    """
+    Çalışan ve kuyrukta bekleyen istek sayısı sınıra ulaştığında fırlatılır.
+    """
+
+def raise_argument_error(message: str) -> None:
+    """
+    argparse'ın süreci sonlandıran hata davranışı yerine ValueError fırlatır.
+
+    Args:
+        message (str): Hata mesajı.
+
+    Raises:
+        ValueError: Her zaman.
+    """
+    raise ValueError(message)
+
+def get_request_param_names() -> set:
+    """
+    İsteklerde kabul edilen parametrelerin adlarını döndürür: veri, görünüm, resim, versiyon ve merkez logo
+    argümanları ile kodlama ön ayarı. Önbellek dizinleri, işçi sayısı ve çıktı yolları gibi sunucuda dosya
+    sistemine dokunan parametreler yalnızca sunucu varsayılanlarıyla verilebilir; logo yolları (ASSET_PARAMS)
+    ise resolve_asset_path ile varlık dizinine sınırlanır.
+
+    Returns:
+        set: Parametre adları.
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    for add_arguments in (add_appearance_arguments, add_image_arguments, add_qr_version_arguments,
+                          add_center_logo_arguments):
+        add_arguments(parser)
+    return {action.dest for action in parser._actions} | {"data", "encode_preset", VERSION_PARAM}
+
+def params_to_argv(params: Dict[str, Any], parser: argparse.ArgumentParser) -> list:
+    """
+    İstek parametrelerini (argüman adı -> değer) create_argument_parser'ın ayrıştıracağı argüman listesine dönüştürür.
+
+    Args:
+        params (Dict[str, Any]): İstek parametreleri. Anahtarlar argümanların uzun adlarıdır (title, resolution vb.).
+        parser (argparse.ArgumentParser): Argüman ayrıştırıcı.
+
+    Returns:
+        list: Komut satırı argümanları. Değerler seçeneğe "=" ile bağlanır ve konumsal argümanlar "--" ardından
+        eklenir; böylece "-" ile başlayan değerler (başlık, veri) seçenek olarak yorumlanmaz.
+
+    Raises:
+        ValueError: Bilinmeyen bir parametre verilirse veya tek değerli bir parametreye liste ya da nesne verilirse.
+    """
+    actions = {action.dest: action for action in parser._actions if action.dest != "help"}
+    unknown = sorted(set(params) - set(actions) - {VERSION_PARAM})
+    if unknown:
+        raise ValueError(f"Bilinmeyen parametreler: {', '.join(unknown)}")
+
+    argv = []
+    positionals = []
+    for dest, value in params.items():
+        action = actions.get(dest)
+        if action is None or value is None:
+            continue
+        if action.nargs != "+" and isinstance(value, (list, dict)):
+            raise ValueError(f"'{dest}' parametresi tek bir değer olmalıdır.")
+        if not action.option_strings:
+            positionals.append(str(value))
+        elif isinstance(action, argparse._StoreTrueAction):
+            if str(value).lower() in ("1", "true", "yes", "on"):
+                argv.append(action.option_strings[-1])
+        elif action.nargs == "+":
+            # Birden çok değer "=" ile verilemez; "-" ile başlayan dosya yolları aynı dosyayı gösteren ./ önekiyle yazılır
+            items = [item for item in (value if isinstance(value, list) else [value]) if item is not None]
+            if not items:
+                continue
+            argv.append(action.option_strings[-1])
+            argv += [os.path.join(os.curdir, item) if item.startswith("-") else item for item in map(str, items)]
+        else:
+            argv.append(f"{action.option_strings[-1]}={value}")
+    return argv + ["--"] + positionals
+
+def resolve_asset_path(path: str, asset_root: str = None) -> str:
+    """
+    İstekteki logo yolunu varlık dizinine göre çözümler. Sembolik bağlantılar da çözümlendikten sonra yol
+    varlık dizininin içinde kalmalıdır; böylece istemciler sunucudaki başka dosyaları okutamaz.
+
+    Args:
+        path (str): İstekteki yol (varlık dizinine göre göreli).
+        asset_root (str, optional): Sunucunun varlık dizini. Verilmemişse istekte logo yolu kabul edilmez.
+
+    Returns:
+        str: Dosyanın mutlak yolu.
+
+    Raises:
+        ValueError: Varlık dizini tanımlanmamışsa veya yol dizinin dışına çıkıyorsa.
+    """
+    if not asset_root:
+        raise ValueError("Sunucuda varlık dizini (--asset_root) tanımlanmadığından istekte logo yolu verilemez.")
+    root = os.path.realpath(os.path.expanduser(asset_root))
+    resolved = os.path.realpath(os.path.join(root, str(path)))
+    if os.path.commonpath([root, resolved]) != root:
+        raise ValueError(f"Logo yolu varlık dizininin dışında: {path}")
+    return resolved
+
+def parse_version(value: Any) -> int:
+    """
+    İstekteki versiyon değerini tam sayıya çevirir. JSON'da tam sayı, sorgu dizesinde rakamlardan oluşan metin
+    kabul edilir; ondalık sayılar sessizce yuvarlanmaz.
+
+    Args:
+        value (Any): İstekteki değer.
+
+    Returns:
+        int: Versiyon.
+
+    Raises:
+        ValueError: Değer bir tam sayı değilse veya 1-40 arasında değilse.
+    """
+    if isinstance(value, str) and value.isdecimal():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError("Versiyon bir tam sayı olmalıdır.")
+    version = int(value)
+    if not 1 <= version <= 40:
+        raise ValueError("Versiyon 1-40 arasında olmalıdır.")
+    return version
+
+def parse_render_request(params: Dict[str, Any], defaults: Dict[str, Any] = None,
+                         asset_root: str = None) -> Dict[str, Any]:
+    """
+    İstek parametrelerini komut satırıyla aynı tür dönüşümleri, varsayılanlar ve geçerlilik denetimleriyle ayrıştırır.
+
+    İstekte yalnızca get_request_param_names ile döndürülen parametreler kabul edilir; önbellek dizinleri gibi
+    diğer ayarlar yalnızca defaults ile verilebilir. İstekteki logo yolları (images, center_logo) asset_root'a
+    göre çözümlenir; defaults içindeki yollar olduğu gibi kullanılır.
+
+    Değeri null (None) olan parametreler verilmemiş sayılır.
+
+    Args:
+        params (Dict[str, Any]): İstek parametreleri.
+        defaults (Dict[str, Any], optional): İstekte verilmeyen parametreler için sunucu varsayılanları.
+        asset_root (str, optional): İstekteki logo yollarının bulunabileceği dizin; verilmezse istekte logo
+            yolu kabul edilmez.
+
+    Returns:
+        Dict[str, Any]: Ayrıştırılmış argümanlar ve oluşturulacak versiyon.
+
+    Raises:
+        ValueError: Parametreler geçersizse, istekte kabul edilmeyen bir parametre verilirse veya logo yolu
+            varlık dizininin dışındaysa.
+    """
+    parser = create_argument_parser()
+    parser.error = raise_argument_error
+    params = {key: value for key, value in params.items() if value is not None}
+    if "data" not in params:
+        raise ValueError("'data' parametresi zorunludur.")
+    rejected = sorted(set(params) - get_request_param_names())
+    if rejected:
+        raise ValueError(f"İstekte kullanılamayan parametreler: {', '.join(rejected)}")
+    for name in ASSET_PARAMS:
+        if name in params:
+            value = params[name]
+            params[name] = ([resolve_asset_path(item, asset_root) for item in value if item is not None]
+                            if isinstance(value, list) else resolve_asset_path(value, asset_root))
+    params = dict(defaults or {}, **params)
+    args = parser.parse_args(params_to_argv(params, parser))
+    is_arguments_valid(args, parser)
+
+    version = parse_version(params.get(VERSION_PARAM, args.min_version))
+    options = vars(args)
+    options[VERSION_PARAM] = version
+    return options
+
+def render_request(options: Dict[str, Any]) -> Tuple[bytes, str]:
+    """
+    Ayrıştırılmış bir isteği tek bir versiyon olarak oluşturur ve diske yazmadan kodlar. İşçi süreçte çalışır;
+    fontlar, hazırlanmış logolar ve renkler süreç içi önbelleklerden gelir, böylece sonraki istekler sıcak başlar.
+    render_cache verilmişse aynı parametrelerle daha önce oluşturulmuş görüntü oluşturma önbelleğinden döndürülür.
+
+    Args:
+        options (Dict[str, Any]): parse_render_request sonucu.
+
+    Returns:
+        Tuple[bytes, str]: Kodlanmış görüntü ve MIME türü.
+
+    Raises:
+        ValueError: Logo dosyaları bulunamazsa veya okunamazsa.
+    """
+    from .asset_helper import load_shared_assets
+    from .filesystem_helper import encode_qr_image
+    from .qr_helper import create_render_options, render_whatsapp_qr
+    from .vector_helper import is_vector_format
+
+    try:
+        assets = load_shared_assets(options["images"], options["logo_scale_factor"], options["center_logo"],
+                                    options["text_scale_factor"], options["asset_cache"], options["asset_cache_size"],
+                                    is_vector_format(options["format"]))
+    except OSError as e:
+        # Eksik veya okunamayan logo istemcinin hatasıdır (400); ValueError işçi süreçten de aynen taşınır
+        raise ValueError(f"Logo dosyası okunamadı: {e}")
+    render_options = create_render_options(options["foreground_color"], options["background_color"],
+                                           options["title_color"], options["resolution"],
+                                           options["text_scale_factor"], options["logo_scale_factor"],
+                                           options["center_logo_size"], options["is_logo_circle"],
+                                           options["border_size"], options["border_color"],
+                                           options["native_resolution"], options["format"])
+    cache = key = None
+    if options.get("render_cache"):
+        from .cache_helper import get_render_cache
+        from .qr_helper import create_render_cache_key
+        cache = get_render_cache(options["render_cache"], options["render_cache_size"], options["render_cache_age"])
+        key = create_render_cache_key(options["data"], options[VERSION_PARAM], options["title"], render_options,
+                                      options["encode_preset"], assets)
+        content = cache.get(key) if key is not None else None
+        if content is not None:
+            return content, get_content_type(options["format"])
+    image = render_whatsapp_qr(options["data"], options[VERSION_PARAM], options["title"], assets, **render_options)
+    content = encode_qr_image(image, options["format"], options["encode_preset"])
+    if key is not None:
+        cache.set(key, content)
+    return content, get_content_type(options["format"])
+
+class RenderService:
+    """
+    İstekleri sınırlı sayıda işçide oluşturan servis. Aynı anda en fazla workers + queue_size istek kabul edilir;
+    fazlası beklemeden ServerBusyError ile reddedilir (geri basınç). İsteklerde logo yolları yalnızca
+    asset_root verilmişse ve bu dizinin içindeyse kabul edilir.
+    """
+    def __init__(self, workers: int = 1, queue_size: int = 16, defaults: Dict[str, Any] = None,
+                 asset_root: str = None):
+        self.workers = max(1, workers)
+        self.defaults = defaults or {}
+        self.asset_root = asset_root
+        self._slots = threading.BoundedSemaphore(self.workers + max(0, queue_size))
+        if self.workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        else:
+            # Tek işçide istekler sunucu sürecinde oluşturulur; önbellekler bu süreçte sıcak kalır
+            self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def submit(self, params: Dict[str, Any]) -> Future:
+        """
+        Bir isteği ayrıştırır ve oluşturulmak üzere kuyruğa ekler.
+
+        Args:
+            params (Dict[str, Any]): İstek parametreleri.
+
+        Returns:
+            Future: Kodlanmış görüntüyü ve MIME türünü taşıyan nesne.
+
+        Raises:
+            ValueError: Parametreler geçersizse.
+            ServerBusyError: Kuyruk doluysa.
+        """
+        options = parse_render_request(params, self.defaults, self.asset_root)
+        if not self._slots.acquire(blocking=False):
+            raise ServerBusyError("Sunucu meşgul, daha sonra tekrar deneyin.")
+        try:
+            future = self.executor.submit(render_request, options)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def close(self) -> None:
+        """
+        İşçileri kapatır.
+
+        Returns:
+            None
+        """
+        self.executor.shutdown(cancel_futures=True)
+
+def get_content_type(output_format: str) -> str:
+    """
+    Çıktı formatının MIME türünü döndürür.
+
+    Args:
+        output_format (str): Çıktı formatı.
+
+    Returns:
+        str: MIME türü (bilinmiyorsa application/octet-stream).
+    """
+    return mimetypes.guess_type(f"karekod.{output_format}")[0] or "application/octet-stream"
+
+def create_request_handler(service: RenderService, timeout: float = 60.0) -> type:
+    """
+    Servisi kullanan HTTP istek işleyici sınıfını oluşturur.
+
+    POST /render: JSON gövdedeki parametrelerle (argümanların uzun adları, ek olarak version) görüntü döndürür.
+    GET /render?data=...&title=...: Aynı parametreleri sorgu dizesinden alır.
+    GET /health: Sunucu ayaktaysa 200 döndürür.
+
+    Args:
+        service (RenderService): İstekleri oluşturacak servis.
+        timeout (float): Bir isteğin en fazla bekleme süresi (saniye).
+
+    Returns:
+        type: BaseHTTPRequestHandler alt sınıfı.
+    """
+    class RenderRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def address_string(self) -> str:
+            # Unix soketlerinde istemci adresi bir (ana makine, port) ikilisi değildir
+            return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            if url.path == "/health":
+                self.send_json(200, {"status": "ok"})
+            elif url.path == "/render":
+                params = {key: values if key == "images" else values[-1]
+                          for key, values in parse_qs(url.query).items()}
+                self.render(params)
+            else:
+                self.send_json(404, {"error": "Bulunamadı."})
+
+        def do_POST(self) -> None:
+            if urlsplit(self.path).path != "/render":
+                self.send_json(404, {"error": "Bulunamadı."})
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            if length > MAX_REQUEST_BYTES:
+                self.send_json(413, {"error": "İstek gövdesi çok büyük."})
+                return
+            try:
+                params = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(params, dict):
+                    raise ValueError("İstek gövdesi bir JSON nesnesi olmalıdır.")
+            except ValueError as e:
+                self.send_json(400, {"error": str(e)})
+                return
+            self.render(params)
+
+        def render(self, params: Dict[str, Any]) -> None:
+            try:
+                future = service.submit(params)
+                data, content_type = future.result(timeout=timeout)
+            except ServerBusyError as e:
+                self.send_json(503, {"error": str(e)}, {"Retry-After": "1"})
+                return
+            except TimeoutError:
+                self.send_json(504, {"error": "İstek zaman aşımına uğradı."})
+                return
+            except ValueError as e:
+                self.send_json(400, {"error": str(e)})
+                return
+            except Exception as e:
+                self.send_json(500, {"error": f"Beklenmeyen bir hata oluştu: {e}"})
+                return
+            self.send_body(200, content_type, data)
+
+        def send_json(self, status: int, payload: dict, headers: Dict[str, str] = None) -> None:
+            self.send_body(status, "application/json; charset=utf-8",
+                           json.dumps(payload, ensure_ascii=False).encode("utf-8"), headers)
+
+        def send_body(self, status: int, content_type: str, body: bytes, headers: Dict[str, str] = None) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(memoryview(body))
+
+    return RenderRequestHandler
+
+def remove_stale_socket(path: str) -> None:
+    """
+    Önceki bir çalıştırmadan kalan Unix soketini siler. Yolda soket dışında bir dosya varsa silinmez.
+
+    Args:
+        path (str): Soketin yolu.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: Yolda Unix soketi olmayan bir dosya veya dizin varsa.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise ValueError(f"{path} bir Unix soketi değil; üzerine yazılmadı. Başka bir soket yolu belirtin.")
+    os.remove(path)
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix soketi üzerinden HTTP sunan, her bağlantıyı ayrı iş parçacığında işleyen sunucu.
+    """
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        remove_stale_socket(self.server_address)
+        super().server_bind()
+
+def create_server(service: RenderService, host: str = "127.0.0.1", port: int = 8080, unix_socket: str = None,
+                  timeout: float = 60.0) -> socketserver.BaseServer:
+    """
+    Verilen servis için TCP veya Unix soketi üzerinden dinleyen HTTP sunucusunu oluşturur.
+
+    Args:
+        service (RenderService): İstekleri oluşturacak servis.
+        host (str): Dinlenecek adres (unix_socket verilirse yok sayılır).
+        port (int): Dinlenecek port (unix_socket verilirse yok sayılır).
+        unix_socket (str, optional): Verilirse bu yoldaki Unix soketi dinlenir.
+        timeout (float): Bir isteğin en fazla bekleme süresi (saniye).
+
+    Returns:
+        socketserver.BaseServer: serve_forever ile çalıştırılmaya hazır sunucu.
+
+    Raises:
+        ValueError: unix_socket yolunda soket olmayan bir dosya varsa.
+    """
+    handler = create_request_handler(service, timeout)
+    if unix_socket:
+        return UnixHTTPServer(unix_socket, handler)
+    return ThreadingHTTPServer((host, port), handler)
+
+def run_server(host: str = "127.0.0.1", port: int = 8080, unix_socket: str = None, workers: int = 1,
+               queue_size: int = 16, timeout: float = 60.0, defaults: Dict[str, Any] = None,
+               asset_root: str = None) -> None:
+    """
+    Oluşturma sunucusunu başlatır ve durdurulana (Ctrl+C) kadar istekleri işler.
+
+    Args:
+        host (str): Dinlenecek adres.
+        port (int): Dinlenecek port.
+        unix_socket (str, optional): Verilirse TCP yerine bu yoldaki Unix soketi dinlenir.
+        workers (int): Oluşturma işçisi sayısı.
+        queue_size (int): İşçiler meşgulken bekletilecek en fazla istek sayısı.
+        timeout (float): Bir isteğin en fazla bekleme süresi (saniye).
+        defaults (Dict[str, Any], optional): İstekte verilmeyen parametreler için varsayılanlar.
+        asset_root (str, optional): İsteklerde verilen logo yollarının bulunabileceği dizin.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: unix_socket yolunda soket olmayan bir dosya varsa.
+    """
+    service = RenderService(workers, queue_size, defaults, asset_root)
+    try:
+        server = create_server(service, host, port, unix_socket, timeout)
+    except BaseException:
+        service.close()
+        raise
+    address = unix_socket or f"http://{host}:{server.server_address[1]}"
+    print(f"Sunucu {address} adresinde dinliyor ({service.workers} işçi, kuyruk {queue_size}).")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if unix_socket:
+            remove_stale_socket(unix_socket)
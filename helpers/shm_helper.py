@@ -0,0 +1,197 @@
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional, Tuple
+from PIL import Image
+from .canvas_helper import STRIP_HEIGHT
+from .profile_helper import span
+
+# Paylaşılan tuvallerde desteklenen kipler ve piksel başına bayt sayıları
+CANVAS_MODES = {"P": 1, "L": 1, "RGB": 3}
+
+# İşçi süreçte bağlanılan son halka; her görevde yeniden bağlanılmaz
+_attached = None
+
+@dataclass
+class SharedCanvas:
+    """
+    Paylaşılan bellek halkasındaki bir yuvaya yazılmış tuvalin tanımı. Süreçler arasında piksel yerine yalnızca
+    bu küçük kayıt taşınır.
+
+    Attributes:
+        slot (int): Halkadaki yuva numarası.
+        mode (str): Görüntü kipi (P, L veya RGB).
+        size (Tuple[int, int]): Görüntünün genişliği ve yüksekliği.
+        palette (Optional[List[int]]): P kipinde düz RGB paleti.
+    """
+    slot: int
+    mode: str
+    size: Tuple[int, int]
+    palette: Optional[List[int]] = None
+
+class SharedCanvasRing:
+    """
+    Önceden ayrılmış, eşit boyutlu yuvalardan oluşan paylaşılan bellek halkası. Halkayı oluşturan süreç
+    yuvaları dağıtır ve geri alır; işçiler tuvali kendilerine verilen yuvaya yazar, yazıcı süreç görüntüyü
+    yuvadan kopyalamadan okur. Toplam bellek slot_count * slot_size ile sınırlıdır.
+    """
+    def __init__(self, slot_count: int, slot_size: int):
+        self.slot_count = slot_count
+        self.slot_size = slot_size
+        self.shm = shared_memory.SharedMemory(create=True, size=slot_count * slot_size)
+        self.free = deque(range(slot_count))
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def acquire(self) -> int:
+        """
+        Boş bir yuva ayırır.
+
+        Returns:
+            int: Yuva numarası.
+
+        Raises:
+            RuntimeError: Boş yuva yoksa.
+        """
+        if not self.free:
+            raise RuntimeError("Paylaşılan bellek halkasında boş yuva yok.")
+        return self.free.popleft()
+
+    def release(self, slot: int) -> None:
+        """
+        Yuvayı yeniden kullanılmak üzere geri verir. Yuvadan okunan görüntüler bundan sonra kullanılmamalıdır.
+
+        Args:
+            slot (int): Yuva numarası.
+
+        Returns:
+            None
+        """
+        self.free.append(slot)
+
+    def view(self, canvas: SharedCanvas) -> Image.Image:
+        """
+        Yuvadaki tuvali kopyalamadan okuyan salt okunur bir görüntü döndürür.
+
+        Args:
+            canvas (SharedCanvas): İşçinin döndürdüğü tuval tanımı.
+
+        Returns:
+            Image.Image: Yuvanın belleğini kullanan görüntü.
+        """
+        offset = canvas.slot * self.slot_size
+        length = canvas.size[0] * canvas.size[1] * CANVAS_MODES[canvas.mode]
+        image = Image.frombuffer(canvas.mode, canvas.size, self.shm.buf[offset:offset + length],
+                                 "raw", canvas.mode, 0, 1)
+        if canvas.palette is not None:
+            image.putpalette(canvas.palette)
+        # Görüntü yaşadıkça bellek eşlemesi de yaşar; close çağrıldıktan sonra kalan görüntüler güvenle okunabilir
+        image._shared_memory = self.shm
+        return image
+
+    def resolve(self, future: Future) -> Future:
+        """
+        İşçiden dönen sonucu, SharedCanvas ise yuvadaki görüntüyle değiştirir. Tuval yuvaya sığmadığı için
+        doğrudan döndürülen görüntüler ve hatalar olduğu gibi iletilir.
+
+        Args:
+            future (Future): İşçi görevinin sonucu.
+
+        Returns:
+            Future: Görüntüyü (veya hatayı) taşıyan tamamlanmış nesne.
+        """
+        resolved = Future()
+        try:
+            result = future.result()
+        except Exception as e:
+            resolved.set_exception(e)
+            return resolved
+        resolved.set_result(self.view(result) if isinstance(result, SharedCanvas) else result)
+        return resolved
+
+    def close(self) -> None:
+        """
+        Halkayı kapatır ve paylaşılan belleği siler. Yuvalardan okunan görüntüler hâlâ kullanılıyorsa eşleme
+        son görüntü bırakılınca kapanır.
+
+        Returns:
+            None
+        """
+        self.shm.unlink()
+        try:
+            self.shm.close()
+        except BufferError:
+            # Görüntüler eşlemeyi kendi tamponları üzerinden canlı tutar ve son görüntüyle birlikte bırakır.
+            # Eşleme nesneden ayrılır; aksi halde SharedMemory.__del__ (örneğin kapanışta bir referans döngüsü
+            # toplanırken) görüntüler hâlâ yaşarken kapatmayı yeniden dener ve BufferError uyarısı yazdırır.
+            self.shm._mmap = None
+
+def attach_ring(name: str) -> shared_memory.SharedMemory:
+    """
+    İşçi süreçte halkaya bağlanır; aynı halka için önceki bağlantı kullanılır.
+
+    Args:
+        name (str): Halkanın paylaşılan bellek adı.
+
+    Returns:
+        shared_memory.SharedMemory: Halkanın belleği.
+    """
+    global _attached
+    if _attached is None or _attached.name != name:
+        if _attached is not None:
+            _attached.close()
+        _attached = shared_memory.SharedMemory(name=name)
+    return _attached
+
+def write_canvas(image: Any, buffer: memoryview, slot: int, slot_size: int) -> Optional[SharedCanvas]:
+    """
+    Görüntünün piksellerini şeritler halinde yuvaya yazar; geçici bellek şerit boyutuyla sınırlı kalır.
+
+    Args:
+        image (Any): Oluşturma görevinin sonucu.
+        buffer (memoryview): Halkanın belleği.
+        slot (int): Yazılacak yuva.
+        slot_size (int): Yuva boyutu (bayt).
+
+    Returns:
+        Optional[SharedCanvas]: Tuval tanımı; sonuç desteklenen kipte bir görüntü değilse veya yuvaya
+        sığmıyorsa None.
+    """
+    if not isinstance(image, Image.Image) or image.mode not in CANVAS_MODES:
+        return None
+    row_bytes = image.width * CANVAS_MODES[image.mode]
+    if row_bytes * image.height > slot_size:
+        return None
+    offset = slot * slot_size
+    for top in range(0, image.height, STRIP_HEIGHT):
+        strip = image.crop((0, top, image.width, min(top + STRIP_HEIGHT, image.height))).tobytes()
+        start = offset + top * row_bytes
+        buffer[start:start + len(strip)] = strip
+    palette = image.getpalette("RGB") if image.mode == "P" else None
+    return SharedCanvas(slot, image.mode, image.size, palette)
+
+def render_to_shared_canvas(fn: Callable, args: tuple, ring_name: str, slot: int, slot_size: int,
+                            assets: Any = None, **kwargs) -> Any:
+    """
+    Oluşturma görevini işçide çalıştırır ve tuvali halkadaki yuvaya yazar. Tuval yuvaya sığmazsa
+    (veya görüntü değilse) sonuç olağan yoldan döndürülür.
+
+    Args:
+        fn (Callable): Modül seviyesinde tanımlı, assets anahtar argümanı alan oluşturma fonksiyonu.
+        args (tuple): Konumsal argümanlar.
+        ring_name (str): Halkanın paylaşılan bellek adı.
+        slot (int): Bu göreve ayrılmış yuva.
+        slot_size (int): Yuva boyutu (bayt).
+        assets (Any): Paylaşılan varlıklar.
+        **kwargs: Anahtar argümanlar.
+
+    Returns:
+        Any: SharedCanvas veya fonksiyonun sonucu.
+    """
+    result = fn(*args, assets=assets, **kwargs)
+    with span("shared_canvas_write", slot=slot):
+        canvas = write_canvas(result, attach_ring(ring_name).buf, slot, slot_size)
+    return result if canvas is None else canvas
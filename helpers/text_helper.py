@@ -1,37 +1,262 @@
-from typing import List, Tuple
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Tuple
 from PIL import ImageFont
-from .image_helper import load_font
-import textwrap
-from .math_helper import calculate_text_height
+import unicodedata
+from .cache_helper import LRUCache
+from .error_helper import TitleError
+
+# Başlıklarda kullanılan emoji kısayol biçimi (:smile: gibi)
+EMOJI_LANGUAGE = "alias"
+
+# Başlık fontu
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+# (dosya yolu, boyut) ile anahtarlanan yüklenmiş fontlar. Font dosyası her boyut için süreç başına bir kez ayrıştırılır.
+_font_cache = LRUCache(128)
+
+# Font başına, grafem kümesi -> ilerleme genişliği sözlükleri. Aynı font boyutu için glifler yalnızca bir kez ölçülür.
+_glyph_advance_cache = LRUCache(128)
+
+# (font, satır) ile anahtarlanan satır ölçüleri. Sığdırma sırasında genişlik doğrulaması ve yükseklik
+# kontrolü aynı satırları ölçtüğünden getbbox her satır için bir kez çağrılır.
+_line_size_cache = LRUCache(4096)
+
+# Önceki karakterle aynı grafem kümesine bağlanan karakterler: birleştirici eklem (ZWJ), varyasyon seçicileri,
+# ten rengi değiştiricileri, tuş kapağı ve bayrak etiketleri
+ZERO_WIDTH_JOINER = "\u200d"
+CLUSTER_EXTENDERS = (("\ufe00", "\ufe0f"), ("\U0001f3fb", "\U0001f3ff"), ("\u20e3", "\u20e3"),
+                     ("\U000e0020", "\U000e007f"))
+REGIONAL_INDICATORS = ("\U0001f1e6", "\U0001f1ff")
+
+# (başlık, font, kutu) ile anahtarlanan hazır başlık yerleşimleri. Başlık, ölçek ve çözünürlük tüm
+# versiyonlarda (ve çoğu zaman toplu moddaki tüm satırlarda) aynı olduğundan sarma bir kez yapılır.
+_title_layout_cache = LRUCache(256)
+
+@dataclass(frozen=True)
+class TitleLayout:
+    """
+    Sarılmış ve ölçülmüş başlık. Önbellekle paylaşıldığı için değiştirilemez.
+
+    Attributes:
+        font (ImageFont.ImageFont): Başlığın sığdığı font.
+        lines (Tuple[str, ...]): Emoji kısayolları genişletilmiş, sarılmış metin satırları
+            (boşsa başlık okunamayacak kadar küçülmüştür).
+        line_sizes (Tuple[Tuple[int, int], ...]): Satırların genişlik ve yükseklikleri.
+        height (int): Başlığın toplam yüksekliği.
+    """
+    font: ImageFont.ImageFont
+    lines: Tuple[str, ...]
+    line_sizes: Tuple[Tuple[int, int], ...]
+    height: int
+
+def load_font(font_size: int, scale_factor: float) -> ImageFont:
+    """
+    Belirtilen boyutta bir font yükler.
+
+    Args:
+        font_size (int): Yüklenecek fontun boyutu.
+        scale_factor (float): Font boyutunu ölçeklendirmek için kullanılacak faktör.
+
+    Returns:
+        ImageFont: Yüklenen font nesnesi.
+
+    Raises:
+        TitleError: Ölçeklenen boyut geçersizse (örn. sıfır).
+    """
+    try:
+        return get_font(FONT_PATH, int(font_size * scale_factor))
+    except IOError:
+        return ImageFont.load_default()
+    except ValueError as e:
+        raise TitleError(f"Başlık fontu yüklenemedi: {e}")
+
+def get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    TrueType fontu önbellekten döndürür; yoksa dosyadan yükler.
+    Dönen font paylaşıldığı için değiştirilmemelidir.
+
+    Args:
+        path (str): Font dosyasının yolu.
+        size (int): Font boyutu.
+
+    Returns:
+        ImageFont.FreeTypeFont: Yüklenmiş font.
+
+    Raises:
+        IOError: Font dosyası açılamazsa.
+    """
+    return _font_cache.get_or_create((path, size), lambda: ImageFont.truetype(path, size))
+
+def get_font_key(font: ImageFont.ImageFont) -> tuple:
+    """
+    Fontu önbellek anahtarında kullanılabilecek şekilde tanımlar.
+
+    Args:
+        font (ImageFont.ImageFont): Font nesnesi.
+
+    Returns:
+        tuple: Font dosyasının yolu ve boyutu (varsayılan font için tür adı).
+    """
+    return getattr(font, "path", type(font).__name__), getattr(font, "size", None)
+
+def get_title_layout(title: str, font: ImageFont.ImageFont, max_width: int, max_height: int,
+                     scale_factor: float) -> TitleLayout:
+    """
+    Başlığın yerleşimini önbellekten döndürür; yoksa metni sarar, ölçer ve önbelleğe ekler.
+    Anahtar başlık, font dosyası ve boyutu, kutu boyutları, ölçek ve emoji biçiminden oluşur.
+
+    Args:
+        title (str): Başlık metni.
+        font (ImageFont.ImageFont): Başlangıç fontu.
+        max_width (int): Metnin sığması gereken maksimum genişlik.
+        max_height (int): Metnin sığması gereken maksimum yükseklik.
+        scale_factor (float): Ölçeklendirme faktörü.
+
+    Returns:
+        TitleLayout: Sarılmış ve ölçülmüş başlık.
+    """
+    key = (title, get_font_key(font), max_width, max_height, scale_factor, EMOJI_LANGUAGE)
+    return _title_layout_cache.get_or_create(
+        key, lambda: create_title_layout(title, font, max_width, max_height, scale_factor))
+
+def create_title_layout(title: str, font: ImageFont.ImageFont, max_width: int, max_height: int,
+                        scale_factor: float) -> TitleLayout:
+    """
+    Başlığın emoji kısayollarını genişletir, sarar ve çizim için gereken satır ölçülerini hesaplar.
+    Sarma ve ölçme çizilecek metin üzerinde yapılır (:smile: yedi karakter değil, tek glif sayılır).
+
+    Args:
+        get_title_layout ile aynı argümanlar.
+
+    Returns:
+        TitleLayout: Sarılmış ve ölçülmüş başlık.
+    """
+    wrapped_text, font = wrap_text(expand_emoji(title), font, max_width, max_height, scale_factor)
+    line_sizes = tuple(measure_line(font, line) for line in wrapped_text)
+    return TitleLayout(font, tuple(wrapped_text), line_sizes, sum(height for _, height in line_sizes))
+
+@lru_cache(maxsize=256)
+def expand_emoji(text: str) -> str:
+    """
+    Metindeki emoji kısayollarını (:smile: gibi) gerçek emoji karakterlerine dönüştürür.
+    emoji paketi (ve kısayol tablosu) yalnızca metinde ':' varsa ilk kullanımda yüklenir.
+
+    Args:
+        text (str): Dönüştürülecek metin.
+
+    Returns:
+        str: Emojileri genişletilmiş metin.
+    """
+    if ":" not in text:
+        return text
+    import emoji
+    return emoji.emojize(text, language=EMOJI_LANGUAGE)
+
+def measure_line(font: ImageFont.ImageFont, line: str) -> Tuple[int, int]:
+    """
+    Bir metin satırının genişliğini ve yüksekliğini hesaplar. Aynı font ve satır için sonuç önbellekten gelir.
+
+    Args:
+        font (ImageFont.ImageFont): Kullanılan font.
+        line (str): Metin satırı.
+
+    Returns:
+        Tuple[int, int]: Satırın genişliği ve yüksekliği.
+    """
+    def measure() -> Tuple[int, int]:
+        left, top, right, bottom = font.getbbox(line)
+        return right - left, bottom - top
+
+    return _line_size_cache.get_or_create((get_font_key(font), line), measure)
+
+def calculate_lines_height(lines: List[str], font: ImageFont.ImageFont) -> int:
+    """
+    Satırların toplam yüksekliğini (math_helper.calculate_text_height ile aynı şekilde) önbellekli ölçülerle hesaplar.
+
+    Args:
+        lines (List[str]): Metin satırları.
+        font (ImageFont.ImageFont): Kullanılan font.
+
+    Returns:
+        int: Toplam yükseklik.
+    """
+    return sum(measure_line(font, line)[1] for line in lines)
+
+def clear_font_cache() -> None:
+    """
+    Yüklenmiş font, glif genişliği ve satır ölçüsü önbelleklerini temizler.
+
+    Returns:
+        None
+    """
+    _font_cache.clear()
+    _glyph_advance_cache.clear()
+    _line_size_cache.clear()
+
+def clear_title_layout_cache() -> None:
+    """
+    Başlık yerleşimi önbelleğini temizler.
+
+    Returns:
+        None
+    """
+    _title_layout_cache.clear()
+
 def wrap_text(title: str, font: ImageFont.ImageFont, max_width: int, max_height: int, scale_factor: float) -> Tuple[List[str], ImageFont.ImageFont]:
     """
     Metni belirli bir genişliğe ve yüksekliğe sığacak şekilde sarar ve gerekirse font boyutunu küçültür.
+    Sığan en büyük font boyutu ikili aramayla bulunur; küçük fontlar daha az satır ve yükseklik
+    gerektirdiğinden sığma koşulu boyuta göre tekdüze kabul edilir.
 
     Args:
         title (str): Sarılacak metin.
         font (ImageFont.ImageFont): Kullanılacak başlangıç fontu.
         max_width (int): Metnin sığması gereken maksimum genişlik.
         max_height (int): Metnin sığması gereken maksimum yükseklik.
-        scale_factor (float): Ölçeklendirme faktörü.
+        scale_factor (float): Ölçeklendirme faktörü (en küçük font boyutunu belirler).
 
     Returns:
         Tuple[List[str], ImageFont.ImageFont]: Sarılmış metin satırları ve kullanılan font.
     """
-    font_size = int(font.size)
     min_font_size = int(8 * scale_factor)
+    candidates = {}
+
+    def try_size(font_size: int) -> bool:
+        size_font = font if font_size == font.size else load_font(font_size, 1)
+        wrapped_text = wrap_text_to_width(title, size_font, max_width)
+        candidates[font_size] = (wrapped_text, size_font)
+        return is_text_height_within_limit(wrapped_text, size_font, max_height)
+
+    # Başlangıç boyutu çoğu zaman sığar; tek denemeyle dön
+    low, high = min_font_size + 1, int(font.size)
+    if high < low:
+        return [], font
+    if try_size(high):
+        return candidates[high]
 
-    while font_size > min_font_size:
-        wrapped_text = wrap_text_to_width(title, font, max_width)
-        if is_text_height_within_limit(wrapped_text, font, max_height):
-            return wrapped_text, font
-        font_size -= 1
-        font = load_font(font_size, scale_factor)
+    # [low, high) aralığında sığan en büyük boyutu ara
+    best = None
+    high -= 1
+    while low <= high:
+        middle = (low + high) // 2
+        if try_size(middle):
+            best = middle
+            low = middle + 1
+        else:
+            high = middle - 1
 
-    return [], font
+    if best is None:
+        return [], load_font(min_font_size, 1)
+    return candidates[best]
 
 def wrap_text_to_width(text: str, font: ImageFont.ImageFont, max_width: int) -> List[str]:
     """
-    Metni belirli bir genişliğe sığacak şekilde sarar.
+    Metni ölçülmüş glif genişliklerine göre belirli bir genişliğe sığacak şekilde sarar.
+    Satırlar boşluklardan bölünür; tek başına sığmayan kelimeler grafem kümesi sınırlarından bölünür,
+    böylece birleşik emojiler parçalanmaz. Her satırın gerçek genişliği max_width'i aşmaz.
 
     Args:
         text (str): Sarılacak metin.
@@ -41,7 +266,95 @@ def wrap_text_to_width(text: str, font: ImageFont.ImageFont, max_width: int) ->
     Returns:
         List[str]: Sarılmış metin satırları.
     """
-    return textwrap.wrap(text, width=int(max_width / (font.size / 2)))
+    clusters = split_graphemes(" ".join(text.split()))
+    advances = get_glyph_advances(font)
+    for cluster in clusters:
+        if cluster not in advances:
+            advances[cluster] = font.getlength(cluster)
+    # offsets[i]: ilk i kümenin toplam genişliği
+    offsets = [0.0] + list(accumulate(advances[cluster] for cluster in clusters))
+    spaces = [index for index, cluster in enumerate(clusters) if cluster == " "]
+
+    lines = []
+    start = 0
+    while start < len(clusters):
+        # Toplam ilerleme genişliğine göre sığan en uzun parça: clusters[start:end]
+        end = max(start + 1, bisect_right(offsets, offsets[start] + max_width) - 1)
+        line, start = break_line(clusters, spaces, start, end, font, max_width)
+        lines.append(line)
+    return lines
+
+def break_line(clusters: Tuple[str, ...], spaces: List[int], start: int, end: int, font: ImageFont.ImageFont,
+               max_width: int) -> Tuple[str, int]:
+    """
+    clusters[start:end] aralığına sığan satırı son boşluktan böler. Kerning ve kenar boşlukları nedeniyle
+    ölçülen genişlik sınırı aşarsa bir önceki bölme noktasına geri çekilir.
+
+    Args:
+        clusters (Tuple[str, ...]): Metnin grafem kümeleri.
+        spaces (List[int]): Boşluk kümelerinin sıralı indeksleri.
+        start (int): Satırın ilk kümesinin indeksi.
+        end (int): İlerleme genişliğine göre sığan aralığın sonu (dahil değil).
+        font (ImageFont.ImageFont): Kullanılan font.
+        max_width (int): Satırın sığması gereken maksimum genişlik.
+
+    Returns:
+        Tuple[str, int]: Satır ve sonraki satırın ilk kümesinin indeksi.
+    """
+    while True:
+        if end >= len(clusters) or clusters[end] == " ":
+            line_end, next_start = end, end + 1
+        else:
+            space = bisect_left(spaces, end) - 1
+            if space >= 0 and spaces[space] > start:
+                line_end, next_start = spaces[space], spaces[space] + 1
+            else:
+                # Kelime tek başına sığmıyor, küme sınırından böl
+                line_end, next_start = end, end
+        line = "".join(clusters[start:line_end])
+        if line_end - start <= 1 or measure_line(font, line)[0] <= max_width:
+            return line, next_start
+        end = line_end - 1
+
+def get_glyph_advances(font: ImageFont.ImageFont) -> Dict[str, float]:
+    """
+    Fonta ait grafem kümesi ilerleme genişliklerinin önbellekteki sözlüğünü döndürür.
+
+    Args:
+        font (ImageFont.ImageFont): Font nesnesi.
+
+    Returns:
+        Dict[str, float]: Küme -> genişlik sözlüğü (çağıran tarafından doldurulur).
+    """
+    return _glyph_advance_cache.get_or_create(get_font_key(font), dict)
+
+@lru_cache(maxsize=256)
+def split_graphemes(text: str) -> Tuple[str, ...]:
+    """
+    Metni kullanıcının tek karakter olarak gördüğü grafem kümelerine ayırır. Birleştirici işaretler,
+    ZWJ ile bağlanan emoji dizileri, varyasyon seçicileri, ten rengi değiştiricileri ve bayrak çiftleri
+    önceki karakterle aynı kümede kalır.
+
+    Args:
+        text (str): Ayrılacak metin.
+
+    Returns:
+        Tuple[str, ...]: Grafem kümeleri.
+    """
+    clusters = []
+    joined = False
+    for char in text:
+        is_regional = REGIONAL_INDICATORS[0] <= char <= REGIONAL_INDICATORS[1]
+        extends = (joined or char == ZERO_WIDTH_JOINER or unicodedata.combining(char)
+                   or any(low <= char <= high for low, high in CLUSTER_EXTENDERS)
+                   or (is_regional and clusters and len(clusters[-1]) == 1
+                       and REGIONAL_INDICATORS[0] <= clusters[-1] <= REGIONAL_INDICATORS[1]))
+        if extends and clusters:
+            clusters[-1] += char
+        else:
+            clusters.append(char)
+        joined = char == ZERO_WIDTH_JOINER
+    return tuple(clusters)
 
 def is_text_height_within_limit(wrapped_text: List[str], font: ImageFont.ImageFont, max_height: int) -> bool:
     """
@@ -55,6 +368,4 @@ def is_text_height_within_limit(wrapped_text: List[str], font: ImageFont.ImageFo
     Returns:
         bool: Metin yüksekliği limiti aşmıyorsa True, aksi halde False.
     """
-    total_height = sum(font.getbbox(line)[3] - font.getbbox(line)[1] for line in wrapped_text)
-    return total_height <= max_height
-
+    return calculate_lines_height(wrapped_text, font) <= max_height
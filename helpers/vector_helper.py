@@ -0,0 +1,267 @@
+import io
+import base64
+from typing import List, Optional, Tuple
+from html import escape
+from PIL import Image
+from .image_helper import (calculate_total_logo_width, calculate_start_position, calculate_logo_position,
+                           calculate_x_position, calculate_start_y)
+from .text_helper import TitleLayout
+
+# Vektörel olarak üretilen çıktı formatları
+VECTOR_FORMATS = ("svg", "pdf")
+
+class VectorImage:
+    """
+    Vektörel (SVG/PDF) olarak oluşturulmuş QR kod. save_qr_image'ın beklediği save arayüzünü sağlar,
+    böylece raster görüntülerle aynı kaydetme yolundan geçer.
+    """
+    def __init__(self, data: bytes, output_format: str):
+        self.data = data
+        self.format = output_format
+
+    def save(self, fp, format: str = None, **kwargs) -> None:
+        """
+        Vektörel veriyi dosyaya veya dosya benzeri nesneye yazar.
+
+        Args:
+            fp: Dosya yolu veya yazılabilir dosya benzeri nesne.
+            format (str, optional): Yok sayılır; veri zaten oluşturulduğu formattadır.
+
+        Returns:
+            None
+        """
+        if hasattr(fp, "write"):
+            fp.write(self.data)
+            return
+        with open(fp, "wb") as f:
+            f.write(self.data)
+
+def is_vector_format(output_format: str) -> bool:
+    """
+    Çıktı formatının vektörel olup olmadığını kontrol eder.
+
+    Args:
+        output_format (str): Çıktı dosyası formatı.
+
+    Returns:
+        bool: svg veya pdf ise True.
+    """
+    return output_format.lower() in VECTOR_FORMATS
+
+def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
+    """
+    RGB değerlerini SVG'de kullanılabilecek hex renk koduna dönüştürür.
+
+    Args:
+        rgb (Tuple[int, int, int]): RGB değerleri.
+
+    Returns:
+        str: #rrggbb biçiminde renk kodu.
+    """
+    return "#{:02x}{:02x}{:02x}".format(*rgb[:3])
+
+def create_module_path(modules: List[List[bool]]) -> str:
+    """
+    Modül matrisini, her satırdaki ardışık koyu modülleri tek bir dikdörtgende birleştiren SVG path verisine dönüştürür.
+    Koordinatlar modül birimindedir; boyut modül sayısına bağlıdır, piksel çözünürlüğüne değil.
+
+    Args:
+        modules (List[List[bool]]): QR kod modül matrisi.
+
+    Returns:
+        str: SVG path "d" özniteliği.
+    """
+    commands = []
+    for y, row in enumerate(modules):
+        x = 0
+        count = len(row)
+        while x < count:
+            if not row[x]:
+                x += 1
+                continue
+            start = x
+            while x < count and row[x]:
+                x += 1
+            commands.append(f"M{start} {y}h{x - start}v1h{start - x}z")
+    return "".join(commands)
+
+def image_to_data_uri(image: Image.Image) -> str:
+    """
+    Raster görüntüyü SVG içine gömülebilecek PNG data URI'ye dönüştürür.
+
+    Args:
+        image (Image.Image): Gömülecek görüntü.
+
+    Returns:
+        str: data:image/png;base64,... biçiminde URI.
+    """
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+def source_to_data_uri(source: Tuple[str, bytes]) -> str:
+    """
+    Logo dosyasının özgün içeriğini data URI'ye dönüştürür (SVG logolar vektörel olarak korunur).
+
+    Args:
+        source (Tuple[str, bytes]): MIME türü ve dosya içeriği.
+
+    Returns:
+        str: data URI.
+    """
+    mime_type, data = source
+    return f"data:{mime_type};base64," + base64.b64encode(data).decode("ascii")
+
+def create_logo_elements(logos: List[Image.Image], logo_sources: List[Optional[Tuple[str, bytes]]],
+                         bg_width: int, logo_max_size: int, logo_spacing: int) -> List[str]:
+    """
+    Başlık logolarını paste_logos ile aynı yerleşimde <image> öğeleri olarak üretir.
+
+    Args:
+        logos (List[Image.Image]): Boyutları yerleşim için kullanılan hazırlanmış logolar.
+        logo_sources (List[Optional[Tuple[str, bytes]]]): Logoların özgün dosya içerikleri (yoksa hazırlanmış logo gömülür).
+        bg_width (int): Tuval genişliği.
+        logo_max_size (int): Logoların maksimum boyutu.
+        logo_spacing (int): Logolar arasındaki boşluk.
+
+    Returns:
+        List[str]: SVG öğeleri.
+    """
+    elements = []
+    start_x = calculate_start_position(bg_width, calculate_total_logo_width(logos, logo_spacing))
+    for index, logo in enumerate(logos):
+        x, y = calculate_logo_position(start_x, logo_max_size, logo.height)
+        source = logo_sources[index] if index < len(logo_sources) else None
+        href = source_to_data_uri(source) if source else image_to_data_uri(logo)
+        elements.append(f'<image x="{x}" y="{y}" width="{logo.width}" height="{logo.height}" '
+                        f'preserveAspectRatio="xMidYMid meet" href="{href}"/>')
+        start_x += logo.width + logo_spacing
+    return elements
+
+def create_title_elements(layout: TitleLayout, bg_width: int, logo_max_size: int, spacing: int,
+                          title_color: str) -> List[str]:
+    """
+    Başlık satırlarını draw_title ile aynı konumlarda seçilebilir <text> öğeleri olarak üretir.
+
+    Args:
+        layout (TitleLayout): Sarılmış ve ölçülmüş başlık.
+        bg_width (int): Tuval genişliği.
+        logo_max_size (int): Logo şeridinin yüksekliği.
+        spacing (int): Logo şeridi ile başlık arasındaki boşluk.
+        title_color (str): Başlık rengi.
+
+    Returns:
+        List[str]: SVG öğeleri.
+    """
+    font = layout.font
+    ascent = font.getmetrics()[0] if hasattr(font, "getmetrics") else 0
+    family = font.getname()[0] if hasattr(font, "getname") else "sans-serif"
+    elements = []
+    y = calculate_start_y(logo_max_size, spacing)
+    for line, (line_width, line_height) in zip(layout.lines, layout.line_sizes):
+        x = calculate_x_position(bg_width, line_width)
+        elements.append(f'<text x="{x}" y="{y + ascent}" font-family="{escape(family)}" font-size="{font.size}" '
+                        f'fill="{escape(title_color)}" xml:space="preserve">{escape(line, quote=False)}</text>')
+        y += line_height
+    return elements
+
+def create_center_logo_elements(center_logo: Image.Image, qr_x: int, qr_y: int, qr_size: int, logo_size: float,
+                                is_circle: bool, border_size: float, border_color: str) -> List[str]:
+    """
+    Merkez logoyu create_center_logo_overlay ile aynı boyut, kenarlık ve daire maskesiyle SVG öğeleri olarak üretir.
+
+    Args:
+        center_logo (Image.Image): Açılmış ve kırpılmış merkez logo.
+        qr_x (int): QR kod alanının sol kenarı.
+        qr_y (int): QR kod alanının üst kenarı.
+        qr_size (int): QR kod alanının kenar uzunluğu.
+        logo_size (float): Logo boyutu (0-1 arasında bir oran).
+        is_circle (bool): Logo daire mi olsun, kare mi.
+        border_size (float): Logo etrafındaki kenarlık boyutu.
+        border_color (str): Logo etrafındaki kenarlık rengi.
+
+    Returns:
+        List[str]: SVG öğeleri.
+    """
+    max_logo_size = int(qr_size * logo_size)
+    ratio = min(max_logo_size / center_logo.width, max_logo_size / center_logo.height)
+    logo_width, logo_height = round(center_logo.width * ratio), round(center_logo.height * ratio)
+    border = int(logo_width * border_size)
+    width, height = logo_width + 2 * border, logo_height + 2 * border
+    x = qr_x + (qr_size - width) // 2
+    y = qr_y + (qr_size - height) // 2
+
+    elements = []
+    clip = ""
+    if is_circle:
+        elements.append(f'<clipPath id="center-logo-clip"><ellipse cx="{x + width / 2}" cy="{y + height / 2}" '
+                        f'rx="{width / 2}" ry="{height / 2}"/></clipPath>')
+        clip = ' clip-path="url(#center-logo-clip)"'
+    elements.append(f'<g{clip}><rect x="{x}" y="{y}" width="{width}" height="{height}" fill="{escape(border_color)}"/>'
+                    f'<image x="{x + border}" y="{y + border}" width="{logo_width}" height="{logo_height}" '
+                    f'href="{image_to_data_uri(center_logo)}"/></g>')
+    return elements
+
+def create_whatsapp_qr_svg(modules: List[List[bool]], border: int, resolution: int,
+                           background_rgb: Tuple[int, int, int], foreground_rgb: Tuple[int, int, int],
+                           layout: TitleLayout, logo_max_size: int, spacing: int, title_color: str,
+                           logos: List[Image.Image], logo_sources: List[Optional[Tuple[str, bytes]]],
+                           header_logo_size: int, header_logo_spacing: int,
+                           center_logo: Optional[Image.Image] = None, center_logo_size: float = 0.2,
+                           is_logo_circle: bool = True, border_size: float = 0.0, border_color: str = "white") -> str:
+    """
+    Başlıklı ve logolu QR kodun raster çıktıyla aynı yerleşime sahip SVG belgesini oluşturur.
+
+    Args:
+        modules (List[List[bool]]): QR kod modül matrisi.
+        border (int): Sessiz bölge genişliği (modül cinsinden).
+        resolution (int): Belgenin genişliği ve QR kod alanının kenar uzunluğu.
+        background_rgb (Tuple[int, int, int]): Arka plan rengi.
+        foreground_rgb (Tuple[int, int, int]): Modül rengi.
+        layout (TitleLayout): Sarılmış ve ölçülmüş başlık.
+        logo_max_size (int): Logo şeridinin yüksekliği.
+        spacing (int): Logo şeridi ile başlık arasındaki boşluk.
+        title_color (str): Başlık rengi.
+        logos (List[Image.Image]): Hazırlanmış başlık logoları.
+        logo_sources (List[Optional[Tuple[str, bytes]]]): Başlık logolarının özgün dosya içerikleri.
+        header_logo_size (int): Başlık logolarının maksimum boyutu.
+        header_logo_spacing (int): Başlık logoları arasındaki boşluk.
+        center_logo (Optional[Image.Image]): Kırpılmış merkez logo.
+        center_logo_size (float): Merkez logonun boyutu.
+        is_logo_circle (bool): Merkez logonun daire şeklinde olup olmayacağı.
+        border_size (float): Merkez logonun kenarlık boyutu.
+        border_color (str): Merkez logonun kenarlık rengi.
+
+    Returns:
+        str: SVG belgesi.
+    """
+    qr_y = layout.height + spacing + logo_max_size
+    height = qr_y + resolution
+    module_size = resolution / (len(modules) + 2 * border)
+
+    elements = [f'<rect width="{resolution}" height="{height}" fill="{rgb_to_hex(background_rgb)}"/>']
+    elements += create_logo_elements(logos, logo_sources, resolution, header_logo_size, header_logo_spacing)
+    elements += create_title_elements(layout, resolution, logo_max_size, spacing, title_color)
+    elements.append(f'<path transform="translate(0 {qr_y}) scale({module_size:.6f}) translate({border} {border})" '
+                    f'fill="{rgb_to_hex(foreground_rgb)}" shape-rendering="crispEdges" d="{create_module_path(modules)}"/>')
+    if center_logo is not None:
+        elements += create_center_logo_elements(center_logo, 0, qr_y, resolution, center_logo_size,
+                                                is_logo_circle, border_size, border_color)
+
+    return (f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{resolution}" height="{height}" viewBox="0 0 {resolution} {height}">\n'
+            + "\n".join(elements) + "\n</svg>\n")
+
+def svg_to_pdf(svg: str) -> bytes:
+    """
+    SVG belgesini PDF'e dönüştürür.
+
+    Args:
+        svg (str): SVG belgesi.
+
+    Returns:
+        bytes: PDF içeriği.
+    """
+    import cairosvg
+    return cairosvg.svg2pdf(bytestring=svg.encode("utf-8"))
@@ -1,13 +1,18 @@
-import argparse
-from helpers import create_whatsapp_qr
-from helpers.argument_helper import create_argument_parser, is_arguments_valid
-def main() -> None:
+import sys
+from helpers.argument_helper import create_argument_parser, create_batch_argument_parser, create_server_argument_parser, is_arguments_valid, is_server_arguments_valid
+def main() -> int:
     """
     WhatsApp tarzı QR kod oluşturucu için komut satırı arayüzü.
+    İlk argüman "batch" ise manifest dosyasından toplu üretim yapılır, "serve" ise oluşturma sunucusu başlatılır.
 
     Returns:
-        None
+        int: Çıkış kodu (başarılıysa 0)
     """
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        return batch_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        return serve_main(sys.argv[2:])
+
     parser = create_argument_parser() # argüman ayrıştırıcıyı oluştur
 
     args = parser.parse_args() # argümanları ayrıştır
@@ -15,11 +20,82 @@ def main() -> None:
     if not is_arguments_valid(args, parser): # argümanların geçerliliğini kontrol et
         return 1 # geçersiz argümanlar varsa hata kodu döndür
 
-    create_whatsapp_qr(args.data, args.output, args.title, args.foreground_color, args.background_color,
-                    args.title_color, args.resolution, args.images, args.format,
-                    args.text_scale_factor, args.logo_scale_factor, args.min_version, args.max_version,
-                    args.center_logo, args.center_logo_size, args.is_logo_circle, args.border_size, args.border_color)
+    # Oluşturma yığını (Pillow, numpy, qrcode) argümanlar doğrulandıktan sonra yüklenir
+    from helpers.qr_helper import create_whatsapp_qr
+    from helpers.profile_helper import profile_to_file
+    # Olaylar standart çıktıdaysa profil özeti JSON satırlarına karışmasın diye standart hataya yazılır
+    with profile_to_file(args.profile, sys.stderr if args.events == "-" else None):
+        create_whatsapp_qr(args.data, args.output, args.title, args.foreground_color, args.background_color,
+                        args.title_color, args.resolution, args.images, args.format,
+                        args.text_scale_factor, args.logo_scale_factor, args.min_version, args.max_version,
+                        args.center_logo, args.center_logo_size, args.is_logo_circle, args.border_size, args.border_color,
+                        args.workers, args.asset_cache, args.asset_cache_size, args.native_resolution,
+                        args.redundant_versions, args.archive, args.encode_preset, args.events, args.quiet,
+                        args.render_cache, args.render_cache_size, args.render_cache_age)
+    return 0
 
-if __name__ == "__main__":
-    main()
+def batch_main(argv: list) -> int:
+    """
+    Toplu mod için komut satırı arayüzü.
+
+    Args:
+        argv (list): "batch" alt komutundan sonraki argümanlar
+
+    Returns:
+        int: Çıkış kodu (tüm satırlar başarılıysa 0, aksi halde 1)
+    """
+    parser = create_batch_argument_parser()
+    args = parser.parse_args(argv)
+
+    if not is_arguments_valid(args, parser):
+        return 1
+
+    from helpers.batch_helper import create_whatsapp_qr_batch, print_batch_report
+    from helpers.profile_helper import profile_to_file
+    # Olaylar standart çıktıdaysa profil özeti JSON satırlarına karışmasın diye standart hataya yazılır
+    with profile_to_file(args.profile, sys.stderr if args.events == "-" else None):
+        results = create_whatsapp_qr_batch(args.manifest, args.output, args.title, args.foreground_color, args.background_color,
+                                           args.title_color, args.resolution, args.images, args.format,
+                                           args.text_scale_factor, args.logo_scale_factor, args.min_version, args.max_version,
+                                           args.center_logo, args.center_logo_size, args.is_logo_circle, args.border_size, args.border_color,
+                                           args.workers, args.asset_cache, args.asset_cache_size, args.native_resolution,
+                                           args.redundant_versions, args.archive, args.encode_preset,
+                                           args.events, args.quiet, args.render_cache, args.render_cache_size,
+                                           args.render_cache_age)
+    if args.events != "-":
+        print_batch_report(results, failures_only=args.quiet)
+    return 0 if all(result.success for result in results) else 1
 
+def serve_main(argv: list) -> int:
+    """
+    Sunucu modu için komut satırı arayüzü.
+
+    Args:
+        argv (list): "serve" alt komutundan sonraki argümanlar
+
+    Returns:
+        int: Çıkış kodu (sunucu durdurulduğunda 0)
+    """
+    parser = create_server_argument_parser()
+    args = parser.parse_args(argv)
+
+    if not is_server_arguments_valid(args, parser):
+        return 1
+
+    from helpers.server_helper import run_server
+    defaults = {"encode_preset": args.encode_preset}
+    if args.asset_cache:
+        defaults.update(asset_cache=args.asset_cache, asset_cache_size=args.asset_cache_size)
+    if args.render_cache:
+        defaults.update(render_cache=args.render_cache, render_cache_size=args.render_cache_size,
+                        render_cache_age=args.render_cache_age)
+    try:
+        run_server(args.host, args.port, args.unix_socket, args.workers, args.queue_size, args.request_timeout, defaults,
+                   args.asset_root)
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
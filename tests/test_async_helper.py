@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+from PIL import Image
+from helpers.async_helper import AsyncRenderer
+from helpers.server_helper import parse_render_request, render_request
+
+class AsyncRendererTest(unittest.IsolatedAsyncioTestCase):
+    async def test_render_qr_accepts_dash_prefixed_values(self):
+        async with AsyncRenderer() as renderer:
+            content = await renderer.render_qr("-x", title="-Menü-", resolution=300)
+        options = parse_render_request({"data": "-x", "title": "-Menü-", "resolution": 300})
+        self.assertEqual(options["data"], "-x")
+        self.assertEqual(options["title"], "-Menü-")
+        self.assertEqual(content, render_request(options)[0])
+
+    async def test_render_versions_accepts_dash_prefixed_title(self):
+        async with AsyncRenderer(workers=2) as renderer:
+            versions = [rendered.version async for rendered in
+                        renderer.render_versions("https://example.com", title="--help", max_version=2,
+                                                 resolution=300)]
+        self.assertEqual(sorted(versions), [2])
+
+    async def test_cache_directories_are_rejected_in_params(self):
+        async with AsyncRenderer() as renderer:
+            for param in ("asset_cache", "render_cache"):
+                with self.assertRaises(ValueError):
+                    await renderer.render_qr("https://example.com", **{param: "/tmp/karekod"})
+
+    async def test_logo_paths_are_confined_to_asset_root(self):
+        with tempfile.TemporaryDirectory() as asset_root:
+            Image.new("RGB", (64, 64), "red").save(os.path.join(asset_root, "logo.png"))
+            async with AsyncRenderer(asset_root=asset_root) as renderer:
+                self.assertTrue(await renderer.render_qr("https://example.com", images=["logo.png"], resolution=300))
+                for path in ("../logo.png", "/etc/hostname"):
+                    with self.assertRaises(ValueError):
+                        await renderer.render_qr("https://example.com", images=[path])
+        async with AsyncRenderer() as renderer:
+            with self.assertRaises(ValueError):
+                await renderer.render_qr("https://example.com", center_logo="logo.png")
+
+if __name__ == "__main__":
+    unittest.main()